@@ -0,0 +1,64 @@
+# merge_decks.py in benchmarks directory
+#
+# Times PyPPT.merge on image-heavy decks of growing count, to check that the
+# merge time grows linearly with the number of slides and images merged.
+#
+# Usage (from the repository root):
+#     python benchmarks/merge_decks.py [--decks 10 20 40] [--slides 10] [--images 4]
+
+import argparse
+import io
+import os
+import sys
+import time
+import zipfile
+
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pypptx import PyPPT  # noqa: E402
+
+
+def png_bytes(n):
+    """A small PNG whose color encodes `n`, so every image is distinct."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16), (n % 256, n // 256 % 256, 128)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def build_deck(deck_index, n_slides, n_images):
+    """Builds a deck whose slides each carry `n_images` distinct pictures."""
+    ppt = PyPPT()
+    for i in range(n_slides):
+        slide = ppt.add_slide(layout_ref=5)
+        slide.set_title(f"Deck {deck_index}, slide {i}")
+        for k in range(n_images):
+            slide.add_picture(png_bytes((deck_index * n_slides + i) * n_images + k), 0.5 + 2 * k, 2, width=1.5)
+    return ppt.to_bytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyPPT.merge time against the number of merged decks.")
+    parser.add_argument("--decks", type=int, nargs="+", default=[10, 20, 40], help="deck counts to merge")
+    parser.add_argument("--slides", type=int, default=10, help="slides per deck")
+    parser.add_argument("--images", type=int, default=4, help="distinct pictures per slide")
+    args = parser.parse_args()
+
+    for n_decks in args.decks:
+        sources = [build_deck(d, args.slides, args.images) for d in range(n_decks)]
+        target = PyPPT()
+        start = time.perf_counter()
+        target.merge(io.BytesIO(source) for source in sources)
+        elapsed = time.perf_counter() - start
+
+        with zipfile.ZipFile(io.BytesIO(target.to_bytes())) as package_zip:
+            names = package_zip.namelist()
+        assert len(names) == len(set(names)), "duplicate zip entries"
+        images = sum(name.startswith("ppt/media/") for name in names)
+        print(f"{n_decks:4d} decks, {n_decks * args.slides:5d} slides, {images:5d} images: "
+              f"{elapsed:6.2f} s ({1000 * elapsed / (n_decks * args.slides):.1f} ms per slide)")
+
+
+if __name__ == "__main__":
+    main()
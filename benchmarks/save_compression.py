@@ -0,0 +1,91 @@
+# save_compression.py in benchmarks directory
+#
+# Compares save time and file size of the zip compression settings accepted by
+# PyPPT.save / PyPPT.to_bytes and PyWorkbook.save / PyWorkbook.to_bytes, on a
+# deck and a workbook shaped like our typical reports.
+#
+# Usage (from the repository root):
+#     python benchmarks/save_compression.py [--slides 40] [--rows 5000] [--repeat 5]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pypptx import PyPPT, XL_CHART_TYPE  # noqa: E402
+from pyxlsx import PyWorkbook  # noqa: E402
+
+SETTINGS = [
+    ("stored", None),
+    ("deflate", 1),
+    ("deflate", None),
+    ("deflate", 9),
+]
+
+
+def build_deck(n_slides):
+    """Builds a deck alternating table slides and chart slides."""
+    rng = np.random.default_rng(0)
+    ppt = PyPPT()
+    for i in range(n_slides):
+        slide = ppt.add_slide(layout_ref=5)
+        slide.set_title(f"Section {i}")
+        if i % 2:
+            frame = pd.DataFrame(rng.normal(size=(15, 6)).round(2), columns=list("ABCDEF"))
+            slide.add_table_from_dataframe(frame, 0.5, 1.5, 9, 5)
+        else:
+            categories = [f"Q{q}" for q in range(1, 13)]
+            series = [{"name": f"S{s}", "values": rng.integers(0, 100, 12).tolist()} for s in range(4)]
+            slide.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, {"categories": categories, "series": series},
+                            0.5, 1.5, 9, 5, chart_title="Quarterly")
+    return ppt
+
+
+def build_workbook(n_rows):
+    """Builds a workbook with one data sheet of `n_rows` rows."""
+    rng = np.random.default_rng(0)
+    wb = PyWorkbook()
+    ws = wb.add_worksheet(title="Data")
+    frame = pd.DataFrame(rng.normal(size=(n_rows, 8)).round(3), columns=[f"c{i}" for i in range(8)])
+    ws.write_dataframe(frame, start_row=1, start_col=1, header=True)
+    return wb
+
+
+def measure(to_bytes, repeat):
+    """Returns (best save time in ms, size in KiB) for each setting."""
+    results = []
+    for compression, level in SETTINGS:
+        best, size = float("inf"), 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            size = len(to_bytes(compression=compression, compresslevel=level))
+            best = min(best, time.perf_counter() - start)
+        results.append((compression, level, best * 1000, size / 1024))
+    return results
+
+
+def report(title, results):
+    print(title)
+    print(f"  {'compression':<12}{'level':>7}{'save ms':>10}{'size KiB':>11}")
+    for compression, level, ms, kib in results:
+        print(f"  {compression:<12}{'-' if compression == 'stored' else level if level is not None else 'default':>7}{ms:>10.1f}{kib:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save time and size per zip compression setting.")
+    parser.add_argument("--slides", type=int, default=40, help="slides in the benchmark deck")
+    parser.add_argument("--rows", type=int, default=5000, help="rows in the benchmark workbook")
+    parser.add_argument("--repeat", type=int, default=5, help="saves per setting (best time is kept)")
+    args = parser.parse_args()
+
+    report(f"PyPPT, {args.slides} slides", measure(build_deck(args.slides).to_bytes, args.repeat))
+    report(f"PyWorkbook, {args.rows} rows x 8 columns", measure(build_workbook(args.rows).to_bytes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
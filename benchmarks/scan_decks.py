@@ -0,0 +1,106 @@
+# scan_decks.py in benchmarks directory
+#
+# Compares extracting the text, tables and chart series of a directory of decks
+# with pypptx.scan (streamed, read-only) against opening each deck with PyPPT
+# and walking python-pptx's object model.
+#
+# Usage (from the repository root):
+#     python benchmarks/scan_decks.py [--decks 40] [--slides 30] [--workers 4]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pypptx import PyPPT, XL_CHART_TYPE  # noqa: E402
+from pypptx.scan import scan, scan_many  # noqa: E402
+
+
+def build_deck(n_slides, seed):
+    """Builds a deck with a title, a text box and a table or chart on every slide."""
+    rng = np.random.default_rng(seed)
+    ppt = PyPPT()
+    for i in range(n_slides):
+        slide = ppt.add_slide(layout_ref=5)
+        slide.set_title(f"Section {i}")
+        slide.add_text_box(f"Commentary for section {i}\nSecond line", 0.5, 6.5, 9, 0.8)
+        if i % 2:
+            frame = pd.DataFrame(rng.normal(size=(15, 6)).round(2), columns=list("ABCDEF"))
+            slide.add_table_from_dataframe(frame, 0.5, 1.5, 9, 5)
+        else:
+            categories = [f"Q{q}" for q in range(1, 13)]
+            series = [{"name": f"S{s}", "values": rng.integers(0, 100, 12).tolist()} for s in range(4)]
+            slide.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, {"categories": categories, "series": series},
+                            0.5, 1.5, 9, 5, chart_title="Quarterly")
+    return ppt
+
+
+def load_deck(path):
+    """The full-load path: everything scan() returns, read through PyPPT and python-pptx."""
+    slides = []
+    for py_slide in PyPPT(path, use_template_cache=False).slides:
+        texts, tables, charts = [], [], []
+        for shape in py_slide.pptx_slide.shapes:
+            if shape.has_text_frame:
+                texts.extend(p.text for p in shape.text_frame.paragraphs if p.text)
+            elif shape.has_table:
+                rows = [[cell.text for cell in row.cells] for row in shape.table.rows]
+                tables.append(pd.DataFrame(rows[1:], columns=rows[0]))
+            elif shape.has_chart:
+                charts.append([(s.name, list(s.values)) for s in shape.chart.plots[0].series])
+        slides.append((texts, tables, charts))
+    return slides
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def peak_kib(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-only scanning versus full loading of decks.")
+    parser.add_argument("--decks", type=int, default=40, help="decks in the benchmark directory")
+    parser.add_argument("--slides", type=int, default=30, help="slides per deck")
+    parser.add_argument("--workers", type=int, default=None, help="processes for scan_many (default: CPUs)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(args.decks):
+            paths.append(os.path.join(directory, f"deck_{i:03d}.pptx"))
+            build_deck(args.slides, i).save(paths[-1])
+
+        results = [
+            ("PyPPT load + walk", timed(lambda: [load_deck(path) for path in paths]),
+             peak_kib(lambda: load_deck(paths[0]))),
+            ("scan", timed(lambda: [list(scan(path)) for path in paths]),
+             peak_kib(lambda: list(scan(paths[0])))),
+            (f"scan_many (workers={args.workers or os.cpu_count()})",
+             timed(lambda: list(scan_many(directory, workers=args.workers))), None),
+        ]
+
+    print(f"{args.decks} decks x {args.slides} slides")
+    print(f"  {'method':<26}{'total s':>9}{'ms/deck':>9}{'peak KiB/deck':>15}")
+    for name, seconds, kib in results:
+        print(f"  {name:<26}{seconds:>9.2f}{seconds * 1000 / args.decks:>9.1f}"
+              f"{'-' if kib is None else f'{kib:.0f}':>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# stamp_shapes.py in benchmarks directory
+#
+# Compares adding many styled callouts to a slide through python-pptx's object
+# API (add_shape, then fill, line and font set property by property) against
+# pypptx.stamp.ShapeStamp, which fills the slots of precompiled shape XML.
+#
+# Usage (from the repository root):
+#     python benchmarks/stamp_shapes.py [--shapes 5000]
+
+import argparse
+import os
+import sys
+import time
+
+from pptx.dml.color import RGBColor
+from pptx.util import Pt
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pypptx import MSO_SHAPE, PyPPT  # noqa: E402
+from pypptx.stamp import ShapeStamp  # noqa: E402
+
+STYLE = {"fill": (255, 242, 204), "line": (191, 144, 0), "line_weight": 1,
+         "font_name": "Arial", "font_size": 10, "bold": True}
+
+
+def position(i):
+    return 0.2 + (i % 8) * 1.2, 0.2 + (i // 8) % 40 * 0.18
+
+
+def object_api(slide, n_shapes):
+    for i in range(n_shapes):
+        shape = slide.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, *position(i), 1.1, 0.16)
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = RGBColor(*STYLE["fill"])
+        shape.line.color.rgb = RGBColor(*STYLE["line"])
+        shape.line.width = Pt(STYLE["line_weight"])
+        shape.text_frame.text = f"Store {i}"
+        for paragraph in shape.text_frame.paragraphs:
+            paragraph.font.name = STYLE["font_name"]
+            paragraph.font.size = Pt(STYLE["font_size"])
+            paragraph.font.bold = STYLE["bold"]
+
+
+def stamped(slide, n_shapes):
+    stamp = ShapeStamp(MSO_SHAPE.ROUNDED_RECTANGLE, width=1.1, height=0.16, **STYLE)
+    stamp.stamp_many(slide, ({"text": f"Store {i}", "left": position(i)[0], "top": position(i)[1]}
+                             for i in range(n_shapes)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stamping precompiled shapes versus the object API.")
+    parser.add_argument("--shapes", type=int, default=5000, help="callouts added to one slide")
+    args = parser.parse_args()
+
+    print(f"{args.shapes} styled callouts on one slide")
+    for name, add, turbo in (("object API", object_api, False), ("object API, turbo mode", object_api, True),
+                             ("ShapeStamp.stamp_many", stamped, False)):
+        slide = PyPPT().add_slide(layout_ref=6)
+        slide.pptx_slide.shapes.turbo_add_enabled = turbo
+        start = time.perf_counter()
+        add(slide, args.shapes)
+        print(f"  {name:<24}{time.perf_counter() - start:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,27 +24,18 @@ print("\nAdding slide 2 using layout name 'Title Slide' (or 'Title' if that's th
 slide_two = None # Initialize slide_two
 try:
     # Common layout names. Actual names can vary by template.
-    # Attempt "Title Slide" first, then "Title", then "Blank" as fallbacks for example.
-    layout_name_to_try = "Title Slide"
-    try:
-        slide_two = new_preso.add_slide(layout_ref=layout_name_to_try)
-    except ValueError:
-        print(f"Layout '{layout_name_to_try}' not found, trying 'Title'...")
-        layout_name_to_try = "Title"
-        try:
-            slide_two = new_preso.add_slide(layout_ref=layout_name_to_try)
-        except ValueError:
-            print(f"Layout '{layout_name_to_try}' not found, trying 'Blank'...")
-            layout_name_to_try = "Blank"
-            slide_two = new_preso.add_slide(layout_ref=layout_name_to_try)
+    # add_slide accepts several names and uses the first one found ("Title Slide", then "Title",
+    # then "Blank"). Names are also matched case-insensitively.
+    slide_two = new_preso.add_slide(layout_ref=("Title Slide", "Title", "Blank"))
+    layout_name_used = slide_two.pptx_slide.slide_layout.name
 
-    slide_two.set_title(f"Slide via Layout Name: '{layout_name_to_try}'")
+    slide_two.set_title(f"Slide via Layout Name: '{layout_name_used}'")
     # Attempt to set subtitle, common for "Title Slide" or "Title" layouts
     try:
         slide_two.set_subtitle("Subtitle for name-based layout slide")
     except AttributeError:
-        print(f"Layout '{layout_name_to_try}' does not have a subtitle placeholder.")
-    print(f"Added slide using layout name '{layout_name_to_try}'.")
+        print(f"Layout '{layout_name_used}' does not have a subtitle placeholder.")
+    print(f"Added slide using layout name '{layout_name_used}'.")
 except Exception as e:
     print(f"Error adding slide by name: {e}. Adding by index 0 as fallback.")
     slide_two = new_preso.add_slide(layout_ref=0) # Fallback to index
@@ -1,6 +1,10 @@
 from .presentation import PyPPT
 from .slide import PySlide
+from .mailmerge import MergeTemplate
+from .streaming import StreamingPPT
+# pypptx.scan is the submodule, so the single-deck scanner is exported as scan_deck.
+from .scan import scan as scan_deck, scan_many
 from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
 from pptx.enum.chart import XL_CHART_TYPE
 
-__all__ = ['PyPPT', 'PySlide', 'MSO_SHAPE', 'XL_CHART_TYPE', 'PP_PLACEHOLDER']
+__all__ = ['PyPPT', 'PySlide', 'MergeTemplate', 'StreamingPPT', 'scan_deck', 'scan_many', 'MSO_SHAPE', 'XL_CHART_TYPE', 'PP_PLACEHOLDER']
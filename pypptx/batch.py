@@ -0,0 +1,238 @@
+# batch.py in pypptx directory
+#
+# Batch rendering of many decks across a process pool. Each worker reads the
+# template once (in the pool initializer), builds its decks with a user
+# function and writes them to disk itself, so only small task descriptions
+# and results cross process boundaries.
+
+import functools
+import io
+import os
+import signal
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .constants import DEFAULT_BATCH_CHUNKSIZE, DEFAULT_BATCH_FILENAME
+from .presentation import PyPPT
+
+# Template bytes loaded once per worker process by _init_worker.
+_TEMPLATE_BYTES = None
+
+
+class BatchTimeoutError(Exception):
+    """Raised inside a worker when building one deck exceeds its timeout."""
+
+
+class BatchFailure:
+    """Describes one deck that could not be rendered."""
+
+    __slots__ = ("index", "output_path", "error", "traceback", "timed_out")
+
+    def __init__(self, index, output_path, error, traceback_text, timed_out=False):
+        self.index = index
+        self.output_path = output_path
+        self.error = error
+        self.traceback = traceback_text
+        self.timed_out = timed_out
+
+    def __repr__(self):
+        return f"BatchFailure(index={self.index}, error={self.error!r}, timed_out={self.timed_out})"
+
+
+class BatchReport:
+    """Result of render_many: which decks were written and which failed."""
+
+    __slots__ = ("written", "failures")
+
+    def __init__(self):
+        self.written = {}   # payload index -> output path
+        self.failures = []  # BatchFailure instances, sorted by index once rendering finishes
+
+    @property
+    def ok(self):
+        """bool: True if every deck was written."""
+        return not self.failures
+
+    def __repr__(self):
+        return f"BatchReport(written={len(self.written)}, failed={len(self.failures)})"
+
+
+def run_chunks(make_executor, fn, chunks, max_in_flight, *args):
+    """Runs fn(chunk, *args) for each chunk in a process pool; yields (chunk, result or exception).
+
+    Chunks are taken from the iterable lazily, with at most `max_in_flight` of
+    them submitted at a time, and yielded in the order they finish. If a worker
+    process dies, the pool breaks and every chunk in flight at that moment is
+    yielded with the BrokenProcessPool exception; a new pool from
+    `make_executor` then runs the remaining chunks.
+
+    Args:
+        make_executor (callable): Returns a new ProcessPoolExecutor.
+        fn (callable): Picklable function run in the workers.
+        chunks (Iterable): The chunks, consumed lazily.
+        max_in_flight (int): Chunks submitted at a time.
+        *args: Further picklable arguments of `fn`.
+
+    Yields:
+        tuple: (chunk, fn's return value), or (chunk, exception) if the chunk failed as a whole.
+    """
+    chunks = iter(chunks)
+    executor = make_executor()
+    try:
+        in_flight = {}
+        exhausted = False
+        while in_flight or not exhausted:
+            while not exhausted and len(in_flight) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                try:
+                    future = executor.submit(fn, chunk, *args)
+                except BrokenProcessPool:
+                    # The chunks of the broken pool still in flight fail on their own below.
+                    executor.shutdown(wait=False)
+                    executor = make_executor()
+                    future = executor.submit(fn, chunk, *args)
+                in_flight[future] = chunk
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                yield chunk, result
+    finally:
+        executor.shutdown()
+
+
+def _init_worker(template_path):
+    """Pool initializer: caches the template bytes for every task run by this worker."""
+    global _TEMPLATE_BYTES
+    if template_path is not None:
+        with open(template_path, "rb") as template_file:
+            _TEMPLATE_BYTES = template_file.read()
+
+
+def _raise_timeout(signum, frame):
+    raise BatchTimeoutError("Deck rendering timed out.")
+
+
+def _render_one(build_fn, payload, output_path, timeout):
+    """Builds one deck from the cached template and saves it. Runs in a worker."""
+    if timeout is not None:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        ppt = PyPPT(io.BytesIO(_TEMPLATE_BYTES)) if _TEMPLATE_BYTES is not None else PyPPT()
+        build_fn(ppt, payload)
+        ppt.save(output_path)
+    finally:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _render_chunk(tasks, build_fn, timeout):
+    """Renders a chunk of (index, payload, output_path) tasks. Runs in a worker.
+
+    Returns a list of (index, output_path, error, traceback_text, timed_out); error
+    is None for decks that were written.
+    """
+    results = []
+    for index, payload, output_path in tasks:
+        try:
+            _render_one(build_fn, payload, output_path, timeout)
+        except Exception as e:
+            # Do not leave a partially written deck behind.
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            results.append((index, output_path, f"{type(e).__name__}: {e}",
+                            traceback.format_exc(), isinstance(e, BatchTimeoutError)))
+        else:
+            results.append((index, output_path, None, None, False))
+    return results
+
+
+def _iter_chunks(payloads, output_dir, filename, chunksize):
+    """Yields lists of at most `chunksize` (index, payload, output_path) tasks."""
+    chunk = []
+    for index, payload in enumerate(payloads):
+        name = filename(index, payload) if callable(filename) else filename.format(index=index)
+        chunk.append((index, payload, os.path.join(output_dir, name)))
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def render_many(build_fn, payloads, output_dir, workers=None, template_path=None,
+                chunksize=DEFAULT_BATCH_CHUNKSIZE, timeout=None, filename=DEFAULT_BATCH_FILENAME):
+    """Builds one deck per payload in parallel worker processes.
+
+    Each worker reads `template_path` once at startup. For every payload it opens
+    a fresh PyPPT from those bytes (or a blank presentation if no template is
+    given), calls `build_fn(ppt, payload)` and saves the deck to `output_dir`
+    directly, so no presentation data is sent back to the parent process.
+
+    Payloads are consumed lazily and sent in chunks of `chunksize`, with at most
+    two chunks per worker in flight, so a large generator of payloads is never
+    materialized in full.
+
+    Args:
+        build_fn (callable): Module-level function `build_fn(ppt, payload)` that fills
+                             a PyPPT. Must be picklable.
+        payloads (Iterable): One picklable payload per deck.
+        output_dir (str): Directory the decks are written to. Created if missing.
+        workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+        template_path (str, optional): .pptx every deck starts from.
+        chunksize (int): Payloads sent to a worker per task. Defaults to DEFAULT_BATCH_CHUNKSIZE.
+        timeout (float, optional): Seconds allowed for building and saving one deck.
+                                   Enforced with SIGALRM inside the worker, so it is
+                                   only available on platforms that provide it
+                                   (not on Windows).
+        filename (str or callable): Output file name, either a format string receiving
+                                    `index`, or a function `filename(index, payload)`.
+                                    Defaults to DEFAULT_BATCH_FILENAME.
+
+    Returns:
+        BatchReport: Paths of the decks written and a BatchFailure for each deck that
+                     raised or timed out. If a worker process dies, the decks of every
+                     chunk in flight at that moment are reported as failed and the
+                     remaining payloads go to a new pool.
+
+    Raises:
+        ValueError: If chunksize or workers is less than 1, or if a timeout is given
+                    on a platform without SIGALRM, where it could not be enforced.
+    """
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, not {chunksize!r}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"workers must be a positive integer, not {workers!r}.")
+    if timeout is not None and not hasattr(signal, "SIGALRM"):
+        raise ValueError("timeout needs signal.SIGALRM, which this platform does not provide.")
+    os.makedirs(output_dir, exist_ok=True)
+
+    report = BatchReport()
+    make_executor = functools.partial(ProcessPoolExecutor, max_workers=workers, initializer=_init_worker,
+                                      initargs=(template_path,))
+    chunks = _iter_chunks(payloads, output_dir, filename, chunksize)
+    for chunk, results in run_chunks(make_executor, _render_chunk, chunks, 2 * workers, build_fn, timeout):
+        if isinstance(results, Exception):
+            # The whole chunk was lost (e.g. a worker died or the result could not be unpickled).
+            error = f"{type(results).__name__}: {results}"
+            results = [(index, path, error, None, False) for index, _, path in chunk]
+        for index, output_path, error, traceback_text, timed_out in results:
+            if error is None:
+                report.written[index] = output_path
+            else:
+                report.failures.append(BatchFailure(index, output_path, error, traceback_text, timed_out))
+
+    report.failures.sort(key=lambda failure: failure.index)
+    return report
@@ -0,0 +1,365 @@
+# chart_data.py in pypptx directory
+#
+# Array-backed chart data for category charts (bar, column, line, area, pie,
+# ...). python-pptx's CategoryChartData keeps one Python object per category
+# and data point and writes both the chart XML and the embedded workbook with
+# per-point loops, some of them quadratic in the number of categories. Here
+# the categories and series stay NumPy arrays: python-pptx writes the chart
+# skeleton from a one-point stub, the point caches are generated from the
+# arrays in one pass, and the embedded workbook is written directly as
+# SpreadsheetML.
+
+import datetime
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+from pptx.chart.data import CategoryChartData
+from xlsxwriter.utility import xl_col_to_name
+
+_C_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+_NSMAP = {"c": _C_NS}
+
+# Excel serial date 60 is the non-existent 1900-02-29; later dates are shifted by one.
+_EXCEL_EPOCH = np.datetime64("1899-12-31", "D")
+
+_PT_TMPL = '<c:pt idx="%d"><c:v>%s</c:v></c:pt>'
+_SLOT_RE = re.compile(rb"<!--pt-slot-(\d+)-->")
+
+
+def as_category_array(categories):
+    """Returns `categories` (list, NumPy array, pandas Index or Series) as a 1-D array.
+
+    Raises:
+        ValueError: If categories is not one-dimensional or is empty.
+    """
+    array = np.asarray(categories)
+    if array.ndim != 1:
+        raise ValueError(f"categories must be one-dimensional, not of shape {array.shape}.")
+    if not len(array):
+        raise ValueError("categories cannot be empty.")
+    return array
+
+
+def as_value_array(values, name):
+    """Returns `values` as a 1-D numeric array; None and NaN mark missing points.
+
+    Integer and float arrays are kept as they are (no copy). Other inputs are
+    converted with pandas.to_numeric.
+
+    Raises:
+        ValueError: If values is not one-dimensional or not numeric.
+    """
+    array = np.asarray(values)
+    if array.ndim != 1:
+        raise ValueError(f"Series '{name}' values must be one-dimensional, not of shape {array.shape}.")
+    if array.dtype.kind not in "iuf":
+        try:
+            array = pd.to_numeric(array).astype(float, copy=False)
+        except (TypeError, ValueError):
+            raise ValueError(f"Series '{name}' values must be numeric.")
+    return array
+
+
+def array_chart_data(categories, series, number_format=None):
+    """Validates array inputs by shape and returns an ArrayCategoryChartData for them.
+
+    Args:
+        categories (array-like): One label per category.
+        series (list[tuple[str, array-like]]): (name, values) for each series.
+        number_format (str, optional): Number format of the series values.
+
+    Returns:
+        ArrayCategoryChartData: The chart data.
+
+    Raises:
+        ValueError: If there is no series, or an array has the wrong shape or type.
+    """
+    categories = as_category_array(categories)
+    if not series:
+        raise ValueError("At least one series is required.")
+    arrays = []
+    for name, values in series:
+        values = as_value_array(values, name)
+        if values.shape != categories.shape:
+            raise ValueError(f"Series '{name}' has {len(values)} values, "
+                             f"but there are {len(categories)} categories.")
+        arrays.append((str(name), values))
+    return ArrayCategoryChartData(categories, arrays, number_format)
+
+
+def dataframe_chart_data(dataframe, number_format=None):
+    """Returns chart data for `dataframe`: the index gives the categories, each column a series."""
+    series = [(name, dataframe.iloc[:, i].to_numpy()) for i, name in enumerate(dataframe.columns)]
+    return array_chart_data(dataframe.index.to_numpy(), series, number_format)
+
+
+def _excel_date_numbers(dates):
+    """Converts datetime64 values to Excel serial day numbers (1900 date system)."""
+    days = (dates.astype("datetime64[D]") - _EXCEL_EPOCH).astype(np.int64)
+    return np.where(days > 59, days + 1, days)
+
+
+def _first_label(categories):
+    """The first category as the Python object python-pptx would have received."""
+    if categories.dtype.kind == "M":
+        return categories[0].astype("datetime64[D]").item()
+    return categories[0].item() if isinstance(categories[0], np.generic) else categories[0]
+
+
+class ArrayCategoryChartData(CategoryChartData):
+    """Category chart data whose categories and series values stay NumPy arrays.
+
+    Produces the same chart as a CategoryChartData holding the same values, but
+    builds the point caches and the embedded workbook from the arrays directly.
+    Missing values (NaN) are left out of the chart, as None is by python-pptx.
+
+    Args:
+        categories (np.ndarray): 1-D array of category labels (numbers, datetime64 or strings).
+        series (list[tuple[str, np.ndarray]]): (name, values) for each series; every values
+                                              array has one entry per category.
+        number_format (str, optional): Number format of the series values. Defaults to "General".
+    """
+
+    def __init__(self, categories, series, number_format=None):
+        super().__init__(number_format or "General")
+        self._category_array = categories
+        self._series_arrays = series
+        # Point strings, shared by the chart XML and the workbook.
+        self._category_text = None
+        self._series_text = None
+        # One-point stub: python-pptx writes the chart skeleton (plot, axes, series
+        # names, formats) from it, which is cheap and independent of the data size.
+        self.categories = [_first_label(categories)]
+        for name, values in series:
+            first = values[0]
+            self.add_series(name, [None if first != first else first.item()])
+
+    @property
+    def categories_ref(self):
+        return "Sheet1!$A$2:$A$%d" % (len(self._category_array) + 1)
+
+    def values_ref(self, series):
+        col = xl_col_to_name(series.index + 1)
+        return "Sheet1!$%s$2:$%s$%d" % (col, col, len(self._category_array) + 1)
+
+    def _category_strings(self):
+        """The category labels as they appear in the chart's <c:v> elements and the workbook."""
+        if self._category_text is None:
+            categories = self._category_array
+            kind = categories.dtype.kind
+            if kind == "M":
+                self._category_text = _excel_date_numbers(categories).astype(float).astype(str)
+            elif kind in "iuf":
+                self._category_text = categories.astype(str)
+            else:
+                self._category_text = [escape(str(label)) for label in categories]
+        return self._category_text
+
+    def _series_points(self):
+        """(indices, strings) of the non-missing points of each series, computed once."""
+        if self._series_text is None:
+            self._series_text = []
+            for _, values in self._series_arrays:
+                if values.dtype.kind == "f":
+                    present = np.flatnonzero(~np.isnan(values))
+                    self._series_text.append((present, values[present].astype(str)))
+                else:
+                    self._series_text.append((range(len(values)), values.astype(str)))
+        return self._series_text
+
+    def xml_bytes(self, chart_type):
+        """Returns the chart XML for `chart_type` with every point of every series."""
+        chartSpace = etree.fromstring(super().xml_bytes(chart_type))
+        n_categories = str(len(self._category_array))
+
+        # The stub's single point in each cache is swapped for a marker comment,
+        # and the markers are replaced by the generated points after serializing.
+        slot_xml = []
+        series_points = self._series_points()
+        category_xml = None
+        for ser in chartSpace.iter("{%s}ser" % _C_NS):
+            series_idx = int(ser.find("c:idx", _NSMAP).get("val"))
+            for path, points in (("c:cat/*/*/c:ptCount", None), ("c:val/*/*/c:ptCount", series_points[series_idx])):
+                for ptCount in ser.iterfind(path, _NSMAP):
+                    ptCount.set("val", n_categories)
+                    cache = ptCount.getparent()
+                    for pt in cache.findall("c:pt", _NSMAP):
+                        cache.remove(pt)
+                    cache.append(etree.Comment("pt-slot-%d" % len(slot_xml)))
+                    if points is None:
+                        if category_xml is None:
+                            category_xml = _points_xml(range(len(self._category_array)), self._category_strings())
+                        slot_xml.append(category_xml)
+                    else:
+                        slot_xml.append(_points_xml(*points))
+
+        xml = etree.tostring(chartSpace, encoding="UTF-8", standalone=True)
+        pieces = _SLOT_RE.split(xml)
+        pieces[1::2] = [slot_xml[int(slot)] for slot in pieces[1::2]]
+        return b"".join(pieces)
+
+    @property
+    def xlsx_blob(self):
+        """The embedded workbook: categories in column A, one series per column, names in row 1."""
+        category_cells = _category_cells(self._category_array, self._category_strings())
+        series_cells = [_number_cells(xl_col_to_name(i + 1), indices, strings, len(self._category_array), 2)
+                        for i, (indices, strings) in enumerate(self._series_points())]
+        names = [name for name, _ in self._series_arrays]
+        return _workbook_blob(category_cells, names, series_cells,
+                              self.categories.number_format, self.number_format)
+
+
+def _points_xml(indices, strings):
+    """The <c:pt> elements for the given point indices and <c:v> strings, as UTF-8 bytes."""
+    return "".join(map(_PT_TMPL.__mod__, zip(indices, strings))).encode("utf-8")
+
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="xl/workbook.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+    '<Relationship Id="rId2" Target="styles.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"/>'
+    '</Relationships>'
+)
+
+
+def _styles_xml(number_formats):
+    """styles.xml with one cell format per entry of `number_formats` (style ids 1, 2, ...)."""
+    custom = [fmt for fmt in dict.fromkeys(number_formats) if fmt != "General"]
+    fmt_ids = {fmt: 164 + i for i, fmt in enumerate(custom)}
+    fmt_ids["General"] = 0
+    numFmts = "".join('<numFmt numFmtId="%d" formatCode=%s/>' % (fmt_ids[fmt], _quoteattr(fmt))
+                      for fmt in custom)
+    xfs = "".join('<xf numFmtId="%d" fontId="0" fillId="0" borderId="0" xfId="0"%s/>'
+                  % (fmt_ids[fmt], ' applyNumberFormat="1"' if fmt_ids[fmt] else "")
+                  for fmt in number_formats)
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '%s'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="%d"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>%s</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ) % ('<numFmts count="%d">%s</numFmts>' % (len(custom), numFmts) if custom else "",
+         len(number_formats) + 1, xfs)
+
+
+def _quoteattr(value):
+    return '"%s"' % escape(value, {'"': "&quot;"})
+
+
+def _number_cells(column, indices, strings, n_rows, style):
+    """The <c> markup of each row of a numeric column; rows without a value get ""."""
+    tmpl = '<c r="%s%%d" s="%d"><v>%%s</v></c>' % (column, style)
+    if isinstance(indices, range):
+        return [tmpl % (row, text) for row, text in enumerate(strings, start=2)]
+    cells = [""] * n_rows
+    for i, text in zip(indices.tolist(), strings):
+        cells[i] = tmpl % (i + 2, text)
+    return cells
+
+
+def _category_cells(categories, strings):
+    """The <c> markup of the category column (numbers, dates or inline strings)."""
+    if categories.dtype.kind in "iufM":
+        return _number_cells("A", range(len(strings)), strings, len(strings), 1)
+    return ['<c r="A%d" t="inlineStr" s="1"><is><t>%s</t></is></c>' % (row, text)
+            for row, text in enumerate(strings, start=2)]
+
+
+def _workbook_blob(category_cells, names, series_cells, categories_number_format, number_format):
+    """Writes the chart-data workbook as .xlsx bytes.
+
+    The layout matches python-pptx's CategoryWorkbookWriter: categories in column A
+    from row 2, each series in the following columns with its name in row 1.
+    """
+    header = "".join('<c r="%s1" t="inlineStr"><is><t>%s</t></is></c>' % (xl_col_to_name(i + 1), escape(str(name)))
+                     for i, name in enumerate(names))
+    rows = ['<row r="1">%s</row>' % header]
+    rows.extend('<row r="%d">%s</row>' % (row, "".join(cells))
+                for row, cells in enumerate(zip(category_cells, *series_cells), start=2))
+
+    sheet = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<cols><col min="1" max="1" width="10.7109375" customWidth="1"/></cols>'
+        '<sheetData>%s</sheetData></worksheet>'
+    ) % "".join(rows)
+
+    buffer = io.BytesIO()
+    # Fastest deflate level: the blob is stored inside the .pptx zip, which compresses again.
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as xlsx_zip:
+        xlsx_zip.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        xlsx_zip.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        xlsx_zip.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        xlsx_zip.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        xlsx_zip.writestr("xl/styles.xml", _styles_xml([categories_number_format, number_format]))
+        xlsx_zip.writestr("xl/worksheets/sheet1.xml", sheet)
+    return buffer.getvalue()
+
+
+def _category_array_of(labels):
+    """The category labels of a CategoryChartData as an array; dates become datetime64."""
+    if labels and all(isinstance(label, datetime.date) for label in labels):
+        return np.array(labels, dtype="datetime64[ns]")
+    return np.asarray(labels)
+
+
+def values_workbook_blob(chart_data):
+    """Returns a minimal workbook holding the categories and values of `chart_data`.
+
+    Written directly as SpreadsheetML with the layout of python-pptx's workbook
+    (see _workbook_blob), so the chart's references into it stay valid and "Edit
+    Data" in PowerPoint opens the chart's values.
+
+    Args:
+        chart_data (CategoryChartData): Chart data with single-level categories.
+
+    Returns:
+        bytes: The .xlsx file.
+    """
+    if not isinstance(chart_data, ArrayCategoryChartData):
+        series = [(series.name, np.array([np.nan if value is None else value for value in series.values], dtype=float))
+                  for series in chart_data]
+        chart_data = ArrayCategoryChartData(
+            _category_array_of([category.label for category in chart_data.categories]), series,
+            chart_data.number_format)
+    return chart_data.xlsx_blob
@@ -0,0 +1,162 @@
+# chart_workbook.py in pypptx directory
+#
+# Control over the Excel workbook embedded with each chart. python-pptx builds
+# and embeds a complete workbook for every chart ("full"). Charts can instead
+# share one embedded workbook per distinct data set ("shared"), or embed a
+# minimal workbook holding just their values, written directly as
+# SpreadsheetML ("cached").
+
+import hashlib
+import weakref
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+
+from .chart_data import ArrayCategoryChartData, values_workbook_blob
+
+CHART_WORKBOOK_MODES = ("full", "shared", "cached")
+
+# Per package: data fingerprint -> _SharedWorkbook. Parts refer to their package,
+# so holding them strongly here would keep every package alive.
+_SHARED_WORKBOOKS = weakref.WeakKeyDictionary()
+
+
+class _SharedWorkbook:
+    """A shared EmbeddedXlsxPart (held by weak reference) and the charts using it.
+
+    Each user is recorded as (slide part ref, rId of the slide in the presentation,
+    rId of the chart in the slide), so whether the workbook is still used can be
+    checked through a few relationship lookups instead of walking the package.
+    """
+
+    __slots__ = ("part_ref", "users")
+
+    def __init__(self, xlsx_part):
+        self.part_ref = weakref.ref(xlsx_part)
+        self.users = []  # None once the part is known to stay in the package for good
+
+    def live_part(self, package):
+        """Returns the workbook part if a chart in `package` still uses it, else None."""
+        xlsx_part = self.part_ref()
+        if xlsx_part is None or self.users is None:
+            return xlsx_part
+        presentation_rels = package.presentation_part.rels._rels
+        while self.users:
+            slide_ref, slide_rId, chart_rId = self.users[-1]
+            slide_part = slide_ref()
+            slide_rel = presentation_rels.get(slide_rId)
+            chart_rel = slide_part.rels._rels.get(chart_rId) if slide_part is not None else None
+            if (slide_rel is not None and slide_rel.target_part is slide_part and chart_rel is not None
+                    and chart_rel.target_part.chart_workbook.xlsx_part is xlsx_part):
+                return xlsx_part
+            self.users.pop()  # that chart or its slide was removed
+        return None
+
+
+def _slide_rId(slide_part):
+    """rId of `slide_part` in its presentation; recently added slides are found first."""
+    for rId, rel in reversed(slide_part.package.presentation_part.rels._rels.items()):
+        if rel.reltype == RT.SLIDE and rel.target_part is slide_part:
+            return rId
+    raise ValueError("The slide is not part of its presentation.")
+
+
+def chart_data_fingerprint(chart_data):
+    """Returns a digest identifying the workbook `chart_data` would produce.
+
+    Two chart data objects with the same fingerprint produce identical workbooks,
+    so their charts can share one embedded workbook.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((chart_data.number_format, chart_data.categories.number_format)).encode("utf-8"))
+    if isinstance(chart_data, ArrayCategoryChartData):
+        categories = chart_data._category_array
+        digest.update(repr((categories.dtype.str, len(categories))).encode("utf-8"))
+        if categories.dtype.kind in "iufM":
+            digest.update(categories.tobytes())
+        else:
+            digest.update("\x00".join(map(str, categories)).encode("utf-8"))
+        for name, values in chart_data._series_arrays:
+            digest.update(repr((name, values.dtype.str)).encode("utf-8"))
+            digest.update(values.tobytes())
+    else:
+        digest.update(repr([category.label for category in chart_data.categories]).encode("utf-8"))
+        for series in chart_data:
+            digest.update(repr((series.name, series.number_format, series.values)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _shared_workbook(chart_data, package):
+    """Returns (workbook part, its _SharedWorkbook) for a new chart, reusing a workbook still in use."""
+    registry = _SHARED_WORKBOOKS.setdefault(package, {})
+    key = chart_data_fingerprint(chart_data)
+    shared = registry.get(key)
+    xlsx_part = shared.live_part(package) if shared is not None else None
+    if xlsx_part is None:
+        # A workbook no chart uses any more is not reused: its partname may have been given to another part.
+        xlsx_part = EmbeddedXlsxPart.new(chart_data.xlsx_blob, package)
+        shared = registry[key] = _SharedWorkbook(xlsx_part)
+    return xlsx_part, shared
+
+
+def replace_shared_workbooks(package, replacements):
+    """Makes later charts of `package` use replacement parts instead of the workbooks they replace.
+
+    Used by StreamingPPT, which swaps the workbooks it has written for stand-ins.
+    The stand-ins stay in the package until it is written.
+
+    Args:
+        package (pptx.package.Package): The package the parts belong to.
+        replacements (dict): Original part -> part replacing it in the package.
+    """
+    for shared in _SHARED_WORKBOOKS.get(package, {}).values():
+        replacement = replacements.get(shared.part_ref())
+        if replacement is not None:
+            shared.part_ref = weakref.ref(replacement)
+            shared.users = None
+
+
+def add_chart_part(slide_part, chart_type, chart_data, workbook_mode):
+    """Adds a chart part for `chart_data` to the slide's package and relates it to the slide.
+
+    Does what python-pptx's SlidePart.add_chart_part does, except for how the
+    embedded workbook is provided:
+
+    - "full": a workbook with the chart data is built and embedded for this chart.
+    - "shared": charts with identical data in the same presentation share one
+      embedded workbook, which is only built for the first of them.
+    - "cached": the chart embeds a minimal workbook holding just its values,
+      written directly as SpreadsheetML (see values_workbook_blob) instead of
+      through python-pptx's xlsxwriter-based workbook writer.
+
+    Args:
+        slide_part (pptx.parts.slide.SlidePart): The slide receiving the chart.
+        chart_type (XL_CHART_TYPE): Type of chart.
+        chart_data (pptx.chart.data.CategoryChartData): The chart data.
+        workbook_mode (str): One of CHART_WORKBOOK_MODES.
+
+    Returns:
+        str: rId of the chart part, relative to `slide_part`.
+
+    Raises:
+        ValueError: If workbook_mode is not one of CHART_WORKBOOK_MODES.
+    """
+    if workbook_mode not in CHART_WORKBOOK_MODES:
+        raise ValueError(f"workbook_mode must be one of {CHART_WORKBOOK_MODES}, not {workbook_mode!r}.")
+    if workbook_mode == "full":
+        return slide_part.add_chart_part(chart_type, chart_data)
+
+    package = slide_part.package
+    chart_part = ChartPart.load(package.next_partname(ChartPart.partname_template), CT.DML_CHART,
+                                package, chart_data.xml_bytes(chart_type))
+    if workbook_mode == "cached":
+        chart_part.chart_workbook.xlsx_part = EmbeddedXlsxPart.new(values_workbook_blob(chart_data), package)
+        return slide_part.relate_to(chart_part, RT.CHART)
+    xlsx_part, shared = _shared_workbook(chart_data, package)
+    chart_part.chart_workbook.xlsx_part = xlsx_part
+    rId = slide_part.relate_to(chart_part, RT.CHART)
+    if shared.users is not None:
+        shared.users.append((weakref.ref(slide_part), _slide_rId(slide_part), rId))
+    return rId
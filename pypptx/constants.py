@@ -2,8 +2,24 @@
 # This file will store default values and other constants.
 
 DEFAULT_LAYOUT_REF = 5
+DEFAULT_USE_TEMPLATE_CACHE = True # Open .pptx paths through the process-wide template cache
+DEFAULT_TEMPLATE_CACHE_SIZE = 8 # Parsed templates kept by the template cache (LRU)
+DEFAULT_LAZY_OPEN = False # Parse slides, notes and charts of an opened deck only when first used
+DEFAULT_SAVE_COMPRESSION = "deflate" # Zip compression for saved decks: "deflate" or "stored"
+DEFAULT_SAVE_COMPRESSLEVEL = None # Deflate level 0 (fastest) to 9 (smallest); None uses zlib's default
+DEFAULT_INCREMENTAL_SAVE = True # Copy unchanged parts of the opened file as compressed bytes when saving
+DEFAULT_DUPLICATE_SLIDE_MODE = "clone" # "clone" (full XML copy) or "basic" (shape-by-shape rebuild)
 DEFAULT_TABLE_HEADER_BOLD = True
 DEFAULT_TABLE_INCLUDE_INDEX = False
+DEFAULT_TABLE_BULK_BUILD = True # Build table rows as XML in one pass instead of cell by cell
+DEFAULT_TABLE_ROWS_PER_SLIDE = 15 # Data rows per slide for PyPPT.add_paginated_table
+DEFAULT_CONTINUED_TITLE_SUFFIX = " (cont.)" # Appended to titles of continuation slides
+DEFAULT_CHART_WORKBOOK_MODE = "full" # Chart data workbook: "full", "shared" (dedupe identical data) or "cached"
+DEFAULT_DOWNSAMPLE_POINTS = 2000 # Points kept per series when add_chart downsamples
+DEFAULT_PICTURE_MAX_DPI = None # Downscale pictures above this resolution at their on-slide size; None keeps every pixel
+DEFAULT_PICTURE_REENCODE = None # Re-encode pictures on insert: None, "jpeg" or "auto" (smaller of PNG and JPEG)
+DEFAULT_JPEG_QUALITY = 85 # Quality of JPEGs written when pictures are downscaled or re-encoded
+DEFAULT_PICTURE_WORKERS = None # Threads used by PyPPT.add_pictures; None uses ThreadPoolExecutor's default
 
 # Title formatting constants
 DEFAULT_TITLE_FONT_NAME = "Arial" # Default font for titles
@@ -19,3 +35,16 @@ DEFAULT_SUBTITLE_ALIGNMENT = None
 DEFAULT_FOOTER_FONT_NAME = "Arial"
 DEFAULT_FOOTER_FONT_SIZE_PT = 12
 DEFAULT_FOOTER_ALIGNMENT = None
+
+# Mail merge constants
+DEFAULT_MERGE_STRICT = True # Raise KeyError when a template token has no value
+
+# Batch rendering constants
+DEFAULT_BATCH_CHUNKSIZE = 8 # Payloads sent to a worker process per task
+DEFAULT_BATCH_FILENAME = "deck_{index:05d}.pptx" # Output file name pattern for render_many
+
+# Scanning constants
+DEFAULT_SCAN_CHUNKSIZE = 16 # Files sent to a worker process per task by scan_many
+
+# Slide memo constants
+DEFAULT_MEMO_MAX_BYTES = 256 * 1024 * 1024 # Disk space of a SlideMemo cache before least recently used slides are removed
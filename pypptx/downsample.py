@@ -0,0 +1,189 @@
+# downsample.py in pypptx directory
+#
+# Downsampling of long chart series. A chart cannot show more points than it
+# is wide in pixels, but every point still ends up in the chart XML and the
+# embedded workbook. These functions pick a bounded subset of the points with
+# one of three algorithms:
+#
+# - "lttb": Largest-Triangle-Three-Buckets. Keeps the points that preserve the
+#   visual shape of the line best.
+# - "minmax": the minimum and maximum of each bucket. Keeps every spike.
+# - "stride": every n-th point. Cheapest, but can drop peaks.
+
+import warnings
+
+import numpy as np
+
+from .chart_data import ArrayCategoryChartData, array_chart_data
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax", "stride")
+
+
+class DownsampleReport:
+    """How much a chart's data was reduced by downsampling."""
+
+    __slots__ = ("method", "max_points", "original_points", "kept_points")
+
+    def __init__(self, method, max_points, original_points, kept_points):
+        self.method = method
+        self.max_points = max_points
+        self.original_points = original_points  # categories before downsampling
+        self.kept_points = kept_points          # categories written to the chart
+
+    @property
+    def reduction(self):
+        """float: Fraction of the points removed, from 0.0 (none) to just under 1.0."""
+        return 1 - self.kept_points / self.original_points
+
+    def __repr__(self):
+        return (f"DownsampleReport(method={self.method!r}, original_points={self.original_points}, "
+                f"kept_points={self.kept_points}, reduction={self.reduction:.1%})")
+
+
+def _buckets(values, n_buckets, fill):
+    """Splits `values` into at most `n_buckets` equal buckets, padding the last one with `fill`.
+
+    Returns the (buckets, bucket size) array and the bucket size.
+    """
+    size = -(-len(values) // n_buckets)
+    n_buckets = -(-len(values) // size)
+    padded = np.full(n_buckets * size, fill, dtype=float)
+    padded[:len(values)] = values
+    return padded.reshape(n_buckets, size), size
+
+
+def stride_indices(n_points, max_points):
+    """Returns `max_points` evenly spaced indices into a series of `n_points`, first and last included."""
+    return np.unique(np.linspace(0, n_points - 1, max_points).round().astype(np.int64))
+
+
+def minmax_indices(y, max_points):
+    """Returns the indices of the minimum and maximum of each of (max_points - 2) // 2 buckets of `y`.
+
+    NaN values are ignored; a bucket holding only NaN contributes its first index.
+    The first and last points are always kept.
+    """
+    y = np.asarray(y, dtype=float)
+    n_buckets = max(1, (max_points - 2) // 2)
+    missing = np.isnan(y)
+    lows, size = _buckets(np.where(missing, np.inf, y), n_buckets, np.inf)
+    highs, _ = _buckets(np.where(missing, -np.inf, y), n_buckets, -np.inf)
+    offsets = np.arange(len(lows)) * size
+    indices = np.concatenate(([0, len(y) - 1], offsets + lows.argmin(axis=1), offsets + highs.argmax(axis=1)))
+    return np.unique(indices[indices < len(y)])
+
+
+def lttb_indices(x, y, max_points):
+    """Returns the indices of the `max_points` points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept. The points in between are split
+    into max_points - 2 buckets; from each bucket the point forming the largest
+    triangle with the point kept from the previous bucket and the average of the
+    next bucket is kept. Bucket averages and triangle areas are computed with
+    array operations; only the walk from bucket to bucket is a Python loop.
+    NaN values are never picked unless a whole bucket is NaN.
+
+    Args:
+        x (np.ndarray): Point positions (float).
+        y (np.ndarray): Point values (float, may contain NaN).
+        max_points (int): Number of points to keep (at least 3).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bucket_x, size = _buckets(x[1:-1], max_points - 2, np.nan)
+    bucket_y, _ = _buckets(y[1:-1], max_points - 2, np.nan)
+    n_buckets = len(bucket_x)
+
+    # Average of the next bucket for each bucket; the last bucket's "next bucket" is the last point.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # mean of an all-NaN bucket
+        next_x = np.append(np.nanmean(bucket_x, axis=1), x[-1])[1:]
+        next_y = np.append(np.nanmean(bucket_y, axis=1), y[-1])[1:]
+    next_y[np.isnan(next_y)] = 0.0
+
+    kept = np.empty(n_buckets + 2, dtype=np.int64)
+    kept[0], kept[-1] = 0, len(y) - 1
+    a_x, a_y = x[0], y[0] if not np.isnan(y[0]) else 0.0
+    for bucket in range(n_buckets):
+        bx, by = bucket_x[bucket], bucket_y[bucket]
+        # Twice the triangle area; the constant factor does not change the argmax.
+        areas = np.abs((a_x - next_x[bucket]) * (by - a_y) - (a_x - bx) * (next_y[bucket] - a_y))
+        best = int(np.argmax(np.where(np.isnan(areas), -1.0, areas)))
+        kept[bucket + 1] = 1 + bucket * size + best
+        a_x, a_y = bx[best], by[best] if not np.isnan(by[best]) else a_y
+    return np.unique(kept)
+
+
+def _positions(categories):
+    """Numeric x positions of the categories: their values for numbers and dates, else 0, 1, 2, ..."""
+    kind = categories.dtype.kind
+    if kind == "M":
+        return categories.astype("datetime64[ns]").astype(np.int64).astype(float)
+    if kind in "iuf":
+        return categories.astype(float)
+    return np.arange(len(categories), dtype=float)
+
+
+def downsample_indices(categories, series_values, max_points, method):
+    """Returns the sorted indices of at most `max_points` categories to keep.
+
+    The budget is split evenly between the series: each one is downsampled on its
+    own to max_points // len(series_values) points and the chart keeps the union
+    of the indices picked, which can never exceed `max_points`. When that share
+    is below the 3 points "lttb" and "minmax" need, "stride" is used instead.
+
+    Args:
+        categories (np.ndarray): 1-D category array.
+        series_values (list[np.ndarray]): One value array per series, aligned with categories.
+        max_points (int): Categories kept in total.
+        method (str): One of DOWNSAMPLE_METHODS.
+    """
+    n_points = len(categories)
+    points_per_series = max_points // max(1, len(series_values))
+    if method == "stride" or points_per_series < 3:
+        return stride_indices(n_points, max_points)
+    x = _positions(categories) if method == "lttb" else None
+    picked = [lttb_indices(x, values, points_per_series) if method == "lttb"
+              else minmax_indices(values, points_per_series)
+              for values in series_values]
+    return np.unique(np.concatenate(picked))
+
+
+def downsample_chart_data(chart_data, max_points, method):
+    """Returns chart data with at most `max_points` categories, and a DownsampleReport.
+
+    Chart data that is already short enough is returned unchanged. With several
+    series the points are shared out between them (see downsample_indices).
+
+    Args:
+        chart_data (CategoryChartData or ArrayCategoryChartData): The full chart data.
+        max_points (int): Most categories (points per series) the chart keeps.
+        method (str): "lttb", "minmax" or "stride".
+
+    Returns:
+        tuple: (ArrayCategoryChartData or the given chart data, DownsampleReport).
+
+    Raises:
+        ValueError: If method is not one of DOWNSAMPLE_METHODS or max_points is too small.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"downsample must be one of {DOWNSAMPLE_METHODS}, not {method!r}.")
+    if not isinstance(max_points, int) or max_points < 3:
+        raise ValueError(f"max_points must be an integer of at least 3, not {max_points!r}.")
+
+    if isinstance(chart_data, ArrayCategoryChartData):
+        categories = chart_data._category_array
+        series = chart_data._series_arrays
+    else:
+        labels = [category.label for category in chart_data.categories]
+        categories = np.array(labels, dtype="datetime64[D]") if chart_data.categories.are_dates else np.asarray(labels)
+        series = [(s.name, np.array([np.nan if v is None else v for v in s.values], dtype=float))
+                  for s in chart_data]
+    n_points = len(categories)
+    if n_points <= max_points:
+        return chart_data, DownsampleReport(method, max_points, n_points, n_points)
+
+    keep = downsample_indices(categories, [values for _, values in series], max_points, method)
+    reduced = array_chart_data(categories[keep], [(name, values[keep]) for name, values in series],
+                               chart_data.number_format)
+    return reduced, DownsampleReport(method, max_points, n_points, len(keep))
@@ -0,0 +1,63 @@
+# fragments.py in pypptx directory
+#
+# Builders for small DrawingML text fragments (paragraphs, runs, paragraph
+# properties). The markup matches what python-pptx writes when the same text
+# and font properties are set through its object API, so bulk writers can
+# emit XML strings directly without changing the resulting document.
+
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.dml.color import RGBColor
+from pptx.util import Pt
+
+# Same set python-pptx escapes as "_xHHHH_" when run text is assigned.
+_CTRL_CHARS_RE = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+def escape_run_text(text):
+    """Escapes control characters (as python-pptx does) and XML special characters."""
+    if _CTRL_CHARS_RE.search(text):
+        text = _CTRL_CHARS_RE.sub(lambda match: "_x%04X_" % ord(match.group(1)), text)
+    return escape(text)
+
+
+def pPr_xml(font_name=None, font_size=None, bold=False, font_color_rgb=None):
+    """Returns the <a:pPr> markup for the given paragraph font settings, or "" if none apply.
+
+    Attribute and child order match what python-pptx writes when the same
+    properties are set through paragraph.font (name and size, then bold, then color).
+    """
+    attrs = ""
+    if font_size:
+        attrs += ' sz="%d"' % Pt(font_size).centipoints
+    if bold:
+        attrs += ' b="1"'
+
+    children = ""
+    if font_color_rgb:
+        children += '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % str(RGBColor(*font_color_rgb))
+    if font_name:
+        children += "<a:latin typeface=%s/>" % quoteattr(font_name)
+
+    if not attrs and not children:
+        return ""
+    return "<a:pPr><a:defRPr%s>%s</a:defRPr></a:pPr>" % (attrs, children)
+
+
+def paragraphs_xml(text, paragraph_pPr_xml=""):
+    """Returns the <a:p> markup for `text`, as assigning to `TextFrame.text` would produce.
+
+    A line-feed starts a new paragraph and a vertical-tab becomes a line break.
+    Each paragraph gets `paragraph_pPr_xml` (see pPr_xml) as its properties.
+    """
+    paragraphs = []
+    for p_text in text.split("\n"):
+        content = []
+        for idx, r_text in enumerate(p_text.split("\v")):
+            if idx > 0:
+                content.append("<a:br/>")
+            if r_text:
+                content.append("<a:r><a:t>%s</a:t></a:r>" % escape_run_text(r_text))
+        paragraphs.append("<a:p>%s%s</a:p>" % (paragraph_pPr_xml, "".join(content)))
+    return "".join(paragraphs)
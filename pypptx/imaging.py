@@ -0,0 +1,150 @@
+# imaging.py in pypptx directory
+#
+# Downscaling and re-encoding of pictures before they are stored in a deck.
+# A picture never needs more pixels than its size on the slide times the
+# resolution it will be viewed or printed at; a 12-megapixel screenshot shown
+# at 3 x 2 inches is mostly wasted bytes. Decoding, resampling and encoding
+# happen inside Pillow with the GIL released, so many images can be prepared
+# in parallel with a thread pool.
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+
+from .constants import DEFAULT_JPEG_QUALITY
+
+_EMU_PER_INCH = 914400
+_EXIF_ORIENTATION = 0x0112
+
+# Accepted values of the `reencode` argument (None keeps the image's format).
+REENCODE_MODES = ("jpeg", "auto")
+
+# Formats written unchanged when only downscaling; anything else becomes PNG.
+_KEPT_FORMATS = {"PNG": "PNG", "JPEG": "JPEG"}
+_PNG_MODES = ("1", "L", "LA", "P", "RGB", "RGBA", "I", "I;16")
+
+
+def _has_alpha(image):
+    return image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def _encode(image, image_format, dpi, quality):
+    buffer = io.BytesIO()
+    if image_format == "JPEG":
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=quality, optimize=True, dpi=dpi)
+    else:
+        if image.mode not in _PNG_MODES:
+            image = image.convert("RGBA" if _has_alpha(image) else "RGB")
+        image.save(buffer, format="PNG", optimize=True, dpi=dpi)
+    return buffer.getvalue()
+
+
+def target_pixels(px_size, dpi, cx=None, cy=None):
+    """Returns the (width, height) in pixels an image needs at `dpi` for its size on the slide.
+
+    Args:
+        px_size (tuple[int, int]): The image's size in pixels.
+        dpi (float): Target resolution in dots per inch.
+        cx (int, optional): Width on the slide in EMU.
+        cy (int, optional): Height on the slide in EMU. If only one of cx and cy is
+                            given, the other follows from the image's aspect ratio.
+
+    Returns:
+        tuple[int, int] or None: None if neither cx nor cy is given.
+    """
+    width_px, height_px = px_size
+    if cx is None and cy is None:
+        return None
+    # The picture is shown at cx x cy, so each axis needs that many inches times dpi.
+    if cx is None:
+        cx = cy * width_px / height_px
+    if cy is None:
+        cy = cx * height_px / width_px
+    return (max(1, round(cx / _EMU_PER_INCH * dpi)), max(1, round(cy / _EMU_PER_INCH * dpi)))
+
+
+def prepare_image(blob, cx=None, cy=None, max_dpi=None, reencode=None, quality=DEFAULT_JPEG_QUALITY):
+    """Returns `blob` downscaled to `max_dpi` at its on-slide size and/or re-encoded.
+
+    The image is only changed if that makes it smaller: it is never upscaled, and
+    a re-encoded or resized version larger than the original is discarded. Images
+    Pillow cannot open (e.g. SVG, EMF) and animations are returned unchanged.
+
+    Args:
+        blob (bytes): The original image.
+        cx (int, optional): Width on the slide in EMU.
+        cy (int, optional): Height on the slide in EMU. Without cx and cy the image
+                            is not resized (its on-slide size is not known).
+        max_dpi (float, optional): Resolution to downscale to. None never resizes.
+        reencode (str, optional): "jpeg" stores opaque images as JPEG (images with
+            transparency stay PNG); "auto" keeps whichever of PNG and JPEG is smaller
+            (JPEG only for opaque images). None keeps the original format.
+        quality (int): JPEG quality. Defaults to DEFAULT_JPEG_QUALITY.
+
+    Returns:
+        bytes: The prepared image, or `blob` itself if nothing was gained.
+
+    Raises:
+        ValueError: If reencode or max_dpi is not valid.
+    """
+    if reencode is not None and reencode not in REENCODE_MODES:
+        raise ValueError(f"reencode must be one of {REENCODE_MODES} or None, not {reencode!r}.")
+    if max_dpi is not None and not max_dpi > 0:
+        raise ValueError(f"max_dpi must be a positive number, not {max_dpi!r}.")
+    try:
+        image = Image.open(io.BytesIO(blob))
+    except (OSError, SyntaxError):
+        return blob
+    if getattr(image, "n_frames", 1) > 1:
+        return blob
+
+    # EXIF orientations 5-8 turn the picture by 90 degrees when it is displayed.
+    px_size = image.size
+    if image.getexif().get(_EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+        px_size = px_size[::-1]
+    resize_to = None
+    if max_dpi is not None:
+        target = target_pixels(px_size, max_dpi, cx, cy)
+        if target is not None and target[0] < px_size[0] and target[1] < px_size[1]:
+            resize_to = target
+    if resize_to is None and reencode is None:
+        return blob
+
+    source_format = image.format
+    # The pixels are rewritten without the EXIF block, so its orientation is applied to them.
+    image = ImageOps.exif_transpose(image)
+    dpi = image.info.get("dpi", (72, 72))
+    if resize_to is not None:
+        image = image.resize(resize_to, Image.LANCZOS, reducing_gap=3.0)
+        # Fewer pixels at a proportionally lower dpi keep the image's native size in inches.
+        dpi = (max_dpi, max_dpi)
+
+    candidates = []
+    kept_format = _KEPT_FORMATS.get(source_format, "PNG")
+    if reencode is None or _has_alpha(image):
+        candidates.append(kept_format if reencode is None else "PNG")
+    elif reencode == "jpeg":
+        candidates.append("JPEG")
+    else:
+        candidates.extend(("PNG", "JPEG"))
+    encoded = min((_encode(image, image_format, dpi, quality) for image_format in candidates), key=len)
+    return encoded if len(encoded) < len(blob) else blob
+
+
+def prepare_images(jobs, workers=None):
+    """Runs prepare_image for many images in a thread pool.
+
+    Args:
+        jobs (list[dict]): Keyword arguments of prepare_image for each image.
+        workers (int, optional): Number of threads. Defaults to ThreadPoolExecutor's default.
+
+    Returns:
+        list[bytes]: The prepared images, in the order of `jobs`.
+    """
+    if len(jobs) < 2:
+        return [prepare_image(**job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda job: prepare_image(**job), jobs))
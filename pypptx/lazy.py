@@ -0,0 +1,129 @@
+# lazy.py in pypptx directory
+#
+# Lazy loading of slide content. python-pptx parses the XML of every part when
+# a deck is opened, so opening a deck with thousands of slides costs seconds
+# even if only a few of them are edited. A lazily opened deck keeps the XML of
+# each slide, notes slide and chart as the bytes read from the file and parses
+# it the first time the part's content is used. Until then the part saves
+# those bytes unchanged. The presentation part, masters, layouts and themes
+# are parsed up front as usual.
+
+from pptx.api import _is_pptx_package
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.package import PartFactory, _PackageLoader
+from pptx.opc.packuri import PACKAGE_URI
+from pptx.oxml import parse_xml
+from pptx.package import Package
+from pptx.parts.chart import ChartPart
+from pptx.parts.slide import NotesSlidePart, SlidePart
+from pptx.util import lazyproperty
+
+
+class LazyXmlPartMixin:
+    """Makes an XmlPart subclass parse its XML on first access instead of when loaded."""
+
+    _parsed = None    # the parsed root element, once parsed
+    _xml_blob = None  # the XML as loaded, until parsed
+
+    @classmethod
+    def load(cls, partname, content_type, package, blob):
+        part = cls(partname, content_type, package, None)
+        part._xml_blob = blob
+        return part
+
+    @property
+    def _element(self):
+        if self._parsed is None:
+            self._parsed = parse_xml(self._xml_blob)
+            self._xml_blob = None
+        return self._parsed
+
+    @_element.setter
+    def _element(self, element):
+        self._parsed = element
+
+    @property
+    def is_parsed(self):
+        """bool: Whether the part's XML has been parsed."""
+        return self._xml_blob is None
+
+    @property
+    def blob(self):
+        """bytes: The XML as loaded while the part is unparsed, else its serialization."""
+        if self._xml_blob is not None:
+            return self._xml_blob
+        return super().blob
+
+
+class LazySlidePart(LazyXmlPartMixin, SlidePart):
+    """SlidePart parsed on first access."""
+
+
+class LazyNotesSlidePart(LazyXmlPartMixin, NotesSlidePart):
+    """NotesSlidePart parsed on first access."""
+
+
+class LazyChartPart(LazyXmlPartMixin, ChartPart):
+    """ChartPart parsed on first access."""
+
+
+_LAZY_PART_TYPES = {
+    CT.PML_SLIDE: LazySlidePart,
+    CT.PML_NOTES_SLIDE: LazyNotesSlidePart,
+    CT.DML_CHART: LazyChartPart,
+}
+
+
+def _load_part(partname, content_type, package, blob):
+    """Loads a part as PartFactory does, with the lazy classes for slides, notes slides and charts."""
+    part_cls = _LAZY_PART_TYPES.get(content_type)
+    if part_cls is None:
+        part_cls = PartFactory._part_cls_for(content_type)
+    return part_cls.load(partname, content_type, package, blob)
+
+
+class _LazyPackageLoader(_PackageLoader):
+    """_PackageLoader that builds its parts with _load_part instead of PartFactory."""
+
+    @lazyproperty
+    def _parts(self):
+        content_types = self._content_types
+        package = self._package
+        package_reader = self._package_reader
+        return {
+            partname: _load_part(partname, content_types[partname], package, package_reader[partname])
+            for partname in (p for p in self._xml_rels if p != "/")
+            if partname in package_reader
+        }
+
+
+class _LazyPackage(Package):
+    """Package loaded through _LazyPackageLoader; otherwise a plain python-pptx package."""
+
+    def _load(self):
+        pkg_xml_rels, parts = _LazyPackageLoader.load(self._pkg_file, self)
+        self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        return self
+
+
+def open_lazy(pptx_file):
+    """Opens a presentation whose slides, notes slides and charts are parsed on first use.
+
+    The lazy part classes are chosen by the loader of this one package, so
+    python-pptx's content-type registry PartFactory.part_type_for is left as
+    it is and decks opened elsewhere, in any thread, load as usual.
+
+    Args:
+        pptx_file (str or file-like): Path to a .pptx file, or a binary file-like object.
+
+    Returns:
+        pptx.presentation.Presentation: The opened presentation.
+
+    Raises:
+        ValueError: If the file is not a PowerPoint presentation.
+    """
+    presentation_part = _LazyPackage.open(pptx_file).main_document_part
+    if not _is_pptx_package(presentation_part):
+        raise ValueError(f"file '{pptx_file}' is not a PowerPoint file, "
+                         f"content type is '{presentation_part.content_type}'")
+    return presentation_part.presentation
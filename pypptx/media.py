@@ -0,0 +1,341 @@
+# media.py in pypptx directory
+#
+# Content-addressed image parts. python-pptx's add_picture reads and hashes
+# the image file on every call, then looks for an existing part with the same
+# image by walking every relationship in the package and hashing each image
+# part found, and finally opens the image twice more to get its pixel size
+# and DPI. Here each package gets a registry of its image parts keyed by SHA1,
+# which also remembers the native size of each image and the hash of each
+# image file already read (by path, modification time and size). Inserting an
+# image already in the deck costs two dictionary lookups.
+
+import hashlib
+import os
+import weakref
+
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image, ImagePart
+from pptx.util import Emu
+
+from .imaging import prepare_images
+
+_EMU_PER_INCH = 914400
+
+_IMAGE_PARTNAME_PREFIX = "/ppt/media/image"
+
+# Package -> MediaRegistry. Registries hold their parts by weak reference only,
+# since parts refer back to their package.
+_MEDIA_REGISTRIES = weakref.WeakKeyDictionary()
+
+
+class _MediaEntry:
+    """An image part in the registry and its native size, measured on first use."""
+
+    __slots__ = ("part_ref", "native_size")
+
+    def __init__(self, part, native_size=None):
+        self.part_ref = weakref.ref(part)
+        self.native_size = native_size  # (cx, cy) in EMU
+
+
+def _read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _native_size(image):
+    """Native (cx, cy) of a pptx.parts.image.Image in EMU, as ImagePart computes it."""
+    width_px, height_px = image.size
+    horz_dpi, vert_dpi = image.dpi
+    return Emu(int(_EMU_PER_INCH * width_px / horz_dpi)), Emu(int(_EMU_PER_INCH * height_px / vert_dpi))
+
+
+def scale_size(native_size, cx, cy):
+    """Returns the (cx, cy) of a picture, filling a missing dimension from the aspect ratio.
+
+    Same rules as python-pptx's ImagePart.scale: with neither dimension given the
+    native size is used, with both given they are used as they are.
+    """
+    native_cx, native_cy = native_size
+    if cx and cy:
+        return cx, cy
+    if cx:
+        return cx, Emu(int(round(native_cy * float(cx) / native_cx)))
+    if cy:
+        return Emu(int(round(native_cx * float(cy) / native_cy))), cy
+    return native_cx, native_cy
+
+
+class MediaRegistry:
+    """Image parts of one package, indexed by the SHA1 of their content.
+
+    Use media_registry(package) to get the registry of a package.
+
+    Args:
+        package (pptx.package.Package): The package whose existing images seed the registry.
+    """
+
+    def __init__(self, package):
+        # sha1 -> _MediaEntry. Images already in the package (e.g. from a template) are hashed once here.
+        self._by_sha1 = {}
+        # Numbers n of the /ppt/media/image<n>.* partnames in the package or handed out by next_image_partname.
+        self._image_idxs = set()
+        self._next_image_idx = 1
+        for part in package.iter_parts():
+            if part.partname.startswith(_IMAGE_PARTNAME_PREFIX) and part.partname.idx is not None:
+                self._image_idxs.add(part.partname.idx)
+            if isinstance(part, ImagePart):
+                self._by_sha1.setdefault(part.sha1, _MediaEntry(part))
+        self._by_file = {}  # (abspath, mtime_ns, size) -> sha1 of that file's content
+        self._prepared = {}  # (source sha1, cx, cy, max_dpi, reencode, quality) -> sha1 of the prepared image
+        self._source_sizes = {}  # sha1 -> size in bytes of the image it was prepared from
+        self.hits = 0
+        self.misses = 0
+
+    def _live_entry(self, sha1):
+        """Returns the entry for `sha1` if its part still exists, else None.
+
+        The part may have left the package (e.g. its slide was deleted) and is then
+        put back by relating to it again. That is safe because its partname stays
+        reserved: next_image_partname never hands out a number twice.
+        """
+        entry = self._by_sha1.get(sha1) if sha1 is not None else None
+        if entry is not None and entry.part_ref() is not None:
+            return entry
+        return None
+
+    def next_image_partname(self, ext):
+        """Returns a free partname '/ppt/media/image<n>.<ext>', as Package.next_image_partname does.
+
+        media_registry installs this method on its package, so image parts added
+        through python-pptx directly are named here as well. Unlike python-pptx,
+        the package is not walked on each call and the number of an image part
+        that left the package is not given to a new one.
+        """
+        n = self._next_image_idx
+        while n in self._image_idxs:
+            n += 1
+        self._image_idxs.add(n)
+        self._next_image_idx = n + 1
+        return PackURI("%s%d.%s" % (_IMAGE_PARTNAME_PREFIX, n, ext))
+
+    def _source(self, image_file):
+        """Returns (sha1, blob, filename) of `image_file`.
+
+        blob is None for a file already read from the same path, unchanged on disk:
+        its hash is known and it is only read again if its content is needed.
+        """
+        if isinstance(image_file, (str, os.PathLike)):
+            stat = os.stat(image_file)
+            file_key = (os.path.abspath(image_file), stat.st_mtime_ns, stat.st_size)
+            filename = os.path.basename(image_file)
+            sha1 = self._by_file.get(file_key)
+            if sha1 is not None:
+                return sha1, None, filename
+            blob = _read_file(image_file)
+            sha1 = self._by_file[file_key] = hashlib.sha1(blob).hexdigest()
+            return sha1, blob, filename
+        if isinstance(image_file, (bytes, bytearray, memoryview)):
+            blob = bytes(image_file)
+        else:
+            blob = image_file.read()
+        return hashlib.sha1(blob).hexdigest(), blob, None
+
+    def _add(self, package, sha1, blob, filename, source_size):
+        """Adds a new image part for `blob` and registers it under `sha1`."""
+        self.misses += 1
+        image = Image.from_blob(blob, filename)
+        part = ImagePart.new(package, image)
+        entry = self._by_sha1[sha1] = _MediaEntry(part, _native_size(image))
+        self._source_sizes[sha1] = source_size
+        return part, entry.native_size
+
+    def get_or_add_image(self, package, image_file):
+        """Returns the image part holding `image_file` and its native size, adding the part if needed.
+
+        Args:
+            package (pptx.package.Package): The package the image belongs to.
+            image_file (str, os.PathLike, bytes or file-like): Path to the image, the image
+                bytes, or a binary file-like object positioned at the start of the image.
+
+        Returns:
+            tuple: (pptx.parts.image.ImagePart, (cx, cy) native size in EMU).
+        """
+        sha1, blob, filename = self._source(image_file)
+        entry = self._live_entry(sha1)
+        if entry is not None:
+            return self._hit(entry)
+        if blob is None:
+            blob = _read_file(image_file)
+        return self._add(package, sha1, blob, filename, len(blob))
+
+    def get_or_add_copy(self, package, image_part):
+        """Returns the image part of `package` with the same content as `image_part`, copying it if needed.
+
+        Used to bring images over from another presentation. The copy keeps the
+        content type and extension of `image_part`, so formats python-pptx cannot
+        measure (e.g. EMF) are copied as well.
+
+        Args:
+            package (pptx.package.Package): The package the image is needed in.
+            image_part (pptx.parts.image.ImagePart): An image part of any package.
+
+        Returns:
+            pptx.parts.image.ImagePart: An image part of `package`.
+        """
+        entry = self._live_entry(image_part.sha1)
+        if entry is not None:
+            self.hits += 1
+            return entry.part_ref()
+        self.misses += 1
+        part = ImagePart.load(self.next_image_partname(image_part.partname.ext), image_part.content_type,
+                              package, image_part.blob)
+        self._by_sha1[image_part.sha1] = _MediaEntry(part)
+        return part
+
+    def get_or_add_prepared(self, package, images, max_dpi, reencode, quality, workers=None):
+        """Like get_or_add_image for many images, each downscaled and/or re-encoded first.
+
+        Every distinct (image, on-slide size, settings) combination is prepared once
+        per presentation; the prepared images that are not known yet are produced
+        in parallel by imaging.prepare_images.
+
+        Args:
+            package (pptx.package.Package): The package the images belong to.
+            images (list[tuple]): (image_file, cx, cy) for each picture; cx and cy are the
+                                  on-slide size in EMU or None.
+            max_dpi (float, optional): See imaging.prepare_image.
+            reencode (str, optional): See imaging.prepare_image.
+            quality (int): See imaging.prepare_image.
+            workers (int, optional): Threads used to prepare the images.
+
+        Returns:
+            list[tuple]: (ImagePart, native size) for each entry of `images`.
+        """
+        results = [None] * len(images)
+        pending = {}  # preparation key -> [job, filename, source size, result positions]
+        for position, (image_file, cx, cy) in enumerate(images):
+            sha1, blob, filename = self._source(image_file)
+            key = (sha1, cx, cy, max_dpi, reencode, quality)
+            entry = self._live_entry(self._prepared.get(key))
+            if entry is not None:
+                results[position] = self._hit(entry)
+            elif key in pending:
+                pending[key][3].append(position)
+            else:
+                if blob is None:
+                    blob = _read_file(image_file)
+                job = {"blob": blob, "cx": cx, "cy": cy, "max_dpi": max_dpi,
+                       "reencode": reencode, "quality": quality}
+                pending[key] = [job, filename, len(blob), [position]]
+
+        prepared_blobs = prepare_images([job for job, _, _, _ in pending.values()], workers)
+        for (key, (_, filename, source_size, positions)), blob in zip(pending.items(), prepared_blobs):
+            sha1 = self._prepared[key] = hashlib.sha1(blob).hexdigest()
+            entry = self._live_entry(sha1)
+            result = self._hit(entry) if entry is not None else self._add(package, sha1, blob, filename, source_size)
+            for position in positions:
+                results[position] = result
+            self.hits += len(positions) - 1
+        return results
+
+    def _hit(self, entry):
+        self.hits += 1
+        part = entry.part_ref()
+        if entry.native_size is None:
+            entry.native_size = _native_size(part.image)
+        return part, entry.native_size
+
+    def replace_parts(self, replacements):
+        """Points the entries of replaced parts at the parts replacing them.
+
+        Args:
+            replacements (dict): Original part -> part replacing it in the package.
+        """
+        for entry in self._by_sha1.values():
+            part = entry.part_ref()
+            replacement = replacements.get(part) if part is not None else None
+            if replacement is not None:
+                if entry.native_size is None:
+                    entry.native_size = _native_size(part.image)
+                entry.part_ref = weakref.ref(replacement)
+
+    def info(self):
+        """Returns registry statistics.
+
+        Returns:
+            dict: 'hits' (images found in the registry), 'misses' (image parts added)
+                  and 'size' (distinct images registered).
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._by_sha1)}
+
+
+def media_registry(package):
+    """Returns the MediaRegistry of `package`, creating it on first use."""
+    registry = _MEDIA_REGISTRIES.get(package)
+    if registry is None:
+        registry = _MEDIA_REGISTRIES[package] = MediaRegistry(package)
+        # From now on every image part of the package is named by the registry (see next_image_partname).
+        package.next_image_partname = registry.next_image_partname
+    return registry
+
+
+def replace_media_parts(package, replacements):
+    """Makes the registry of `package` hand out replacement parts instead of the parts they replace.
+
+    StreamingPPT swaps the image parts it has written for content-free stand-ins;
+    pictures of later slides showing the same image are related to the stand-in
+    rather than storing the image a second time. Does nothing for a package
+    without a registry.
+
+    Args:
+        package (pptx.package.Package): The package the parts belong to.
+        replacements (dict): Original part -> part replacing it in the package.
+    """
+    registry = _MEDIA_REGISTRIES.get(package)
+    if registry is not None:
+        registry.replace_parts(replacements)
+
+
+class MediaReport:
+    """Sizes of the images stored in a presentation, against an optional budget."""
+
+    __slots__ = ("images", "budget_bytes")
+
+    def __init__(self, images, budget_bytes=None):
+        self.images = images  # (partname, stored bytes, original bytes) for each image part
+        self.budget_bytes = budget_bytes
+
+    @property
+    def total_bytes(self):
+        """int: Bytes taken by the images (before zip compression)."""
+        return sum(stored for _, stored, _ in self.images)
+
+    @property
+    def original_bytes(self):
+        """int: Bytes the images took before they were downscaled or re-encoded."""
+        return sum(original for _, _, original in self.images)
+
+    @property
+    def saved_bytes(self):
+        """int: Bytes saved by downscaling and re-encoding."""
+        return self.original_bytes - self.total_bytes
+
+    @property
+    def over_budget(self):
+        """bool: True if a budget was given and the images exceed it."""
+        return self.budget_bytes is not None and self.total_bytes > self.budget_bytes
+
+    def __repr__(self):
+        budget = "" if self.budget_bytes is None else f", budget_bytes={self.budget_bytes}, over_budget={self.over_budget}"
+        return (f"MediaReport(images={len(self.images)}, total_bytes={self.total_bytes}, "
+                f"saved_bytes={self.saved_bytes}{budget})")
+
+
+def media_report(package, budget_bytes=None):
+    """Returns a MediaReport for the image parts currently in `package`, largest first."""
+    source_sizes = media_registry(package)._source_sizes
+    images = [(str(part.partname), len(part.blob), source_sizes.get(part.sha1, len(part.blob)))
+              for part in package.iter_parts() if isinstance(part, ImagePart)]
+    images.sort(key=lambda image: image[1], reverse=True)
+    return MediaReport(images, budget_bytes)
@@ -0,0 +1,461 @@
+# memo.py in pypptx directory
+#
+# Slide-level memoization of generated content. Weekly decks are mostly built
+# from the same data as the week before. SlideMemo keys each generated slide
+# by its builder function and a fingerprint of the builder's input, and keeps
+# the slide's XML together with the parts it depends on (charts and their
+# workbooks, images, notes) in a disk cache. When the same builder is called
+# again with identical input, the stored slide is inserted directly through
+# the same part-copying code as PyPPT.merge, and the builder does not run.
+
+import datetime
+import decimal
+import enum
+import functools
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import types
+
+import numpy as np
+import pandas as pd
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import NotesSlidePart, SlidePart
+
+from .constants import DEFAULT_LAYOUT_REF, DEFAULT_MEMO_MAX_BYTES
+from .parts import (_NOTES_STRUCTURE_RELTYPES, _SLIDE_STRUCTURE_RELTYPES, copy_notes_content,
+                    copy_slide_content, foreign_part_resolver)
+
+# Bumped when the layout of stored entries changes; older entries are then never hit.
+_FORMAT_VERSION = 2
+_ENTRY_SUFFIX = ".slide"
+
+# An entry file is _ENTRY_MAGIC, the length of a JSON header as a little-endian
+# uint64, the header, then the part blobs back to back. The header holds
+# everything but the blobs (content types, relationships, blob sizes); nothing
+# in the file is executed when it is read.
+_ENTRY_MAGIC = b"PYPPTX-SLIDE-MEMO\n"
+_HEADER_SIZE = struct.Struct("<Q")
+
+# Relationships to parts of the deck around the slide; a slide using them beyond
+# its own layout and notes cannot be replayed in another deck.
+_DECK_RELTYPES = (RT.SLIDE, RT.SLIDE_LAYOUT, RT.SLIDE_MASTER, RT.NOTES_MASTER, RT.NOTES_SLIDE)
+
+# Values fingerprinted through their repr(), which is stable for these types.
+_REPR_TYPES = (str, bytes, int, float, complex, bool, type(None), datetime.date, datetime.time,
+               datetime.timedelta, decimal.Decimal, enum.Enum)
+
+
+def _update_code(digest, code):
+    """Adds a code object (and the code objects nested in it) to `digest`."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code(digest, const)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _update(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"DataFrame")
+        digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes],
+                            value.index.names)).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(b"Series")
+        digest.update(repr((value.name, str(value.dtype), value.index.names)).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr(("ndarray", value.dtype.str, value.shape)).encode("utf-8"))
+        if value.dtype.hasobject:
+            _update(digest, value.tolist())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode("utf-8"))
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode("utf-8"))
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, _REPR_TYPES) or isinstance(value, np.generic):
+        digest.update(f"{type(value).__name__}:{value!r}".encode("utf-8"))
+    else:
+        raise TypeError(f"Cannot fingerprint a value of type {type(value).__name__}; "
+                        f"pass DataFrames, arrays, dicts, lists, strings and numbers.")
+
+
+def data_fingerprint(data):
+    """Returns a hex digest identifying `data` by content.
+
+    Supports DataFrames, Series, numpy arrays, dicts, lists, tuples, strings,
+    numbers, dates, enums and None, nested in any way. Equal content gives the
+    same digest in every process.
+
+    Raises:
+        TypeError: If `data` holds a value of another type.
+    """
+    digest = hashlib.sha256()
+    _update(digest, data)
+    return digest.hexdigest()
+
+
+def _update_builder(digest, build_fn):
+    """Adds a builder to `digest`: its code, defaults, closure and bound arguments."""
+    if isinstance(build_fn, functools.partial):
+        digest.update(b"partial")
+        _update_builder(digest, build_fn.func)
+        _update(digest, list(build_fn.args))
+        _update(digest, build_fn.keywords)
+        return
+    if isinstance(build_fn, types.MethodType):
+        digest.update(b"method")
+        _update_builder(digest, build_fn.__func__)
+        _update(digest, build_fn.__self__)
+        return
+    if not isinstance(build_fn, types.FunctionType):
+        raise TypeError(f"Cannot fingerprint a builder of type {type(build_fn).__name__}; "
+                        f"pass a function, a bound method or a functools.partial of one.")
+    digest.update(f"{build_fn.__module__}.{build_fn.__qualname__}".encode("utf-8"))
+    _update_code(digest, build_fn.__code__)
+    _update(digest, list(build_fn.__defaults__ or ()))
+    _update(digest, build_fn.__kwdefaults__ or {})
+    for cell in build_fn.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:  # a cell not yet assigned
+            digest.update(b"empty cell")
+            continue
+        if isinstance(value, (types.FunctionType, types.MethodType, functools.partial)):
+            _update_builder(digest, value)
+        else:
+            _update(digest, value)
+
+
+def builder_fingerprint(build_fn):
+    """Returns a hex digest of a builder function's name, code, defaults and closure.
+
+    Changing the builder's body, its default arguments or the values it closes
+    over changes the digest; so do the arguments bound by a functools.partial
+    and the instance of a bound method. Changes to functions it calls by global
+    name do not; pass a new `version` to SlideMemo.add_slide for those.
+
+    Raises:
+        TypeError: If `build_fn` is not a function, bound method or partial, or its
+                   defaults, closure or bound arguments hold values data_fingerprint
+                   does not support.
+    """
+    digest = hashlib.sha256()
+    _update_builder(digest, build_fn)
+    return digest.hexdigest()
+
+
+def _collect_part(part, parts):
+    """Adds `part` and everything it relates to to `parts` (partname -> stored part)."""
+    if part.partname in parts:
+        return
+    rels = []
+    parts[part.partname] = (part.content_type, part.blob, rels)
+    for rId, rel in part.rels.items():
+        if rel.is_external:
+            rels.append((rId, rel.reltype, RTM.EXTERNAL, rel.target_ref))
+            continue
+        if rel.reltype in _DECK_RELTYPES:
+            raise ValueError("The slide links to other slides or deck parts.")
+        rels.append((rId, rel.reltype, RTM.INTERNAL, str(rel.target_part.partname)))
+        _collect_part(rel.target_part, parts)
+
+
+def _slide_entry(slide_part):
+    """Returns the stored form of a slide, or None if it cannot be stored."""
+    parts = {}
+    stored = {}
+    sources = [("slide", slide_part, _SLIDE_STRUCTURE_RELTYPES)]
+    if slide_part.slide.has_notes_slide:
+        sources.append(("notes", slide_part.notes_slide.part, _NOTES_STRUCTURE_RELTYPES))
+    try:
+        for name, part, structure_reltypes in sources:
+            rels = []
+            for rId, rel in part.rels.items():
+                if rel.reltype in structure_reltypes:
+                    continue
+                if rel.is_external:
+                    rels.append((rId, rel.reltype, RTM.EXTERNAL, rel.target_ref))
+                    continue
+                if rel.reltype in _DECK_RELTYPES:
+                    return None
+                rels.append((rId, rel.reltype, RTM.INTERNAL, str(rel.target_part.partname)))
+                _collect_part(rel.target_part, parts)
+            stored[name] = (part.blob, rels)
+    except ValueError:
+        return None
+    return {"version": _FORMAT_VERSION, "slide": stored["slide"], "notes": stored.get("notes"), "parts": parts}
+
+
+def _relate(part, rels, parts):
+    """Restores the relationships of a detached part, keeping their rIds."""
+    relationships = part.rels
+    for rId, reltype, target_mode, target in rels:
+        target = target if target_mode == RTM.EXTERNAL else parts[target]
+        relationships._rels[rId] = _Relationship(relationships._base_uri, rId, reltype, target_mode, target)
+
+
+def _detached_parts(entry):
+    """Rebuilds the stored parts of an entry outside any package; returns (slide part, notes part or None)."""
+    parts = {partname: PartFactory(PackURI(partname), content_type, None, blob)
+             for partname, (content_type, blob, _) in entry["parts"].items()}
+    for partname, (_, _, rels) in entry["parts"].items():
+        _relate(parts[partname], rels, parts)
+    slide_blob, slide_rels = entry["slide"]
+    slide_part = SlidePart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, slide_blob)
+    _relate(slide_part, slide_rels, parts)
+    notes_part = None
+    if entry["notes"] is not None:
+        notes_blob, notes_rels = entry["notes"]
+        notes_part = NotesSlidePart.load(PackURI("/ppt/notesSlides/notesSlide1.xml"), CT.PML_NOTES_SLIDE,
+                                         None, notes_blob)
+        _relate(notes_part, notes_rels, parts)
+    return slide_part, notes_part
+
+
+def _dump_entry(entry):
+    """Serializes a slide entry (see _slide_entry) to bytes."""
+    blobs = []
+
+    def blob_index(blob):
+        blobs.append(blob)
+        return len(blobs) - 1
+
+    def stored(blob, rels):
+        return [blob_index(blob), rels]
+
+    header = {
+        "version": entry["version"],
+        "slide": stored(*entry["slide"]),
+        "notes": None if entry["notes"] is None else stored(*entry["notes"]),
+        "parts": {partname: [content_type, blob_index(blob), rels]
+                  for partname, (content_type, blob, rels) in entry["parts"].items()},
+    }
+    header["blob_sizes"] = [len(blob) for blob in blobs]
+    header_bytes = json.dumps(header).encode("utf-8")
+    return b"".join([_ENTRY_MAGIC, _HEADER_SIZE.pack(len(header_bytes)), header_bytes, *blobs])
+
+
+def _load_entry(data):
+    """Reads bytes written by _dump_entry back into a slide entry.
+
+    Raises:
+        ValueError: If `data` is not a complete entry of the current format.
+    """
+    if not data.startswith(_ENTRY_MAGIC):
+        raise ValueError("Not a slide memo entry.")
+    offset = len(_ENTRY_MAGIC)
+    (header_size,) = _HEADER_SIZE.unpack_from(data, offset)
+    offset += _HEADER_SIZE.size
+    header = json.loads(data[offset:offset + header_size].decode("utf-8"))
+    if header.get("version") != _FORMAT_VERSION:
+        raise ValueError("Slide memo entry of another format version.")
+    offset += header_size
+    blobs = []
+    for size in header["blob_sizes"]:
+        blobs.append(data[offset:offset + size])
+        offset += size
+    if offset != len(data):
+        raise ValueError("Truncated slide memo entry.")
+
+    def stored(item):
+        return None if item is None else (blobs[item[0]], item[1])
+
+    return {
+        "version": header["version"],
+        "slide": stored(header["slide"]),
+        "notes": stored(header["notes"]),
+        "parts": {partname: (content_type, blobs[index], rels)
+                  for partname, (content_type, index, rels) in header["parts"].items()},
+    }
+
+
+class SlideMemo:
+    """Disk cache of generated slides, keyed by builder function and input data.
+
+    Example:
+        memo = SlideMemo("cache/slides", max_bytes=200 * 1024 * 1024)
+
+        def kpi_slide(slide, kpis):
+            slide.set_title("KPIs")
+            slide.add_table_from_dataframe(kpis, 0.5, 1.5, 9, 4)
+
+        for region, kpis in frames.items():
+            memo.add_slide(ppt, kpi_slide, kpis, layout_ref="Title Only")
+        print(memo.info())  # {'hits': 11, 'misses': 1, 'hit_rate': 0.916..., ...}
+
+    A builder must produce the slide from its arguments alone: its output is
+    reused whenever the builder's code, the layout and the data fingerprint
+    match. Slides linking to other slides are built every time and not stored.
+
+    Args:
+        directory (str): Cache directory, created if missing. Several processes may share it.
+        max_bytes (int): Disk space the entries may take. When exceeded, the least recently
+                         used entries are removed. Defaults to DEFAULT_MEMO_MAX_BYTES.
+
+    Raises:
+        ValueError: If max_bytes is not a positive integer.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MEMO_MAX_BYTES):
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError(f"max_bytes must be a positive integer, not {max_bytes!r}.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._bytes = sum(size for _, size, _ in self._entries())
+        self.hits = 0
+        self.misses = 0
+
+    def _entries(self):
+        """Yields (path, size, last use time) of every entry on disk."""
+        with os.scandir(self.directory) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.endswith(_ENTRY_SUFFIX):
+                    try:
+                        stat = dir_entry.stat()
+                    except FileNotFoundError:  # removed by another process meanwhile
+                        continue
+                    yield dir_entry.path, stat.st_size, stat.st_mtime_ns
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def key(self, build_fn, data, layout, version=None):
+        """Returns the cache key of a slide built by `build_fn` from `data` on `layout`.
+
+        The layout is identified by the content of its part, so same-named layouts
+        of different templates get different keys.
+        """
+        digest = hashlib.sha256()
+        for part in (builder_fingerprint(build_fn), hashlib.sha256(layout.part.blob).hexdigest(),
+                     data_fingerprint(data), repr(version)):
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                entry = _load_entry(entry_file.read())
+            os.utime(path)  # the modification time records the last use, for eviction
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A truncated or foreign file; drop it and rebuild the slide.
+            self._remove(path)
+            return None
+        return entry
+
+    def _store(self, key, entry):
+        data = _dump_entry(entry)
+        if len(data) > self.max_bytes:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as entry_file:
+                entry_file.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._bytes += len(data)
+        if self._bytes > self.max_bytes:
+            self._evict()
+
+    def _remove(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        self._bytes -= size
+
+    def _evict(self):
+        """Removes least recently used entries until they fit in max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._bytes = sum(size for _, size, _ in entries)
+        for path, _, _ in entries:
+            if self._bytes <= self.max_bytes:
+                break
+            self._remove(path)
+
+    def add_slide(self, ppt, build_fn, data, layout_ref=DEFAULT_LAYOUT_REF, version=None):
+        """Adds a slide built by `build_fn(slide, data)`, reusing a stored copy when possible.
+
+        Args:
+            ppt (PyPPT): The presentation to add the slide to.
+            build_fn (callable): Fills the new slide: build_fn(slide, data), slide being a PySlide.
+            data: The builder's input; see data_fingerprint for the supported types.
+            layout_ref (int, str, list or tuple): Layout of the slide (see PyPPT.add_slide).
+            version (optional): Anything with a stable repr(); change it to invalidate stored
+                                slides after changing code the builder calls.
+
+        Returns:
+            PySlide: The new slide.
+
+        Raises:
+            TypeError: If `data` or `build_fn` cannot be fingerprinted (see builder_fingerprint).
+        """
+        layout = ppt.get_layout(layout_ref)
+        key = self.key(build_fn, data, layout, version)
+        entry = self._load(key)
+        pptx_slide = ppt.presentation.slides.add_slide(layout)
+        py_slide = ppt._register_slide(pptx_slide)
+        if entry is None:
+            self.misses += 1
+            build_fn(py_slide, data)
+            entry = _slide_entry(pptx_slide.part)
+            if entry is not None:
+                self._store(key, entry)
+            return py_slide
+
+        self.hits += 1
+        package = pptx_slide.part.package
+        source_slide, source_notes = _detached_parts(entry)
+        resolve_part = foreign_part_resolver(package)
+        copy_slide_content(source_slide, pptx_slide.part, resolve_part)
+        if source_notes is not None:
+            copy_notes_content(source_notes, pptx_slide.part.notes_slide.part, resolve_part)
+        return py_slide
+
+    @property
+    def hit_rate(self):
+        """float: Share of add_slide calls served from the cache (0.0 before the first call)."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def info(self):
+        """Returns cache statistics.
+
+        Returns:
+            dict: 'hits', 'misses', 'hit_rate', 'entries' (stored slides), 'bytes' (their
+                  size on disk) and 'max_bytes'.
+        """
+        entries = list(self._entries())
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate,
+                "entries": len(entries), "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes}
+
+    def clear(self):
+        """Removes every stored slide and resets the statistics."""
+        for path, _, _ in list(self._entries()):
+            self._remove(path)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,181 @@
+# package.py in pypptx directory
+#
+# Writes a python-pptx package to a path or stream with a selectable zip
+# compression. The entries written (content types, package rels, then each
+# part and its rels) are the same, in the same order, as python-pptx's own
+# PackageWriter, which always uses deflate at zlib's default level. When the
+# package was opened from a file, entries that did not change are copied from
+# that file as compressed bytes instead of being compressed again.
+
+import io
+import os
+import struct
+import tempfile
+import zipfile
+import zlib
+
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from .constants import DEFAULT_SAVE_COMPRESSION, DEFAULT_SAVE_COMPRESSLEVEL
+
+# Offset of the (file name length, extra field length) pair in a zip local file header.
+_LOCAL_HEADER_NAME_LENGTHS = 26
+
+# Accepted values of the `compression` argument.
+ZIP_COMPRESSION = {
+    "stored": zipfile.ZIP_STORED,
+    "deflate": zipfile.ZIP_DEFLATED,
+}
+
+
+def zip_compression(compression, compresslevel):
+    """Validates a compression setting and returns the matching zipfile arguments.
+
+    Args:
+        compression (str): "stored" (no compression) or "deflate".
+        compresslevel (int, optional): Deflate level from 0 (fastest) to 9 (smallest).
+                                       None uses zlib's default (6). Must be None for "stored".
+
+    Returns:
+        tuple: (zipfile compression constant, compresslevel).
+
+    Raises:
+        ValueError: If compression or compresslevel is not valid.
+    """
+    if compression not in ZIP_COMPRESSION:
+        raise ValueError(f"compression must be one of {sorted(ZIP_COMPRESSION)}, not {compression!r}.")
+    if compresslevel is not None:
+        if compression == "stored":
+            raise ValueError("compresslevel cannot be used with compression='stored'.")
+        if not isinstance(compresslevel, int) or not 0 <= compresslevel <= 9:
+            raise ValueError(f"compresslevel must be an integer from 0 to 9, not {compresslevel!r}.")
+    return ZIP_COMPRESSION[compression], compresslevel
+
+
+def iter_package_entries(package):
+    """Yields (member name, bytes) for every zip entry of `package`, in python-pptx's save order.
+
+    Args:
+        package (pptx.opc.package.Package): The package to serialize.
+    """
+    parts = tuple(package.iter_parts())
+    yield CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts))
+    yield PACKAGE_URI.rels_uri.membername, package._rels.xml
+    for part in parts:
+        yield part.partname.membername, part.blob
+        if part._rels:
+            yield part.partname.rels_uri.membername, part.rels.xml
+
+
+def _xml_body(blob):
+    """`blob` without its XML declaration, which python-pptx writes differently from PowerPoint."""
+    if blob.startswith(b"<?xml"):
+        return blob.split(b"?>", 1)[-1].lstrip()
+    return blob
+
+
+def _is_unchanged(source_zip, info, blob):
+    """True if zip entry `info` of `source_zip` holds the same content as `blob`."""
+    if info.file_size == len(blob) and info.CRC == zlib.crc32(blob):
+        return True
+    # An unchanged XML part re-serialized by python-pptx only differs in its declaration.
+    if info.filename.endswith((".xml", ".rels")) and abs(info.file_size - len(blob)) <= 64:
+        return _xml_body(source_zip.read(info)) == _xml_body(blob)
+    return False
+
+
+def _copy_raw_entry(source_zip, info, target_zip):
+    """Copies entry `info` of `source_zip` into `target_zip` as compressed bytes, without recompressing."""
+    source_fp = source_zip.fp
+    source_fp.seek(info.header_offset + _LOCAL_HEADER_NAME_LENGTHS)
+    name_length, extra_length = struct.unpack("<HH", source_fp.read(4))
+    source_fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+    data = source_fp.read(info.compress_size)
+
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    # Sizes and CRC go into the local header, so no data descriptor follows the data.
+    zinfo.flag_bits = info.flag_bits & 0x800  # keep the UTF-8 file name flag only
+    zinfo.CRC, zinfo.compress_size, zinfo.file_size = info.CRC, info.compress_size, info.file_size
+    zinfo.header_offset = target_zip.fp.tell()
+    target_zip.fp.write(zinfo.FileHeader())
+    target_zip.fp.write(data)
+    target_zip.start_dir = target_zip.fp.tell()
+    target_zip.filelist.append(zinfo)
+    target_zip.NameToInfo[zinfo.filename] = zinfo
+    target_zip._didModify = True
+
+
+def _write_entries(package, package_zip, source_zip):
+    """Writes the entries of `package`, copying those unchanged from `source_zip`; returns the copy count."""
+    source_entries = {} if source_zip is None else {info.filename: info for info in source_zip.infolist()}
+    copied = 0
+    for membername, blob in iter_package_entries(package):
+        info = source_entries.get(membername)
+        if (info is not None and info.compress_type == package_zip.compression
+                and _is_unchanged(source_zip, info, blob)):
+            _copy_raw_entry(source_zip, info, package_zip)
+            copied += 1
+        else:
+            package_zip.writestr(membername, blob)
+    return copied
+
+
+def write_package(package, file, compression=DEFAULT_SAVE_COMPRESSION,
+                  compresslevel=DEFAULT_SAVE_COMPRESSLEVEL, source=None):
+    """Writes `package` as a .pptx zip to `file`.
+
+    With a `source` .pptx (the file the package was opened from), entries whose
+    content did not change are copied from it as compressed bytes instead of
+    being compressed again. Changes are found by content: each part is compared
+    with the source entry by size and CRC-32 (and, for XML parts, ignoring the
+    XML declaration), so parts changed in any way, including directly through
+    python-pptx, are always written anew. Copying is skipped when an explicit
+    `compresslevel` is given, so every entry gets the requested level.
+
+    Args:
+        package (pptx.opc.package.Package): The package to write.
+        file (str or file-like): Path, or binary file-like object open for writing.
+        compression (str): "stored" or "deflate". Defaults to DEFAULT_SAVE_COMPRESSION.
+        compresslevel (int, optional): Deflate level 0-9. Defaults to DEFAULT_SAVE_COMPRESSLEVEL.
+        source (str, optional): Path of the .pptx the package was read from.
+
+    Returns:
+        int: Number of entries copied unchanged from `source`.
+
+    Raises:
+        ValueError: If the compression setting is not valid.
+    """
+    zip_mode, zip_level = zip_compression(compression, compresslevel)
+    if source is None or zip_level is not None:
+        with zipfile.ZipFile(file, "w", compression=zip_mode, compresslevel=zip_level,
+                             strict_timestamps=False) as package_zip:
+            return _write_entries(package, package_zip, None)
+
+    # Overwriting the source: write next to it and replace it once complete.
+    overwrite = isinstance(file, (str, os.PathLike)) and os.path.exists(file) and os.path.samefile(file, source)
+    target = file
+    if overwrite:
+        handle, target = tempfile.mkstemp(suffix=".pptx", dir=os.path.dirname(os.path.abspath(file)))
+        os.close(handle)
+    try:
+        with zipfile.ZipFile(source) as source_zip, \
+                zipfile.ZipFile(target, "w", compression=zip_mode, strict_timestamps=False) as package_zip:
+            copied = _write_entries(package, package_zip, source_zip)
+        if overwrite:
+            os.replace(target, file)
+    finally:
+        if overwrite and os.path.exists(target):
+            os.remove(target)
+    return copied
+
+
+def package_bytes(package, compression=DEFAULT_SAVE_COMPRESSION, compresslevel=DEFAULT_SAVE_COMPRESSLEVEL,
+                  source=None):
+    """Returns `package` serialized as .pptx bytes (see write_package)."""
+    buffer = io.BytesIO()
+    write_package(package, buffer, compression, compresslevel, source)
+    return buffer.getvalue()
@@ -0,0 +1,275 @@
+# parts.py in pypptx directory
+#
+# Helpers for copying slide XML between slide parts at the package level:
+# re-linking relationships, remapping r:id references and cloning the parts a
+# slide owns (charts, comments, SmartArt diagrams, embedded objects). The target slide may be in
+# another package; callers then decide through a `resolve_part` hook which part
+# each shared relationship (images, media, ...) points to in the target.
+
+import copy
+import re
+from contextlib import contextmanager
+
+from lxml import etree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import ImagePart
+
+from .media import media_registry
+
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# Relationships a slide has to its layout and notes are set up when the slide is
+# created, so they are never copied along with the slide content.
+_SLIDE_STRUCTURE_RELTYPES = (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE)
+
+# Same for a notes slide: its notes master and the slide it belongs to.
+_NOTES_STRUCTURE_RELTYPES = (RT.NOTES_MASTER, RT.SLIDE)
+
+# python-pptx has no constant for the cached drawing of a SmartArt diagram.
+_RT_DIAGRAM_DRAWING = "http://schemas.microsoft.com/office/2007/relationships/diagramDrawing"
+
+# Parts that belong to a single slide and are therefore cloned rather than shared.
+# Only images and media stay shared between a slide and its copies.
+SLIDE_OWNED_RELTYPES = (
+    RT.CHART,
+    RT.COMMENTS,
+    RT.DIAGRAM_DATA, RT.DIAGRAM_LAYOUT, RT.DIAGRAM_QUICK_STYLE, RT.DIAGRAM_COLORS, _RT_DIAGRAM_DRAWING,
+    RT.OLE_OBJECT, RT.PACKAGE,  # embedded objects: OLE binaries and Office documents
+)
+
+
+def remap_rel_ids(element, rId_map):
+    """Rewrites every r:* attribute (r:id, r:embed, r:link, ...) under `element` using `rId_map`.
+
+    Args:
+        element (lxml.etree._Element): Root of the XML to rewrite, modified in place.
+        rId_map (dict): Maps old rIds to new rIds. rIds not in the map are left as is.
+    """
+    if not rId_map:
+        return
+    for attr in etree.ElementBase.xpath(element, ".//@r:*", namespaces={"r": _R_NS}):
+        new_rId = rId_map.get(attr)
+        if new_rId is not None:
+            attr.getparent().set(attr.attrname, new_rId)
+
+
+def partname_template(partname):
+    """Turns a partname like '/ppt/charts/chart3.xml' into the template '/ppt/charts/chart%d.xml'."""
+    return re.sub(r"\d*(\.\w+)$", r"%d\1", partname, count=1)
+
+
+def clone_part(part, package):
+    """Returns a deep copy of `part` added to `package`, together with everything it relates to.
+
+    The copy gets the next free partname of the same pattern. Its internal
+    relationships are cloned recursively and external ones are copied as is, so the
+    copy shares nothing with the original. Intended for self-contained part trees
+    such as a chart with its embedded workbook and style parts. Images in the tree
+    are the exception: they are looked up in, or added to, the media registry of
+    `package`, which also names them.
+
+    Args:
+        part (pptx.opc.package.Part): The part to copy.
+        package (pptx.opc.package.Package): The package the copy is added to (may be
+                                            a different package than the source).
+
+    Returns:
+        pptx.opc.package.Part: The new part.
+    """
+    if isinstance(part, ImagePart):
+        return media_registry(package).get_or_add_copy(package, part)
+    new_partname = package.next_partname(partname_template(part.partname))
+    new_part = type(part).load(PackURI(new_partname), part.content_type, package, part.blob)
+
+    rId_map = {}
+    for rId, rel in part.rels.items():
+        if rel.is_external:
+            rId_map[rId] = new_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        else:
+            rId_map[rId] = new_part.relate_to(clone_part(rel.target_part, package), rel.reltype)
+    if isinstance(new_part, XmlPart):
+        remap_rel_ids(new_part._element, rId_map)
+    return new_part
+
+
+class PartnameAllocator:
+    """Hands out free partnames of a package without walking the package on every call.
+
+    python-pptx's Package.next_partname collects every partname in the package
+    each time it is called, which makes adding many parts quadratic. The
+    allocator collects them once. It stays correct as long as no parts are
+    removed and new parts are named through it.
+
+    Args:
+        package (pptx.opc.package.OpcPackage): The package to name parts in.
+    """
+
+    def __init__(self, package):
+        self._taken = {part.partname for part in package.iter_parts()}
+        self._next = {}  # template -> lowest number that may still be free
+
+    def next_partname(self, tmpl):
+        """Returns the next free partname matching `tmpl`, e.g. '/ppt/charts/chart%d.xml'."""
+        n = self._next.get(tmpl, 1)
+        while tmpl % n in self._taken:
+            n += 1
+        partname = tmpl % n
+        self._taken.add(partname)
+        self._next[tmpl] = n + 1
+        return PackURI(partname)
+
+
+@contextmanager
+def fast_partnames(package):
+    """Makes `package.next_partname` use a PartnameAllocator inside the `with` block.
+
+    For bulk operations that add many parts (including through python-pptx
+    itself, e.g. notes slides) and remove none.
+    """
+    package.next_partname = PartnameAllocator(package).next_partname
+    try:
+        yield package
+    finally:
+        del package.next_partname
+
+
+def _shared_part(rel):
+    return rel.target_part
+
+
+def _copy_rels(source_part, target_part, skipped_reltypes, resolve_part):
+    package = target_part.package
+    resolve_part = resolve_part or _shared_part
+    clones = {}  # source part -> its clone, so a part related twice is cloned once
+    rId_map = {}
+    for rId, rel in source_part.rels.items():
+        if rel.reltype in skipped_reltypes:
+            continue
+        if rel.is_external:
+            rId_map[rId] = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        elif rel.reltype in SLIDE_OWNED_RELTYPES:
+            clone = clones.get(rel.target_part)
+            if clone is None:
+                clone = clones[rel.target_part] = clone_part(rel.target_part, package)
+            rId_map[rId] = target_part.relate_to(clone, rel.reltype)
+        else:
+            rId_map[rId] = target_part.relate_to(resolve_part(rel), rel.reltype)
+    return rId_map
+
+
+def foreign_part_resolver(package, resolved=None):
+    """Returns a resolve_part hook for copying slides from another package into `package`.
+
+    Images are looked up in the media registry of `package` by content and only
+    copied if not there yet; other shared parts are cloned with clone_part. Each
+    source part is resolved once, so parts shared by several copied slides stay
+    shared.
+
+    Args:
+        package (pptx.package.Package): The package receiving the slides.
+        resolved (dict, optional): Source part -> part of `package` to use for it, e.g.
+                                   the copies of the slides themselves. Filled in as
+                                   parts are resolved.
+
+    Returns:
+        callable: A resolve_part function for copy_slide_rels.
+    """
+    registry = media_registry(package)
+    resolved = {} if resolved is None else resolved
+
+    def resolve_part(rel):
+        part = resolved.get(rel.target_part)
+        if part is None:
+            if isinstance(rel.target_part, ImagePart):
+                part = registry.get_or_add_copy(package, rel.target_part)
+            else:
+                part = clone_part(rel.target_part, package)
+            resolved[rel.target_part] = part
+        return part
+
+    return resolve_part
+
+
+def copy_slide_rels(source_part, target_part, resolve_part=None):
+    """Relates `target_part` to everything `source_part` relates to, except its layout and notes.
+
+    Shared parts such as images and media are related as they are (no copy),
+    unless `resolve_part` says otherwise. Slide-owned parts (charts, comments,
+    SmartArt diagram parts and embedded objects, see SLIDE_OWNED_RELTYPES) are
+    cloned with clone_part. External relationships (hyperlinks) are copied by reference.
+
+    Args:
+        source_part (pptx.parts.slide.SlidePart): The slide part being copied.
+        target_part (pptx.parts.slide.SlidePart): The slide part receiving the content.
+        resolve_part (callable, optional): Called with each internal relationship of
+            `source_part` to a shared part; returns the part `target_part` should relate
+            to instead, e.g. a copy in the target's package when copying between
+            presentations. Defaults to the relationship's own target part.
+
+    Returns:
+        dict: Maps rIds of `source_part` to the corresponding rIds of `target_part`.
+    """
+    return _copy_rels(source_part, target_part, _SLIDE_STRUCTURE_RELTYPES, resolve_part)
+
+
+def _replace_element_content(target, source):
+    """Makes `target` a copy of `source` in place: same attributes and children.
+
+    The `target` element object itself is kept, so proxies that hold on to it
+    (e.g. a slide's cached shapes collection holding <p:spTree>) stay valid.
+    """
+    target.attrib.clear()
+    target.attrib.update(source.attrib)
+    for child in list(target):
+        target.remove(child)
+    target.extend(list(source))
+
+
+def copy_slide_content(source_part, target_part, resolve_part=None):
+    """Replaces the content of `target_part`'s slide with a deep copy of `source_part`'s slide.
+
+    Every child of <p:sld> (background, shape tree, color map override,
+    transition, timing, ...) is copied, then relationship ids are re-linked with
+    copy_slide_rels. The target's <p:cSld> and <p:spTree> elements are reused so
+    existing proxies on the target slide keep working.
+
+    Args:
+        source_part (pptx.parts.slide.SlidePart): The slide part to copy from.
+        target_part (pptx.parts.slide.SlidePart): The slide part to copy into.
+        resolve_part (callable, optional): See copy_slide_rels.
+    """
+    rId_map = copy_slide_rels(source_part, target_part, resolve_part)
+    _copy_element_tree(source_part, target_part, rId_map)
+
+
+def copy_notes_content(source_part, target_part, resolve_part=None):
+    """Replaces the content of the notes slide `target_part` with a copy of `source_part`'s.
+
+    Works like copy_slide_content; the notes master and the slide the notes
+    belong to are left as they are on the target.
+
+    Args:
+        source_part (pptx.parts.slide.NotesSlidePart): The notes slide part to copy from.
+        target_part (pptx.parts.slide.NotesSlidePart): The notes slide part to copy into.
+        resolve_part (callable, optional): See copy_slide_rels.
+    """
+    rId_map = _copy_rels(source_part, target_part, _NOTES_STRUCTURE_RELTYPES, resolve_part)
+    _copy_element_tree(source_part, target_part, rId_map)
+
+
+def _copy_element_tree(source_part, target_part, rId_map):
+    """Makes `target_part`'s root element a remapped deep copy of `source_part`'s, reusing its <p:cSld> and <p:spTree>."""
+    sld_copy = copy.deepcopy(source_part._element)
+    remap_rel_ids(sld_copy, rId_map)
+
+    target_sld = target_part._element
+    target_cSld = target_sld.cSld
+    target_spTree = target_cSld.spTree
+    # Swap the copied shape tree and common slide data into the target's own elements.
+    _replace_element_content(target_spTree, sld_copy.cSld.spTree)
+    sld_copy.cSld.replace(sld_copy.cSld.spTree, target_spTree)
+    _replace_element_content(target_cSld, sld_copy.cSld)
+    sld_copy.replace(sld_copy.cSld, target_cSld)
+    _replace_element_content(target_sld, sld_copy)
@@ -1,66 +1,385 @@
 # presentation.py in pypptx directory
 
+import copy
+import os
+from collections import Counter
+from collections.abc import Sequence
+
+import pandas as pd
 from pptx import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER, MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches
 
 # Import PySlide and constants from within the pypptx package
 from .slide import PySlide
-from .constants import DEFAULT_LAYOUT_REF
+from .constants import (
+    DEFAULT_LAYOUT_REF,
+    DEFAULT_TABLE_ROWS_PER_SLIDE,
+    DEFAULT_CONTINUED_TITLE_SUFFIX,
+    DEFAULT_FOOTER_FONT_NAME,
+    DEFAULT_FOOTER_FONT_SIZE_PT,
+    DEFAULT_DUPLICATE_SLIDE_MODE,
+    DEFAULT_SAVE_COMPRESSION,
+    DEFAULT_SAVE_COMPRESSLEVEL,
+    DEFAULT_USE_TEMPLATE_CACHE,
+    DEFAULT_LAZY_OPEN,
+    DEFAULT_INCREMENTAL_SAVE,
+    DEFAULT_PICTURE_MAX_DPI,
+    DEFAULT_PICTURE_REENCODE,
+    DEFAULT_JPEG_QUALITY,
+    DEFAULT_PICTURE_WORKERS,
+)
+from .fragments import paragraphs_xml, pPr_xml
+from .lazy import open_lazy
+from .media import media_registry, media_report
+from .package import package_bytes, write_package
+from .parts import copy_notes_content, copy_slide_content, fast_partnames, foreign_part_resolver
+from .template_cache import _file_key, template_cache
+
+
+def _iter_row_chunks(dataframe, rows_per_slide):
+    """Yields consecutive row slices of `dataframe` with at most `rows_per_slide` rows.
+
+    Slices are taken positionally with iloc, so the frame itself is never copied.
+    An empty DataFrame yields a single empty slice so the header is still rendered.
+    """
+    n_rows = len(dataframe)
+    if n_rows == 0:
+        yield dataframe
+        return
+    for start in range(0, n_rows, rows_per_slide):
+        yield dataframe.iloc[start:start + rows_per_slide]
+
+
+# Placeholders nearly every layout has; they say nothing about which layouts are alike.
+_COMMON_PLACEHOLDERS = (PP_PLACEHOLDER.DATE, PP_PLACEHOLDER.FOOTER, PP_PLACEHOLDER.SLIDE_NUMBER)
+
+
+def _placeholder_types(layout):
+    """Counts the placeholder types of a slide layout, ignoring date, footer and slide number."""
+    return Counter(shape.placeholder_format.type for shape in layout.placeholders
+                   if shape.placeholder_format.type not in _COMMON_PLACEHOLDERS)
+
+
+def _layout_similarity(types, other_types):
+    """Overlap of two placeholder type counts, from 0.0 (nothing in common) to 1.0 (the same)."""
+    union = sum((types | other_types).values())
+    return sum((types & other_types).values()) / union if union else 1.0
+
+
+class PySlideSequence(Sequence):
+    """Lazy, read-only view of a presentation's slides as PySlide wrappers.
+
+    Supports len(), indexing (including negative indices), slicing and iteration
+    without building a list of all slides. Wrappers are created on first access
+    and cached per slide part, so `preso.slides[i] is preso.slides[i]`.
+    """
+
+    __slots__ = ("_ppt",)
+
+    def __init__(self, ppt):
+        self._ppt = ppt
+
+    def __len__(self):
+        return len(self._ppt.presentation.slides._sldIdLst)
+
+    def __getitem__(self, index):
+        sldIdLst = self._ppt.presentation.slides._sldIdLst
+        if isinstance(index, slice):
+            return [self._ppt._wrap_slide(sldIdLst[i].rId) for i in range(*index.indices(len(sldIdLst)))]
+        num_slides = len(sldIdLst)
+        if index < 0:
+            index += num_slides
+        if not 0 <= index < num_slides:
+            raise IndexError(f"Slide index {index} is out of range.")
+        return self._ppt._wrap_slide(sldIdLst[index].rId)
+
+    def __iter__(self):
+        for sldId in self._ppt.presentation.slides._sldIdLst:
+            yield self._ppt._wrap_slide(sldId.rId)
+
 
 class PyPPT:
-    def __init__(self, pptx_path=None):
-        if pptx_path:
+    def __init__(self, pptx_path=None, layout_aliases=None, use_template_cache=DEFAULT_USE_TEMPLATE_CACHE,
+                 lazy=DEFAULT_LAZY_OPEN):
+        """Initializes the PyPPT.
+
+        Args:
+            pptx_path (str or file-like, optional): Path to an existing .pptx file to open,
+                                       or an open binary file. If None, a new presentation is created.
+            layout_aliases (dict, optional): Maps alternative names to layout names,
+                                             e.g. {"Title": "Title Slide"}. See add_layout_alias.
+            use_template_cache (bool): If True, a path is opened through the process-wide
+                                       template cache (see pypptx.template_cache): the file is
+                                       parsed once and later opens get an independent copy.
+                                       Defaults to DEFAULT_USE_TEMPLATE_CACHE.
+            lazy (bool): If True, slides, notes slides and charts of the opened deck are only
+                         parsed when first used, e.g. by get_slide(i) or slides[i]; the
+                         others are saved byte for byte. The template cache is not used.
+                         Defaults to DEFAULT_LAZY_OPEN.
+        """
+        # (abspath, mtime_ns, size) of the file opened, for incremental saves.
+        self._source_key = None
+        if pptx_path and isinstance(pptx_path, (str, os.PathLike)):
+            self._source_key = _file_key(pptx_path)
+        if pptx_path and lazy:
+            self.presentation = open_lazy(pptx_path)
+        elif pptx_path and use_template_cache and isinstance(pptx_path, (str, os.PathLike)):
+            self.presentation = template_cache.get(pptx_path)
+        elif pptx_path:
             self.presentation = Presentation(pptx_path)
         else:
             self.presentation = Presentation()
         # Store the path if provided, though it's less relevant if creating new
         self.pptx_path = pptx_path
 
-    def add_slide(self, layout_ref=DEFAULT_LAYOUT_REF):
-        """Adds a new slide to the presentation and returns its PySlide wrapper.
+        # PySlide wrappers keyed by slide part, shared by get_slide and the slides view.
+        self._slide_wrappers = {}
+        self._slides_view = PySlideSequence(self)
+
+        # Layout lookup index, built on first use and rebuilt when the layouts change.
+        self._layout_index_key = None
+        self._layouts_by_name = None
+        self._layouts_by_master = None
+        self._layout_sources = None  # layout part -> (master part, rId, name) it was indexed under
+        self._layout_aliases = {}
+        for alias, layout_name in (layout_aliases or {}).items():
+            self.add_layout_alias(alias, layout_name)
+
+    def add_layout_alias(self, alias, layout_name):
+        """Registers an alternative name for a slide layout.
+
+        Aliases are matched case-insensitively and resolved after exact and
+        case-insensitive layout names, so a real layout called `alias` always wins.
 
         Args:
-            layout_ref (int or str): The index of the slide layout to use (int)
-                                     or the name of the slide layout (str).
-                                     Defaults to DEFAULT_LAYOUT_REF.
+            alias (str): The alternative name, e.g. "Title".
+            layout_name (str): The layout name it stands for, e.g. "Title Slide".
+        """
+        self._layout_aliases[alias.casefold()] = layout_name
+
+    def refresh_layout_index(self):
+        """Forces the layout lookup index to be rebuilt on next use.
+
+        Lookups notice added, removed and renamed layouts on their own (see
+        _find_layout_by_names); call this after giving a layout a name another
+        layout already has, so the first of them in master order is found.
+        """
+        self._layout_index_key = None
+
+    def _get_layout_index(self):
+        """Returns the (by_name, by_master) layout lookup index, rebuilding it if the masters changed.
+
+        Each index maps layout names to layouts in two dicts: exact names and
+        case-folded names. `by_name` covers all masters (earlier masters win on
+        duplicate names); `by_master` holds one such pair per slide master.
+        Changes to the layouts of a master are caught by _find_layout_by_names.
+        """
+        prs = self.presentation
+        # The <p:sldMasterId> elements themselves: the key keeps their proxies alive, so
+        # lxml hands out the same objects while they are in the document.
+        index_key = tuple(prs._element.get_or_add_sldMasterIdLst())
+        if self._layout_index_key != index_key:
+            by_name = ({}, {})
+            by_master = []
+            layout_sources = {}
+            for master in prs.slide_masters:
+                master_names = ({}, {})
+                for sldLayoutId in master._element.get_or_add_sldLayoutIdLst().sldLayoutId_lst:
+                    layout = master.part.related_slide_layout(sldLayoutId.rId)
+                    layout_sources[layout.part] = (master.part, sldLayoutId.rId, layout.name)
+                    for names in (by_name, master_names):
+                        names[0].setdefault(layout.name, layout)
+                        names[1].setdefault(layout.name.casefold(), layout)
+                by_master.append(master_names)
+            self._layouts_by_name = by_name
+            self._layouts_by_master = by_master
+            self._layout_sources = layout_sources
+            self._layout_index_key = index_key
+        return self._layouts_by_name, self._layouts_by_master
+
+    def _layout_is_current(self, layout):
+        """Whether `layout` is still related to its master and named as when it was indexed."""
+        master_part, rId, name = self._layout_sources[layout.part]
+        rel = master_part.rels.get(rId)
+        return rel is not None and rel.target_part is layout.part and layout.name == name
+
+    def _find_layout_by_name(self, name, names):
+        """Looks `name` up in a (exact, case-folded) name index, then through the aliases."""
+        exact_names, folded_names = names
+        layout = exact_names.get(name)
+        if layout is None:
+            layout = folded_names.get(name.casefold())
+        if layout is None:
+            alias_target = self._layout_aliases.get(name.casefold())
+            if alias_target is not None:
+                layout = exact_names.get(alias_target) or folded_names.get(alias_target.casefold())
+        return layout
+
+    def _find_layout_by_names(self, candidates, master_index=None):
+        """Returns the layout named by the first of `candidates` that is found, or None.
+
+        A layout found in the index is checked with _layout_is_current, which costs
+        the same however many layouts there are. If it fails (the layout was
+        removed or renamed), or no candidate is found (a layout may have been
+        added or renamed to it), the index is rebuilt once and the lookup repeated.
+
+        Args:
+            candidates (list[str]): Layout names to try in order.
+            master_index (int, optional): Only look at the layouts of this slide master.
+        """
+        for rebuilt in (False, True):
+            if rebuilt:
+                self._layout_index_key = None
+            by_name, by_master = self._get_layout_index()
+            names = by_name if master_index is None else by_master[master_index]
+            for name in candidates:
+                layout = self._find_layout_by_name(name, names)
+                if layout is not None:
+                    if rebuilt or self._layout_is_current(layout):
+                        return layout
+                    break
+        return None
+
+    def get_layout(self, layout_ref=DEFAULT_LAYOUT_REF, master_index=None):
+        """Returns the slide layout identified by `layout_ref`.
+
+        Args:
+            layout_ref (int, str, list or tuple): The index of the slide layout (int),
+                the name of the slide layout (str, matched exactly, then case-insensitively,
+                then through layout aliases), or a sequence of names tried in order.
+            master_index (int, optional): Restricts the lookup to the layouts of this
+                slide master. If None, integer refs index the first master's layouts and
+                names are looked up across all masters.
 
         Returns:
-            PySlide: A wrapper for the newly added slide.
+            pptx.slide.SlideLayout: The matching layout.
 
         Raises:
-            ValueError: If layout_ref is a string and no layout with that name is found.
-            IndexError: If layout_ref is an integer and is out of range.
-            TypeError: If layout_ref is not an int or str.
+            ValueError: If no layout with the given name(s) is found.
+            IndexError: If layout_ref or master_index is an integer out of range.
+            TypeError: If layout_ref is not an int, str, list or tuple.
         """
-        slide_layout = None
-        if isinstance(layout_ref, str):
-            layout_name_to_find = layout_ref
-            found_layout = None
-            for layout in self.presentation.slide_layouts:
-                if hasattr(layout, 'name') and layout.name == layout_name_to_find: # Check if layout has a name attribute
-                    found_layout = layout
-                    break
-            if found_layout:
-                slide_layout = found_layout
-            else:
-                available_layout_names = [l.name for l in self.presentation.slide_layouts if hasattr(l, 'name')]
-                raise ValueError(
-                    f"Layout with name '{layout_name_to_find}' not found. "
-                    f"Available layout names are: {available_layout_names}"
+        if master_index is not None:
+            num_masters = len(self.presentation.slide_masters)
+            if not 0 <= master_index < num_masters:
+                raise IndexError(
+                    f"Master index {master_index} is out of range. "
+                    f"Available masters: {num_masters}."
                 )
+
+        if isinstance(layout_ref, (str, list, tuple)):
+            candidates = [layout_ref] if isinstance(layout_ref, str) else list(layout_ref)
+            found_layout = self._find_layout_by_names(candidates, master_index)
+            if found_layout is not None:
+                return found_layout
+            by_name, by_master = self._get_layout_index()
+            names = by_name if master_index is None else by_master[master_index]
+            raise ValueError(
+                f"Layout with name {' or '.join(repr(c) for c in candidates)} not found. "
+                f"Available layout names are: {list(names[0])}"
+            )
         elif isinstance(layout_ref, int):
+            if master_index is None:
+                layouts = self.presentation.slide_layouts
+            else:
+                layouts = self.presentation.slide_masters[master_index].slide_layouts
             try:
-                slide_layout = self.presentation.slide_layouts[layout_ref]
+                return layouts[layout_ref]
             except IndexError:
                 raise IndexError(
                     f"Layout index {layout_ref} is out of range. "
-                    f"Available layouts: {len(self.presentation.slide_layouts)}."
+                    f"Available layouts: {len(layouts)}."
                 )
         else:
             raise TypeError(f"layout_ref must be an integer index or a string name, not {type(layout_ref)}.")
 
+    def add_slide(self, layout_ref=DEFAULT_LAYOUT_REF, master_index=None):
+        """Adds a new slide to the presentation and returns its PySlide wrapper.
+
+        Args:
+            layout_ref (int, str, list or tuple): The index of the slide layout to use (int),
+                                     the name of the slide layout (str), or several names
+                                     to try in order. Names are matched exactly, then
+                                     case-insensitively, then through layout aliases.
+                                     Defaults to DEFAULT_LAYOUT_REF.
+            master_index (int, optional): Only consider layouts of this slide master.
+
+        Returns:
+            PySlide: A wrapper for the newly added slide.
+
+        Raises:
+            ValueError: If layout_ref is a name and no layout with that name is found.
+            IndexError: If layout_ref is an integer and is out of range.
+            TypeError: If layout_ref is not an int, str, list or tuple.
+        """
+        slide_layout = self.get_layout(layout_ref, master_index=master_index)
         new_pptx_slide = self.presentation.slides.add_slide(slide_layout)
-        return PySlide(new_pptx_slide)
+        return self._register_slide(new_pptx_slide)
+
+    def _register_slide(self, pptx_slide):
+        """Creates and caches the PySlide wrapper for a newly added slide."""
+        py_slide = PySlide(pptx_slide)
+        self._slide_wrappers[pptx_slide.part] = py_slide
+        return py_slide
+
+    def _wrap_slide(self, rId):
+        """Returns the cached PySlide for the slide related by `rId`, creating it if needed."""
+        slide_part = self.presentation.part.related_part(rId)
+        py_slide = self._slide_wrappers.get(slide_part)
+        if py_slide is None:
+            py_slide = PySlide(slide_part.slide)
+            self._slide_wrappers[slide_part] = py_slide
+        return py_slide
+
+    def add_paginated_table(self, dataframe, left, top, width, height,
+                            rows_per_slide=DEFAULT_TABLE_ROWS_PER_SLIDE,
+                            layout_ref=DEFAULT_LAYOUT_REF, title=None,
+                            **table_kwargs):
+        """Adds a DataFrame as a table spread over as many slides as needed.
+
+        The DataFrame is streamed in chunks of `rows_per_slide` rows; each chunk
+        gets its own slide and table, with the header row repeated. Only the rows
+        of the current chunk are formatted at a time.
+
+        Args:
+            dataframe (pd.DataFrame): The Pandas DataFrame to display.
+            left (float): Left position of each table (Inches).
+            top (float): Top position of each table (Inches).
+            width (float): Width of each table (Inches).
+            height (float): Height of a full table of `rows_per_slide` rows (Inches).
+                            Shorter final pages are scaled down so rows keep the same height.
+            rows_per_slide (int): Maximum number of data rows per slide.
+                                  Defaults to DEFAULT_TABLE_ROWS_PER_SLIDE.
+            layout_ref (int or str): Layout used for every slide (see add_slide).
+            title (str, optional): Title set on each slide. Slides after the first get
+                                   DEFAULT_CONTINUED_TITLE_SUFFIX appended.
+            **table_kwargs: Passed through to PySlide.add_table_from_dataframe
+                            (column_labels, number_formats, font_name, ...).
+
+        Returns:
+            list[PySlide]: The slides that were added, in order.
+
+        Raises:
+            ValueError: If dataframe is not a DataFrame or rows_per_slide is less than 1.
+        """
+        if not isinstance(dataframe, pd.DataFrame):
+            raise ValueError("Input 'dataframe' must be a pandas DataFrame.")
+        if not isinstance(rows_per_slide, int) or rows_per_slide < 1:
+            raise ValueError(f"rows_per_slide must be a positive integer, not {rows_per_slide!r}.")
+
+        new_slides = []
+        for page, chunk in enumerate(_iter_row_chunks(dataframe, rows_per_slide)):
+            py_slide = self.add_slide(layout_ref=layout_ref)
+            if title is not None:
+                py_slide.set_title(title if page == 0 else f"{title}{DEFAULT_CONTINUED_TITLE_SUFFIX}")
+
+            chunk_height = height * (len(chunk) + 1) / (rows_per_slide + 1)
+            py_slide.add_table_from_dataframe(chunk, left, top, width, chunk_height, **table_kwargs)
+            new_slides.append(py_slide)
+        return new_slides
 
     def get_slide(self, slide_index):
         """Gets the slide at the specified index as a PySlide instance.
@@ -74,15 +393,20 @@ class PyPPT:
         Raises:
             IndexError: If slide_index is out of range.
         """
-        if slide_index < 0 or slide_index >= len(self.presentation.slides):
+        sldIdLst = self.presentation.slides._sldIdLst
+        if slide_index < 0 or slide_index >= len(sldIdLst):
             raise IndexError(f"Slide index {slide_index} is out of range.")
-        pptx_slide = self.presentation.slides[slide_index]
-        return PySlide(pptx_slide)
+        return self._wrap_slide(sldIdLst[slide_index].rId)
 
     @property
     def slides(self):
-        """Returns a list of PySlide instances for all slides in the presentation."""
-        return [PySlide(s) for s in self.presentation.slides]
+        """Returns a lazy sequence of PySlide instances for all slides in the presentation.
+
+        The sequence supports len(), indexing, slicing and iteration, and always
+        reflects the current slide order. The same PySlide instance is returned
+        for a given slide on every access.
+        """
+        return self._slides_view
 
     def delete_slide(self, slide_index):
         """Deletes a slide from the presentation by its index.
@@ -108,8 +432,11 @@ class PyPPT:
         slide_id_entry = prs.slides._sldIdLst[slide_index]
         rId = slide_id_entry.rId
 
+        self._slide_wrappers.pop(prs.part.related_part(rId), None)
         prs.part.drop_rel(rId)
         del prs.slides._sldIdLst[slide_index]
+        # Renumber the remaining slide parts; the next added slide takes slide<n + 1>.xml.
+        prs.part.rename_slide_parts([sldId.rId for sldId in prs.slides._sldIdLst])
 
     def move_slide(self, current_index, new_index):
         """Moves a slide from its current position to a new position.
@@ -125,7 +452,9 @@ class PyPPT:
         Raises:
             IndexError: If current_index is out of range.
 
-        Note: This method manipulates internal structures of python-pptx.
+        Note: This method manipulates internal structures of python-pptx. Slide parts are
+              renamed to follow the new order (slide1.xml, slide2.xml, ...), as in
+              reorder_slides and delete_slide.
         """
         slides_list = self.presentation.slides._sldIdLst
         num_slides = len(slides_list)
@@ -148,13 +477,99 @@ class PyPPT:
             new_index = num_slides_after_pop   # Clamp to the end (append)
 
         slides_list.insert(new_index, slide_id_entry_to_move)
+        self.presentation.part.rename_slide_parts([sldId.rId for sldId in slides_list])
+
+    def reorder_slides(self, permutation):
+        """Reorders all slides in one pass over the slide ID list.
+
+        Args:
+            permutation (Sequence[int]): The new slide order, given as current slide
+                                         indices: `permutation[i]` is the index of the
+                                         slide that ends up at position i. Must contain
+                                         every index from 0 to len(slides) - 1 exactly once.
+
+        Raises:
+            ValueError: If permutation is not a permutation of the current slide indices.
+
+        Note: Slide parts are renamed to follow the new order (slide1.xml, slide2.xml, ...).
+        """
+        sldIdLst = self.presentation.slides._sldIdLst
+        sldIds = list(sldIdLst)
+        num_slides = len(sldIds)
+        permutation = list(permutation)
+
+        if len(permutation) != num_slides:
+            raise ValueError(f"permutation has {len(permutation)} entries, "
+                             f"but the presentation has {num_slides} slides.")
+        seen = bytearray(num_slides)
+        for old_index in permutation:
+            if not isinstance(old_index, int) or not 0 <= old_index < num_slides or seen[old_index]:
+                raise ValueError(f"permutation must contain each index from 0 to {num_slides - 1} "
+                                 f"exactly once; got {old_index!r}.")
+            seen[old_index] = 1
+
+        sldIdLst[:] = [sldIds[old_index] for old_index in permutation]
+        self.presentation.part.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+
+    def delete_slides(self, indices):
+        """Deletes several slides at once, in one pass over the slide ID list.
+
+        The relationships from the presentation to the deleted slides are removed,
+        so their slide parts (and notes, charts, media only they use) are no longer
+        written when the presentation is saved.
+
+        Args:
+            indices (Iterable[int]): Indices of the slides to delete, in any order.
+                                     Duplicates are ignored.
 
-    def duplicate_slide(self, slide_index_to_duplicate):
-        """Duplicates a slide by creating a new slide with the same layout
-        and attempting to copy basic content and shapes.
-        The new slide is added at the end of the presentation.
+        Returns:
+            int: The number of slides deleted.
+
+        Raises:
+            IndexError: If any index is out of range. No slide is deleted in that case.
 
-        IMPORTANT LIMITATIONS (Basic Implementation):
+        Note: A deleted slide that is still the target of a slide-jump hyperlink
+              on a remaining slide stays reachable and is kept in the package.
+        """
+        prs = self.presentation
+        sldIdLst = prs.slides._sldIdLst
+        num_slides = len(sldIdLst)
+
+        to_delete = set(indices)
+        for slide_index in to_delete:
+            if not isinstance(slide_index, int) or not 0 <= slide_index < num_slides:
+                raise IndexError(f"Slide index {slide_index} is out of range. "
+                                 f"Presentation has {num_slides} slides (indices 0 to {num_slides-1}).")
+        if not to_delete:
+            return 0
+
+        kept = []
+        rels = prs.part.rels
+        for slide_index, sldId in enumerate(sldIdLst):
+            if slide_index not in to_delete:
+                kept.append(sldId)
+                continue
+            # Pop the relationship directly; drop_rel would rescan presentation.xml per slide.
+            rel = rels.pop(sldId.rId)
+            self._slide_wrappers.pop(rel.target_part, None)
+
+        sldIdLst[:] = kept
+        prs.part.rename_slide_parts([sldId.rId for sldId in kept])
+        return len(to_delete)
+
+    def duplicate_slide(self, slide_index_to_duplicate, mode=DEFAULT_DUPLICATE_SLIDE_MODE):
+        """Duplicates a slide. The new slide is added at the end of the presentation.
+
+        Modes:
+        - "clone" (default): Full-fidelity copy. The slide XML (background, all
+          shapes including tables, charts, pictures and groups, transitions and
+          animations) is deep-copied in one operation and its relationships are
+          re-linked: pictures and media share the original's media parts; charts
+          (with embedded workbooks), comments, SmartArt diagrams and embedded
+          OLE objects get their own cloned parts; hyperlinks are preserved. Speaker notes are not copied.
+        - "basic": Rebuilds the slide shape by shape through the add_* methods.
+
+        IMPORTANT LIMITATIONS of the "basic" mode:
         - Does NOT perform a perfect, deep copy of the slide.
         - Copies text from the main title placeholder if present on both slides.
         - For other common placeholders (body, content, text box type), text content
@@ -173,13 +588,18 @@ class PyPPT:
 
         Args:
             slide_index_to_duplicate (int): The index of the slide to duplicate.
+            mode (str): "clone" or "basic". Defaults to DEFAULT_DUPLICATE_SLIDE_MODE.
 
         Returns:
             PySlide: A PySlide wrapper for the newly created (duplicated) slide.
 
         Raises:
             IndexError: If slide_index_to_duplicate is out of range.
+            ValueError: If mode is not "clone" or "basic".
         """
+        if mode not in ("clone", "basic"):
+            raise ValueError(f"mode must be 'clone' or 'basic', not {mode!r}.")
+
         num_slides = len(self.presentation.slides)
         if not 0 <= slide_index_to_duplicate < num_slides:
             raise IndexError(f"slide_index_to_duplicate {slide_index_to_duplicate} is out of range. "
@@ -189,7 +609,12 @@ class PyPPT:
         source_layout = source_slide_pptx.slide_layout
 
         new_slide_pptx = self.presentation.slides.add_slide(source_layout)
-        new_py_slide = PySlide(new_slide_pptx) # PySlide is from .slide
+        if mode == "clone":
+            # One deep copy of the slide XML, then re-link its relationships.
+            copy_slide_content(source_slide_pptx.part, new_slide_pptx.part)
+            return self._register_slide(new_slide_pptx)
+
+        new_py_slide = self._register_slide(new_slide_pptx) # PySlide is from .slide
 
         for shape in source_slide_pptx.shapes:
             try:
@@ -233,9 +658,186 @@ class PyPPT:
 
         return new_py_slide
 
-    def save(self, filename):
-        """Saves the presentation to the given filename."""
-        self.presentation.save(filename)
+    def _closest_layout(self, source_layout, layout_map):
+        """Returns the layout of this presentation that slides on `source_layout` are merged onto.
+
+        Tried in order: `layout_map`, then the layout's name (exactly, case-insensitively
+        and through layout aliases), then the layout with the most similar placeholders.
+        """
+        if layout_map and source_layout.name in layout_map:
+            return self.get_layout(layout_map[source_layout.name])
+        layout = self._find_layout_by_names([source_layout.name])
+        if layout is not None:
+            return layout
+        source_types = _placeholder_types(source_layout)
+        # max() keeps the first of equally similar layouts.
+        return max(self.presentation.slide_layouts,
+                   key=lambda candidate: _layout_similarity(source_types, _placeholder_types(candidate)))
+
+    def merge(self, sources, layout_map=None, notes=True):
+        """Appends the slides of other presentations to the end of this one.
+
+        Slides are copied as XML parts, like duplicate_slide in "clone" mode,
+        rather than rebuilt shape by shape. New parts, images included, are named
+        without walking the package, so the time grows linearly with the number
+        of slides and images merged:
+
+        - Each source layout is mapped to a layout of this presentation: through
+          `layout_map`, else by name (including layout aliases), else to the layout
+          with the most similar set of placeholders. Slides take on the master and
+          theme of this presentation.
+        - Images are stored once per distinct content across all sources and this
+          presentation (see pypptx.media).
+        - Charts are copied with their embedded workbooks; other parts a slide uses
+          (media, OLE objects, ...) are copied once per source.
+        - Links between slides of the same source are kept.
+
+        Args:
+            sources (iterable): Presentations to append, in order: PyPPT objects, or
+                anything PyPPT() opens (paths or binary file-like objects).
+            layout_map (dict, optional): Maps source layout names to layout refs of this
+                presentation (see get_layout), for layouts that do not match by name.
+            notes (bool): Whether to copy speaker notes. Defaults to True.
+
+        Returns:
+            list[PySlide]: The appended slides.
+
+        Raises:
+            ValueError: If a layout ref in layout_map does not name a layout.
+            IndexError: If a layout ref in layout_map is out of range.
+        """
+        package = self.presentation.part.package
+        new_slides = []
+        with fast_partnames(package):
+            for source in sources:
+                new_slides.extend(self._merge_one(source, package, layout_map, notes))
+        return new_slides
+
+    def _merge_one(self, source, package, layout_map, notes):
+        """Appends the slides of one source presentation (see merge)."""
+        new_slides = []
+        source_ppt = source if isinstance(source, PyPPT) else PyPPT(source, use_template_cache=False)
+        source_slides = list(source_ppt.presentation.slides)
+        layouts = {}  # source layout part -> layout of this presentation
+        for source_slide in source_slides:
+            layout = source_slide.slide_layout
+            if layout.part not in layouts:
+                layouts[layout.part] = self._closest_layout(layout, layout_map)
+        # Source part -> part of this presentation; the new slides are created first so links to them resolve.
+        resolved = {}
+        for source_slide in source_slides:
+            new_slide = self.presentation.slides.add_slide(layouts[source_slide.slide_layout.part])
+            resolved[source_slide.part] = new_slide.part
+            new_slides.append(self._register_slide(new_slide))
+        resolve_part = foreign_part_resolver(package, resolved)
+
+        for source_slide in source_slides:
+            target_part = resolved[source_slide.part]
+            copy_slide_content(source_slide.part, target_part, resolve_part)
+            if notes and source_slide.has_notes_slide:
+                copy_notes_content(source_slide.notes_slide.part, target_part.notes_slide.part, resolve_part)
+        return new_slides
+
+    def add_pictures(self, placements, max_dpi=DEFAULT_PICTURE_MAX_DPI, reencode=DEFAULT_PICTURE_REENCODE,
+                     quality=DEFAULT_JPEG_QUALITY, workers=DEFAULT_PICTURE_WORKERS):
+        """Adds many pictures, downscaling and re-encoding the images in parallel threads.
+
+        Each distinct image is prepared once for each on-slide size it is used at
+        (see imaging.prepare_image), with the images not seen before processed in a
+        thread pool. The picture shapes are then added in the order given.
+
+        Args:
+            placements (list[dict]): One dict per picture with keys 'slide' (slide index
+                or PySlide), 'image' (path, bytes or binary file-like object), 'left' and
+                'top', and optionally 'width', 'height' and 'shape_name', as for
+                PySlide.add_picture.
+            max_dpi (float, optional): Downscale images to this resolution at their size on
+                the slide. Defaults to DEFAULT_PICTURE_MAX_DPI.
+            reencode (str, optional): None, "jpeg" or "auto". Defaults to DEFAULT_PICTURE_REENCODE.
+            quality (int): JPEG quality. Defaults to DEFAULT_JPEG_QUALITY.
+            workers (int, optional): Threads used to prepare images. Defaults to DEFAULT_PICTURE_WORKERS.
+
+        Returns:
+            list[pptx.shapes.picture.Picture]: The new picture shapes, in the order of `placements`.
+
+        Raises:
+            IndexError: If a slide index is out of range.
+            ValueError: If max_dpi or reencode is not valid.
+        """
+        slides = [p['slide'] if isinstance(p['slide'], PySlide) else self.get_slide(p['slide']) for p in placements]
+        package = self.presentation.part.package
+        images = [(p['image'],
+                   Inches(p['width']) if p.get('width') is not None else None,
+                   Inches(p['height']) if p.get('height') is not None else None) for p in placements]
+        parts = media_registry(package).get_or_add_prepared(package, images, max_dpi, reencode, quality, workers)
+        return [slide._add_picture_part(image_part, native_size, p['left'], p['top'],
+                                        p.get('width'), p.get('height'), p.get('shape_name'))
+                for slide, p, (image_part, native_size) in zip(slides, placements, parts)]
+
+    def media_report(self, budget_bytes=None):
+        """Reports the bytes taken by the presentation's images.
+
+        Args:
+            budget_bytes (int, optional): Size budget for all images together.
+
+        Returns:
+            MediaReport: Per-image stored and original sizes (largest first), totals, the bytes
+                         saved by downscaling/re-encoding, and whether the budget is exceeded.
+        """
+        return media_report(self.presentation.part.package, budget_bytes)
+
+    def _incremental_source(self):
+        """Path of the file this presentation was opened from, if it is unchanged on disk."""
+        if self._source_key is None:
+            return None
+        path = self._source_key[0]
+        try:
+            return path if _file_key(path) == self._source_key else None
+        except OSError:
+            return None
+
+    def save(self, filename, compression=DEFAULT_SAVE_COMPRESSION, compresslevel=DEFAULT_SAVE_COMPRESSLEVEL,
+             incremental=DEFAULT_INCREMENTAL_SAVE):
+        """Saves the presentation to a path or a binary file-like object.
+
+        Args:
+            filename (str or file-like): Path to write to, or a binary stream open for writing
+                                         (e.g. io.BytesIO or an HTTP response body).
+            compression (str): "deflate" for smaller files or "stored" (no compression) for
+                               the fastest write. Defaults to DEFAULT_SAVE_COMPRESSION.
+            compresslevel (int, optional): Deflate level from 0 (fastest) to 9 (smallest).
+                                           Defaults to DEFAULT_SAVE_COMPRESSLEVEL.
+            incremental (bool): If the presentation was opened from a path and that file is
+                                unchanged on disk, parts whose content did not change are
+                                copied from it as compressed bytes instead of being compressed
+                                again (see package.write_package). Saving over the original
+                                file is safe. Has no effect with an explicit compresslevel.
+                                Defaults to DEFAULT_INCREMENTAL_SAVE.
+
+        Raises:
+            ValueError: If the compression setting is not valid.
+        """
+        source = self._incremental_source() if incremental else None
+        write_package(self.presentation.part.package, filename, compression, compresslevel, source)
+        if source is not None and isinstance(filename, (str, os.PathLike)) and \
+                os.path.abspath(filename) == source:
+            # The saved file is the new baseline for the next incremental save.
+            self._source_key = _file_key(filename)
+
+    def to_bytes(self, compression=DEFAULT_SAVE_COMPRESSION, compresslevel=DEFAULT_SAVE_COMPRESSLEVEL,
+                 incremental=DEFAULT_INCREMENTAL_SAVE):
+        """Returns the presentation as .pptx bytes, without writing a file.
+
+        Args:
+            compression (str): "deflate" or "stored". Defaults to DEFAULT_SAVE_COMPRESSION.
+            compresslevel (int, optional): Deflate level 0-9. Defaults to DEFAULT_SAVE_COMPRESSLEVEL.
+            incremental (bool): See save. Defaults to DEFAULT_INCREMENTAL_SAVE.
+
+        Returns:
+            bytes: The .pptx file content.
+        """
+        source = self._incremental_source() if incremental else None
+        return package_bytes(self.presentation.part.package, compression, compresslevel, source)
 
     def set_slide_numbers_visibility(self, visible=True):
         """Attempts to set visibility of slide numbers on each slide by interacting with placeholders.
@@ -248,21 +850,9 @@ class PyPPT:
             visible (bool): True to attempt to show/ensure not hidden, False to attempt to hide.
         """
         print("INFO: Slide number visibility is best configured in the slide master/layout.")
-        for i, slide_obj in enumerate(self.presentation.slides):
-            slide_number_shape = None
-            # Check shapes that are placeholders first
-            for shape in slide_obj.placeholders:
-                if shape.placeholder_format.type == PP_PLACEHOLDER.SLIDE_NUMBER: # PP_PLACEHOLDER from pptx.enum.shapes
-                    slide_number_shape = shape
-                    break
-            # If not found in placeholders, check all shapes (less common for true slide numbers)
-            if not slide_number_shape:
-                for shape in slide_obj.shapes:
-                    if hasattr(shape, "is_placeholder") and shape.is_placeholder and \
-                       hasattr(shape, "placeholder_format") and \
-                       shape.placeholder_format.type == PP_PLACEHOLDER.SLIDE_NUMBER:
-                        slide_number_shape = shape
-                        break
+        for i, py_slide in enumerate(self.slides):
+            # One lookup per slide through the layout's shared placeholder map.
+            slide_number_shape = py_slide._find_placeholder(PP_PLACEHOLDER.SLIDE_NUMBER)
 
             if slide_number_shape:
                 if not visible:
@@ -272,3 +862,35 @@ class PyPPT:
                     print(f"INFO: For slide {i}, ensure layout/master enables slide numbers for placeholder to fill.")
             elif visible:
                 print(f"WARNING: Slide {i} does not seem to have a slide number placeholder to make visible.")
+
+    def set_footer_text_all(self, text):
+        """Sets the footer text on every slide that has a footer placeholder.
+
+        The footer paragraphs are built once as XML and copied into each slide's
+        footer placeholder, which is found with the same lookup as
+        PySlide.set_footer_text. The result is the same as calling
+        PySlide.set_footer_text on each slide.
+        Slides without a footer placeholder are skipped.
+
+        Args:
+            text (str): The text to set in the footers.
+
+        Returns:
+            int: The number of slides whose footer was set.
+        """
+        txBody = parse_xml("<a:txBody %s>%s</a:txBody>" % (
+            nsdecls("a"),
+            paragraphs_xml(text, pPr_xml(DEFAULT_FOOTER_FONT_NAME, DEFAULT_FOOTER_FONT_SIZE_PT)),
+        ))
+        footer_paragraphs = list(txBody)
+
+        updated = 0
+        for py_slide in self.slides:
+            footer_shape = py_slide._find_placeholder(PP_PLACEHOLDER.FOOTER)
+            if footer_shape is None or not footer_shape.has_text_frame:
+                continue
+            footer_txBody = footer_shape.text_frame._txBody
+            footer_txBody.clear_content()
+            footer_txBody.extend(copy.deepcopy(p) for p in footer_paragraphs)
+            updated += 1
+        return updated
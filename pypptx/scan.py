@@ -0,0 +1,318 @@
+# scan.py in pypptx directory
+#
+# Read-only scanning of decks for auditing and text extraction. Opening a deck
+# with PyPPT parses every part and builds python-pptx's object model; walking
+# its shapes then creates a proxy object per shape, paragraph and cell. The
+# scanner instead reads the zip directly: the slide order from
+# presentation.xml, then each slide (and the charts it shows) with lxml's
+# iterparse, clearing every shape once its text has been collected. Images,
+# layouts, masters and embedded workbooks are never read. scan_many spreads
+# the files over a process pool.
+
+import functools
+import os
+import posixpath
+import traceback
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from lxml import etree
+
+from .batch import run_chunks
+from .constants import DEFAULT_SCAN_CHUNKSIZE
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_C = "{http://schemas.openxmlformats.org/drawingml/2006/chart}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PR = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+_TITLE_TYPES = ("title", "ctrTitle")
+# Shapes whose content is done with once they end; they are cleared to keep memory flat.
+_SHAPE_TAGS = (_P + "sp", _P + "graphicFrame", _P + "pic", _P + "cxnSp")
+
+
+class ChartSeries:
+    """One series of a scanned chart, read from the values cached in the chart XML."""
+
+    __slots__ = ("name", "chart_type", "categories", "values")
+
+    def __init__(self, name, chart_type, categories, values):
+        self.name = name
+        self.chart_type = chart_type  # plot element name, e.g. "barChart" or "lineChart"
+        self.categories = categories  # category labels (str), None where a point has none
+        self.values = values          # float values, None where a point has none
+
+    def __repr__(self):
+        return f"ChartSeries(name={self.name!r}, chart_type={self.chart_type!r}, points={len(self.values)})"
+
+
+class ScannedChart:
+    """A chart found on a scanned slide."""
+
+    __slots__ = ("title", "series")
+
+    def __init__(self, title, series):
+        self.title = title    # chart title text, or None
+        self.series = series  # list of ChartSeries
+
+    def __repr__(self):
+        return f"ScannedChart(title={self.title!r}, series={len(self.series)})"
+
+
+class ScannedSlide:
+    """Text, tables and charts of one slide, as read by scan()."""
+
+    __slots__ = ("index", "title", "texts", "tables", "charts")
+
+    def __init__(self, index, title, texts, tables, charts):
+        self.index = index    # position of the slide in the deck
+        self.title = title    # text of the title placeholder, or None
+        self.texts = texts    # non-empty paragraphs of every text shape (title included), in order
+        self.tables = tables  # list of pd.DataFrame, cell text as str
+        self.charts = charts  # list of ScannedChart
+
+    def __repr__(self):
+        return (f"ScannedSlide(index={self.index}, title={self.title!r}, texts={len(self.texts)}, "
+                f"tables={len(self.tables)}, charts={len(self.charts)})")
+
+
+class DeckScan:
+    """Result of scanning one file with scan_many."""
+
+    __slots__ = ("path", "slides", "error", "traceback")
+
+    def __init__(self, path, slides, error=None, traceback_text=None):
+        self.path = path
+        self.slides = slides  # list of ScannedSlide, None if the file could not be scanned
+        self.error = error
+        self.traceback = traceback_text
+
+    @property
+    def ok(self):
+        """bool: True if the file was scanned."""
+        return self.error is None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"DeckScan(path={self.path!r}, error={self.error!r})"
+        return f"DeckScan(path={self.path!r}, slides={len(self.slides)})"
+
+
+def _rels(package_zip, membername, reltype=None):
+    """Returns {rId: member name of the target} for the internal relationships of `membername`.
+
+    `membername` "" stands for the package itself. With `reltype`, only relationships of that type are returned.
+    """
+    directory, filename = posixpath.split(membername)
+    rels_name = posixpath.join(directory, "_rels", filename + ".rels")
+    if rels_name not in package_zip.NameToInfo:
+        return {}
+    targets = {}
+    for rel in etree.fromstring(package_zip.read(rels_name)).iter(_PR + "Relationship"):
+        if rel.get("TargetMode") == "External" or reltype is not None and rel.get("Type") != reltype:
+            continue
+        target = rel.get("Target")
+        if target.startswith("/"):
+            targets[rel.get("Id")] = target[1:]
+        else:
+            targets[rel.get("Id")] = posixpath.normpath(posixpath.join(directory, target))
+    return targets
+
+
+def _paragraph_text(paragraph):
+    # Line breaks are "\v", as in python-pptx's _Paragraph.text.
+    return "".join("\v" if node.tag == _A + "br" else node.text or ""
+                   for node in paragraph.iter(_A + "t", _A + "br"))
+
+
+def _table_frame(rows, header):
+    if not rows:
+        return pd.DataFrame()
+    if header:
+        return pd.DataFrame(rows[1:], columns=rows[0])
+    return pd.DataFrame(rows)
+
+
+def _points(element, convert):
+    """Reads the c:pt values under a c:cat or c:val element into a list, None for missing points."""
+    if element is None:
+        return []
+    count = element.find(".//" + _C + "ptCount")
+    points = [None] * int(count.get("val")) if count is not None else []
+    for pt in element.iter(_C + "pt"):
+        idx = int(pt.get("idx"))
+        if idx >= len(points):
+            points.extend([None] * (idx + 1 - len(points)))
+        value = pt.findtext(_C + "v")
+        points[idx] = convert(value) if value is not None else None
+    return points
+
+
+def _scan_chart(package_zip, membername):
+    title = None
+    series = []
+    with package_zip.open(membername) as chart_xml:
+        for _, element in etree.iterparse(chart_xml, tag=(_C + "ser", _C + "title")):
+            if element.tag == _C + "title":
+                # Axis titles are c:title elements as well; only the chart's own title counts.
+                if element.getparent().tag == _C + "chart":
+                    title = "\n".join(_paragraph_text(p) for p in element.iter(_A + "p"))
+                continue
+            name = element.findtext(_C + "tx//" + _C + "v")
+            chart_type = etree.QName(element.getparent()).localname
+            # XY and bubble charts hold their points in c:xVal and c:yVal.
+            categories = element.find(_C + "cat")
+            values = element.find(_C + "val")
+            categories = _points(categories if categories is not None else element.find(_C + "xVal"), str)
+            values = _points(values if values is not None else element.find(_C + "yVal"), float)
+            series.append(ChartSeries(name, chart_type, categories, values))
+            element.clear()
+    return ScannedChart(title, series)
+
+
+def _scan_slide(package_zip, membername, index, tables, charts, table_header):
+    title = None
+    texts = []
+    found_tables = []
+    found_charts = []
+    slide_rels = None
+    shape_paragraphs = []  # paragraphs of the text shape being read
+    shape_is_title = False
+    row, rows = [], []
+    tags = _SHAPE_TAGS + (_P + "ph", _P + "txBody")
+    if tables:
+        tags += (_A + "tc", _A + "tr", _A + "tbl")
+    if charts:
+        tags += (_C + "chart",)
+    with package_zip.open(membername) as slide_xml:
+        # Only end events: shapes hold their text in p:txBody, table cells in a:txBody.
+        for _, element in etree.iterparse(slide_xml, tag=tags):
+            tag = element.tag
+            if tag == _P + "txBody":
+                shape_paragraphs = [_paragraph_text(p) for p in element.iter(_A + "p")]
+            elif tag == _P + "ph":
+                shape_is_title = element.get("type") in _TITLE_TYPES
+            elif tag == _A + "tc":
+                row.append("\n".join(_paragraph_text(p) for p in element.iter(_A + "p")))
+            elif tag == _A + "tr":
+                rows.append(row)
+                row = []
+            elif tag == _A + "tbl":
+                found_tables.append(_table_frame(rows, table_header))
+                rows = []
+            elif tag == _C + "chart":
+                if slide_rels is None:
+                    slide_rels = _rels(package_zip, membername)
+                chart_name = slide_rels.get(element.get(_R + "id"))
+                if chart_name is not None:
+                    found_charts.append(_scan_chart(package_zip, chart_name))
+            else:
+                if tag == _P + "sp":
+                    if shape_is_title and title is None:
+                        title = "\n".join(shape_paragraphs)
+                    texts.extend(text for text in shape_paragraphs if text)
+                shape_paragraphs, shape_is_title = [], False
+                element.clear()
+    return ScannedSlide(index, title, texts, found_tables, found_charts)
+
+
+def scan(file, tables=True, charts=True, table_header=True):
+    """Reads the text, tables and chart data of every slide without loading the deck.
+
+    Nothing is built through python-pptx: the slides are streamed from the zip
+    with lxml's iterparse, and parts other than slides and charts (images,
+    layouts, embedded workbooks, ...) are not read at all. Use it for audits and
+    extraction over many files; open the deck with PyPPT to change it.
+
+    Args:
+        file (str or file-like): Path to a .pptx file, or a binary file-like object.
+        tables (bool): Whether to build a DataFrame for each table. Defaults to True.
+        charts (bool): Whether to read chart series. Defaults to True.
+        table_header (bool): Whether the first row of each table holds the column
+                             names. Defaults to True, as written by add_table_from_dataframe.
+
+    Yields:
+        ScannedSlide: One per slide, in presentation order.
+
+    Raises:
+        zipfile.BadZipFile: If `file` is not a zip file.
+        KeyError: If the zip does not hold a presentation.
+    """
+    with zipfile.ZipFile(file) as package_zip:
+        presentation_names = list(_rels(package_zip, "", _OFFICE_DOCUMENT).values())
+        if not presentation_names:
+            raise KeyError("The package has no main document part.")
+        presentation_name = presentation_names[0]
+        slide_names = _rels(package_zip, presentation_name)
+        presentation = etree.fromstring(package_zip.read(presentation_name))
+        rIds = [sldId.get(_R + "id") for sldId in presentation.iter(_P + "sldId")]
+        for index, rId in enumerate(rIds):
+            yield _scan_slide(package_zip, slide_names[rId], index, tables, charts, table_header)
+
+
+def _scan_chunk(paths, options):
+    """Scans a chunk of files. Runs in a worker; returns a DeckScan per file."""
+    results = []
+    for path in paths:
+        try:
+            results.append(DeckScan(path, list(scan(path, **options))))
+        except Exception as e:
+            results.append(DeckScan(path, None, f"{type(e).__name__}: {e}", traceback.format_exc()))
+    return results
+
+
+def _iter_paths(paths):
+    """Yields .pptx paths, walking directories (PowerPoint's "~$" lock files are skipped)."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        if not os.path.isdir(path):
+            yield os.fspath(path)
+            continue
+        for directory, subdirectories, filenames in os.walk(path):
+            subdirectories.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith(".pptx") and not filename.startswith("~$"):
+                    yield os.path.join(directory, filename)
+
+
+def scan_many(paths, workers=None, chunksize=DEFAULT_SCAN_CHUNKSIZE, **options):
+    """Scans many decks in parallel worker processes.
+
+    Paths are consumed lazily and sent in chunks, with at most two chunks per
+    worker in flight, so an archive of any size is never listed in full.
+
+    Args:
+        paths (str or Iterable): A directory (searched recursively for .pptx files), a
+                                 file path, or an iterable of either.
+        workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+        chunksize (int): Files sent to a worker per task. Defaults to DEFAULT_SCAN_CHUNKSIZE.
+        **options: tables, charts and table_header, passed on to scan().
+
+    Yields:
+        DeckScan: One per file, in the order the files finish. A file that cannot be
+                  read yields a DeckScan with `error` set instead of stopping the scan.
+                  If a worker process dies, every file of the chunks in flight at that
+                  moment gets such a DeckScan and a new pool scans the rest.
+
+    Raises:
+        ValueError: If chunksize or workers is less than 1.
+    """
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, not {chunksize!r}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"workers must be a positive integer, not {workers!r}.")
+
+    path_iter = _iter_paths(paths)
+    chunks = iter(lambda: [path for _, path in zip(range(chunksize), path_iter)], [])
+    make_executor = functools.partial(ProcessPoolExecutor, max_workers=workers)
+    for chunk, results in run_chunks(make_executor, _scan_chunk, chunks, 2 * workers, options):
+        if isinstance(results, Exception):
+            # The whole chunk was lost (e.g. a worker died).
+            results = [DeckScan(path, None, f"{type(results).__name__}: {results}") for path in chunk]
+        yield from results
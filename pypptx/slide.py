@@ -1,23 +1,63 @@
 # slide.py in pypptx directory
 
+import weakref
+
 from pptx.enum.shapes import PP_PLACEHOLDER, MSO_SHAPE
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.chart.data import CategoryChartData
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
+import numpy as np
 import pandas as pd
 
 # Import constants from within the pypptx package
 from .constants import (
     DEFAULT_TABLE_HEADER_BOLD,
     DEFAULT_TABLE_INCLUDE_INDEX,
+    DEFAULT_TABLE_BULK_BUILD,
+    DEFAULT_CHART_WORKBOOK_MODE,
+    DEFAULT_DOWNSAMPLE_POINTS,
+    DEFAULT_PICTURE_MAX_DPI,
+    DEFAULT_PICTURE_REENCODE,
+    DEFAULT_JPEG_QUALITY,
     DEFAULT_SUBTITLE_FONT_NAME,
     DEFAULT_SUBTITLE_FONT_SIZE_PT,
     DEFAULT_FOOTER_FONT_NAME,
     DEFAULT_FOOTER_FONT_SIZE_PT,
 )
+from .chart_data import array_chart_data, dataframe_chart_data
+from .chart_workbook import add_chart_part
+from .downsample import downsample_chart_data
+from .media import media_registry, scale_size
+from .table import format_table_columns, populate_table
+
+# Chart data given as any of these is validated by shape and written from the arrays.
+_ARRAY_TYPES = (np.ndarray, pd.Series, pd.Index)
+
+# Placeholder type -> placeholder idx, computed once per slide layout part and
+# shared by every slide that uses that layout.
+_LAYOUT_PLACEHOLDER_MAPS = weakref.WeakKeyDictionary()
+
+
+def _layout_placeholder_map(slide_layout):
+    """Returns the {PP_PLACEHOLDER type: idx} map for `slide_layout`, building it on first use.
+
+    If a layout has several placeholders of one type, the first in z-order is used.
+    """
+    ph_map = _LAYOUT_PLACEHOLDER_MAPS.get(slide_layout.part)
+    if ph_map is None:
+        ph_map = {}
+        for placeholder in slide_layout.placeholders:
+            ph_format = placeholder.placeholder_format
+            ph_map.setdefault(ph_format.type, ph_format.idx)
+        _LAYOUT_PLACEHOLDER_MAPS[slide_layout.part] = ph_map
+    return ph_map
+
 
 class PySlide:
+    __slots__ = ("pptx_slide", "_shapes_by_name", "last_downsample")
+
     def __init__(self, pptx_slide):
         """Initializes the PySlide.
 
@@ -25,6 +65,45 @@ class PySlide:
             pptx_slide (pptx.slide.Slide): The python-pptx Slide object.
         """
         self.pptx_slide = pptx_slide
+        # Shape name -> shape index used by _get_shape, built lazily on first lookup by name.
+        self._shapes_by_name = None
+        # DownsampleReport of the last add_chart call that downsampled, else None.
+        self.last_downsample = None
+
+    def _find_placeholder(self, placeholder_type):
+        """Returns the slide placeholder of the given type, or None if there is none.
+
+        The layout's shared placeholder map gives the idx of the placeholder; the
+        slide placeholder with that idx is then selected with a single XPath query.
+        A slide placeholder without an explicit type inherits it from the layout.
+        The same query also returns the placeholders of that type, for slides whose
+        placeholders do not line up with their layout; the first of those is the
+        fallback. A slide without such a placeholder costs that one query too.
+
+        Args:
+            placeholder_type (PP_PLACEHOLDER): The placeholder type to look for.
+        """
+        idx = _layout_placeholder_map(self.pptx_slide.slide_layout).get(placeholder_type)
+        type_test = "@type='%s'" % placeholder_type.xml_value
+        if placeholder_type == PP_PLACEHOLDER.OBJECT:
+            type_test = "not(@type) or " + type_test
+        if idx is None:
+            idx_value, ph_test = None, type_test
+        else:
+            idx_value = "0" if idx == 0 else str(idx)
+            idx_test = "not(@idx) or @idx='0'" if idx == 0 else "@idx='%d'" % idx
+            ph_test = "%s or %s" % (idx_test, type_test)
+
+        shapes = self.pptx_slide.shapes
+        fallback = None
+        for ph in shapes._spTree.xpath("./*/*/p:nvPr/p:ph[%s]" % ph_test):
+            if ph.get("idx", "0") == idx_value and (ph.get("type") is None or ph.type == placeholder_type):
+                return shapes._shape_factory(ph.getparent().getparent().getparent())
+            if fallback is None and ph.type == placeholder_type:
+                fallback = ph
+        if fallback is None:
+            return None
+        return shapes._shape_factory(fallback.getparent().getparent().getparent())
 
     def set_title(self, text):
         """Sets the title of this slide.
@@ -49,11 +128,7 @@ class PySlide:
         Raises:
             AttributeError: If the slide does not have a suitable subtitle placeholder.
         """
-        subtitle_shape = None
-        for shape in self.pptx_slide.placeholders:
-            if shape.placeholder_format.type == PP_PLACEHOLDER.SUBTITLE:
-                subtitle_shape = shape
-                break
+        subtitle_shape = self._find_placeholder(PP_PLACEHOLDER.SUBTITLE)
 
         if subtitle_shape:
             subtitle_shape.text = text
@@ -73,11 +148,7 @@ class PySlide:
         Raises:
             AttributeError: If the slide does not have a footer placeholder.
         """
-        footer_shape = None
-        for shape in self.pptx_slide.placeholders:
-            if shape.placeholder_format.type == PP_PLACEHOLDER.FOOTER:
-                footer_shape = shape
-                break
+        footer_shape = self._find_placeholder(PP_PLACEHOLDER.FOOTER)
 
         if footer_shape:
             footer_shape.text = text
@@ -101,6 +172,7 @@ class PySlide:
         """
         shape = self.pptx_slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
         shape.text_frame.text = text
+        self._index_shape(shape)
         return shape
 
     def add_bullet_point_box(self, items, left, top, width, height):
@@ -128,6 +200,7 @@ class PySlide:
             p.text = item_text
             p.level = 0
 
+        self._index_shape(shape)
         return shape
 
     def add_table_from_dataframe(self, dataframe, left, top, width, height,
@@ -138,7 +211,8 @@ class PySlide:
                                  row_heights=None,
                                  header_bold=DEFAULT_TABLE_HEADER_BOLD,
                                  header_font_color_rgb=None,
-                                 header_fill_color_rgb=None
+                                 header_fill_color_rgb=None,
+                                 bulk=DEFAULT_TABLE_BULK_BUILD
                                  ):
         """Adds a table to the slide populated from a Pandas DataFrame with styling.
 
@@ -161,6 +235,9 @@ class PySlide:
             header_bold (bool): True to make header text bold. Defaults to DEFAULT_TABLE_HEADER_BOLD.
             header_font_color_rgb (tuple, optional): RGB tuple for header font color (e.g., (255,255,255)).
             header_fill_color_rgb (tuple, optional): RGB tuple for header cell fill color (e.g., (0,0,0)).
+            bulk (bool): True to build all rows and cells as XML in a single pass (fast).
+                         False to fill the table cell by cell through python-pptx.
+                         Both produce identical output. Defaults to DEFAULT_TABLE_BULK_BUILD.
         Returns:
             pptx.shapes.graphfrm.GraphicFrame: The table shape object.
         """
@@ -172,70 +249,43 @@ class PySlide:
         if include_index:
             cols += 1
 
-        # Create the table shape
-        table_shape = self.pptx_slide.shapes.add_table(
-            rows, cols, Inches(left), Inches(top), Inches(width), Inches(height)
-        )
-        table = table_shape.table
-
-        # --- Populate Header Row ---
-        current_col_idx = 0
+        # --- Header Texts ---
+        header_texts = []
         if include_index:
             header_text = index_label if index_label is not None else (dataframe.index.name if dataframe.index.name is not None else "Index")
-            table.cell(0, current_col_idx).text = str(header_text)
-            current_col_idx += 1
+            header_texts.append(str(header_text))
 
         for df_col_name in dataframe.columns:
             display_name = str(df_col_name) # Default to original column name
             if column_labels and df_col_name in column_labels:
                 display_name = str(column_labels[df_col_name])
-            table.cell(0, current_col_idx).text = display_name
-            current_col_idx += 1
-
-        # --- Populate Data Rows ---
-        for i, df_row_tuple in enumerate(dataframe.itertuples(index=include_index, name=None)):
-            # df_row_tuple contains actual data values. If include_index=True, first element is index.
-
-            current_cell_idx_in_row = 0
-            data_tuple_offset = 0 # if include_index is False, df_row_tuple starts with first data col
-
-            if include_index:
-                index_val = df_row_tuple[0]
-                # Apply formatting to index if 'index_label' (or a convention) is in number_formats
-                # For now, index is added as string without specific formatting via number_formats
-                table.cell(i + 1, current_cell_idx_in_row).text = str(index_val)
-                current_cell_idx_in_row += 1
-                data_tuple_offset = 1 # Data starts from 2nd element of df_row_tuple
-
-            for col_idx, df_col_name in enumerate(dataframe.columns):
-                cell_value = df_row_tuple[col_idx + data_tuple_offset]
-
-                formatted_value = str(cell_value) # Default to string representation
-                if pd.isna(cell_value): # Handle NaN/None before formatting
-                    formatted_value = "" # Or some other placeholder like "N/A"
-                elif number_formats and df_col_name in number_formats:
-                    try:
-                        fmt_spec = number_formats[df_col_name]
-                        # Ensure value is appropriate for format spec (e.g. numeric for 'f', 'd')
-                        if isinstance(cell_value, (int, float)):
-                             formatted_value = f"{cell_value:{fmt_spec}}"
-                        # else: formatted_value remains str(cell_value) if format spec is for numbers but type isn't
-                    except ValueError:
-                        # print(f"Warning: Could not apply format '{fmt_spec}' to value '{cell_value}' in col '{df_col_name}'. Using default string.")
-                        pass # Keep default string if formatting fails
-
-                table.cell(i + 1, current_cell_idx_in_row).text = formatted_value
-                current_cell_idx_in_row += 1
-
-        # --- Apply Table-wide Font Styling ---
-        if font_name or font_size:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.text_frame.paragraphs:
-                        if font_name:
-                            paragraph.font.name = font_name
-                        if font_size:
-                            paragraph.font.size = Pt(font_size)
+            header_texts.append(display_name)
+
+        # --- Data Texts ---
+        column_texts = format_table_columns(dataframe, include_index=include_index,
+                                            number_formats=number_formats)
+
+        if bulk:
+            # Create a one-row table for the frame and grid, then write every row in one pass.
+            table_shape = self.pptx_slide.shapes.add_table(
+                1, cols, Inches(left), Inches(top), Inches(width), Inches(height)
+            )
+            table = table_shape.table
+            populate_table(table._tbl, header_texts, column_texts, Inches(height),
+                           font_name=font_name, font_size=font_size,
+                           header_bold=header_bold,
+                           header_font_color_rgb=header_font_color_rgb,
+                           header_fill_color_rgb=header_fill_color_rgb)
+        else:
+            table_shape = self.pptx_slide.shapes.add_table(
+                rows, cols, Inches(left), Inches(top), Inches(width), Inches(height)
+            )
+            table = table_shape.table
+            self._populate_table_per_cell(table, header_texts, column_texts,
+                                          font_name=font_name, font_size=font_size,
+                                          header_bold=header_bold,
+                                          header_font_color_rgb=header_font_color_rgb,
+                                          header_fill_color_rgb=header_fill_color_rgb)
 
         # --- Apply Column Widths ---
         if column_widths:
@@ -259,6 +309,36 @@ class PySlide:
                     if row_idx < len(table.rows):
                         table.rows[row_idx].height = Inches(rh_val)
 
+        self._index_shape(table_shape)
+        return table_shape
+
+    def _populate_table_per_cell(self, table, header_texts, column_texts,
+                                 font_name=None, font_size=None,
+                                 header_bold=DEFAULT_TABLE_HEADER_BOLD,
+                                 header_font_color_rgb=None,
+                                 header_fill_color_rgb=None):
+        """Fills and styles `table` one cell at a time through the python-pptx API.
+
+        This is the fallback for add_table_from_dataframe(bulk=False); it produces
+        the same XML as the bulk builder in pypptx.table.
+        """
+        for col_idx, text in enumerate(header_texts):
+            table.cell(0, col_idx).text = text
+
+        for col_idx, texts in enumerate(column_texts):
+            for i, text in enumerate(texts):
+                table.cell(i + 1, col_idx).text = text
+
+        # --- Apply Table-wide Font Styling ---
+        if font_name or font_size:
+            for row in table.rows:
+                for cell in row.cells:
+                    for paragraph in cell.text_frame.paragraphs:
+                        if font_name:
+                            paragraph.font.name = font_name
+                        if font_size:
+                            paragraph.font.size = Pt(font_size)
+
         # --- Style Header Row ---
         for col_idx in range(len(table.columns)):
             cell = table.cell(0, col_idx) # Header row is index 0
@@ -273,8 +353,6 @@ class PySlide:
                 cell.fill.solid()
                 cell.fill.fore_color.rgb = RGBColor(*header_fill_color_rgb)
 
-        return table_shape
-
     def add_shape(self, shape_type, left, top, width, height, shape_name=None):
         """Adds a predefined shape to the slide.
 
@@ -299,8 +377,102 @@ class PySlide:
         if shape_name:
             new_shape.name = shape_name
 
+        self._index_shape(new_shape)
         return new_shape
 
+    def add_picture(self, image, left, top, width=None, height=None, shape_name=None,
+                    max_dpi=DEFAULT_PICTURE_MAX_DPI, reencode=DEFAULT_PICTURE_REENCODE):
+        """Adds a picture to the slide.
+
+        Images are stored once per presentation: inserting an image that is already
+        in the deck (same content, from any path, bytes or stream) reuses its image
+        part, and its hash and native size are looked up instead of recomputed.
+        A file already inserted from the same path is not read again unless it
+        changed on disk.
+
+        Args:
+            image (str, os.PathLike, bytes or file-like): Path to the image file, the
+                image bytes, or a binary file-like object.
+            left (float): The left position of the picture (in Inches).
+            top (float): The top position of the picture (in Inches).
+            width (float, optional): The width of the picture (in Inches).
+            height (float, optional): The height of the picture (in Inches). If only one
+                of width and height is given, the other keeps the image's aspect ratio;
+                if neither is given, the image's native size is used.
+            shape_name (str, optional): An optional name for the picture shape.
+            max_dpi (float, optional): Downscale the image to this resolution at its size
+                on the slide (needs width or height). Defaults to DEFAULT_PICTURE_MAX_DPI.
+            reencode (str, optional): "jpeg" or "auto" to re-encode the image if that
+                makes it smaller (see imaging.prepare_image). Defaults to DEFAULT_PICTURE_REENCODE.
+                To prepare many pictures in parallel, use PyPPT.add_pictures.
+
+        Returns:
+            pptx.shapes.picture.Picture: The newly added picture shape.
+
+        Raises:
+            ValueError: If max_dpi or reencode is not valid.
+        """
+        package = self.pptx_slide.part.package
+        registry = media_registry(package)
+        if max_dpi is None and reencode is None:
+            image_part, native_size = registry.get_or_add_image(package, image)
+        else:
+            cx = Inches(width) if width is not None else None
+            cy = Inches(height) if height is not None else None
+            image_part, native_size = registry.get_or_add_prepared(
+                package, [(image, cx, cy)], max_dpi, reencode, DEFAULT_JPEG_QUALITY)[0]
+        return self._add_picture_part(image_part, native_size, left, top, width, height, shape_name)
+
+    def _add_picture_part(self, image_part, native_size, left, top, width, height, shape_name):
+        """Adds a picture shape showing `image_part` (already in the package) to the slide."""
+        slide_part = self.pptx_slide.part
+        rId = slide_part.relate_to(image_part, RT.IMAGE)
+        cx, cy = scale_size(native_size,
+                            Inches(width) if width is not None else None,
+                            Inches(height) if height is not None else None)
+
+        shapes = self.pptx_slide.shapes
+        shape_id = shapes._next_shape_id
+        pic = shapes._spTree.add_pic(shape_id, "Picture %d" % (shape_id - 1), image_part.desc, rId,
+                                     Inches(left), Inches(top), cx, cy)
+        shapes._recalculate_extents()
+        picture = shapes._shape_factory(pic)
+        if shape_name:
+            picture.name = shape_name
+
+        self._index_shape(picture)
+        return picture
+
+    def _build_shape_index(self):
+        """(Re)builds the shape name index from the slide's current shapes.
+
+        When several shapes share a name, the first one in z-order wins, as with a linear scan.
+        """
+        shapes_by_name = {}
+        for shape_in_slide in self.pptx_slide.shapes:
+            shapes_by_name.setdefault(shape_in_slide.name, shape_in_slide)
+        self._shapes_by_name = shapes_by_name
+        return shapes_by_name
+
+    def _index_shape(self, shape):
+        """Adds a shape created through this wrapper to the name index, if the index exists."""
+        if self._shapes_by_name is not None:
+            self._shapes_by_name.setdefault(shape.name, shape)
+
+    def _get_shape_by_name(self, name):
+        """Returns the shape called `name` using the name index, or None if there is none.
+
+        A cached entry is only trusted if the shape is still on this slide and still
+        has that name; otherwise (or on a miss) the index is rebuilt once, which picks
+        up shapes that were added, removed or renamed outside this wrapper.
+        """
+        if self._shapes_by_name is not None:
+            shape = self._shapes_by_name.get(name)
+            if (shape is not None and shape.name == name
+                    and shape._element.getparent() is self.pptx_slide.shapes._spTree):
+                return shape
+        return self._build_shape_index().get(name)
+
     def _get_shape(self, shape_ref):
         """Internal helper to retrieve a shape object.
 
@@ -318,10 +490,10 @@ class PySlide:
         if hasattr(shape_ref, 'shape_type'): # Check if it's already a Shape object (duck typing)
             return shape_ref
         elif isinstance(shape_ref, str): # Find by name
-            for shape_in_slide in self.pptx_slide.shapes:
-                if shape_in_slide.name == shape_ref:
-                    return shape_in_slide
-            raise ValueError(f"Shape with name '{shape_ref}' not found on this slide.")
+            shape = self._get_shape_by_name(shape_ref)
+            if shape is None:
+                raise ValueError(f"Shape with name '{shape_ref}' not found on this slide.")
+            return shape
         elif isinstance(shape_ref, int): # Find by index
             try:
                 return self.pptx_slide.shapes[shape_ref]
@@ -369,12 +541,94 @@ class PySlide:
         shape.line.width = Pt(weight_pt)
         # Setting width usually makes the line visible if it had 'no line' previously.
 
-    def add_chart(self, chart_type, chart_data_dict, left, top, width, height, chart_title=None):
+    def style_shapes(self, styles):
+        """Applies fill color, line color and line weight to many named shapes at once.
+
+        All names are resolved in a single pass over the slide's shapes before any
+        styling is applied, so either every shape is styled or none is.
+
+        Args:
+            styles (dict): Maps shape names to style dicts with any of the keys
+                'fill' (RGB tuple), 'line' (RGB tuple) and 'weight' (line weight in points).
+                Example: {"Box 1": {"fill": (255, 0, 0), "weight": 2}}
+
+        Raises:
+            ValueError: If a shape name is not found or a style key is not recognised.
+        """
+        unknown_keys = {key for style in styles.values() for key in style} - {"fill", "line", "weight"}
+        if unknown_keys:
+            raise ValueError(f"Unknown style keys {sorted(unknown_keys)}; expected 'fill', 'line' or 'weight'.")
+
+        shapes_by_name = self._build_shape_index()
+        missing_names = [name for name in styles if name not in shapes_by_name]
+        if missing_names:
+            raise ValueError(f"Shapes with names {missing_names} not found on this slide.")
+
+        for name, style in styles.items():
+            shape = shapes_by_name[name]
+            if "fill" in style:
+                self.set_shape_fill_color(shape, *style["fill"])
+            if "line" in style:
+                self.set_shape_line_color(shape, *style["line"])
+            if "weight" in style:
+                self.set_shape_line_weight(shape, style["weight"])
+
+    @staticmethod
+    def _chart_data_from_dict(chart_data_dict):
+        """Validates a chart data dict and returns (chart data, number of series).
+
+        Dicts of plain lists go through CategoryChartData as before. If the categories
+        or any series values are arrays (NumPy, pandas), validation is done on array
+        shapes and ArrayCategoryChartData is used instead.
+        """
+        if not isinstance(chart_data_dict, dict):
+            raise ValueError("chart_data_dict must be a dictionary or a pandas DataFrame.")
+        series_list = chart_data_dict.get('series')
+        if not isinstance(series_list, list):
+            raise ValueError("chart_data_dict must contain a 'series' list.")
+        if not series_list: # Check if series list is empty
+            raise ValueError("chart_data_dict['series'] list cannot be empty.")
+        for s in series_list:
+            if not isinstance(s, dict) or 'name' not in s or 'values' not in s:
+                raise ValueError("Each item in 'series' must be a dict with 'name' and 'values'.")
+
+        categories = chart_data_dict.get('categories')
+        if categories is None:
+            raise ValueError("chart_data_dict must contain a 'categories' list.")
+        if isinstance(categories, _ARRAY_TYPES) or any(isinstance(s['values'], _ARRAY_TYPES) for s in series_list):
+            chart_data = array_chart_data(categories, [(s['name'], s['values']) for s in series_list])
+            return chart_data, len(series_list)
+
+        if not isinstance(categories, list):
+            raise ValueError("chart_data_dict must contain a 'categories' list.")
+        for s in series_list:
+            if not isinstance(s['values'], list):
+                raise ValueError("Each series 'values' must be a list.")
+            if len(s['values']) != len(categories):
+                raise ValueError(
+                    f"Series '{s['name']}' has {len(s['values'])} values, "
+                    f"but there are {len(categories)} categories."
+                )
+
+        chart_data = CategoryChartData()
+        chart_data.categories = categories
+        for series_item in series_list:
+            values = series_item['values']
+            # NaN would be written as "nan"; python-pptx leaves None points out of the chart.
+            # pd.isna also covers pd.NA, whose comparisons cannot be used as booleans.
+            if any(pd.isna(value) for value in values):
+                values = [None if pd.isna(value) else value for value in values]
+            chart_data.add_series(series_item['name'], values)
+        return chart_data, len(series_list)
+
+    def add_chart(self, chart_type, chart_data_dict, left, top, width, height, chart_title=None,
+                  workbook_mode=DEFAULT_CHART_WORKBOOK_MODE, downsample=None,
+                  max_points=DEFAULT_DOWNSAMPLE_POINTS):
         """Adds a chart to the slide.
 
         Args:
             chart_type (XL_CHART_TYPE): Type of chart (e.g., XL_CHART_TYPE.LINE).
-            chart_data_dict (dict): Data for the chart. Expected structure:
+            chart_data_dict (dict or pd.DataFrame): Data for the chart. Either a dict:
                 {
                     'categories': ['Cat1', 'Cat2', ...],
                     'series': [
@@ -382,50 +636,60 @@ class PySlide:
                         {'name': 'Series2 Name', 'values': [valA, valB, ...]}
                     ]
                 }
+                where 'categories' and each 'values' may also be NumPy arrays or pandas
+                Series/Index, or a DataFrame whose index gives the categories and whose
+                columns give the series (column name -> series name).
+                Array and DataFrame data is written to the chart straight from the arrays;
+                NaN values are left out of the chart like None.
             left (float): Left position of the chart (Inches).
             top (float): Top position of the chart (Inches).
             width (float): Width of the chart (Inches).
             height (float): Height of the chart (Inches).
             chart_title (str, optional): Title for the chart.
+            workbook_mode (str): How the chart's Excel data workbook is embedded.
+                "full" builds and embeds a workbook for this chart.
+                "shared" reuses the workbook of a chart with identical data in the
+                same presentation.
+                "cached" embeds a minimal workbook holding just the chart's values,
+                written directly rather than through python-pptx's workbook writer.
+                DataFrame and array data use that direct writer in "full" mode too.
+                Defaults to DEFAULT_CHART_WORKBOOK_MODE.
+
+                Warning: in "shared" mode, calling chart.replace_data() on one chart
+                rewrites the workbook behind every chart that shares it, so their
+                embedded data no longer matches what they display. Use "full" for
+                charts whose data will be replaced later.
+            downsample (str, optional): Reduce series longer than `max_points` before
+                building the chart: "lttb" (Largest-Triangle-Three-Buckets, keeps the
+                shape of the line), "minmax" (minimum and maximum per bucket, keeps
+                spikes) or "stride" (every n-th point). With several series, each is
+                downsampled to an equal share of `max_points` and the chart keeps the
+                union. A DownsampleReport is stored in `self.last_downsample`.
+                Defaults to None (every point is plotted).
+            max_points (int): Most points the chart keeps per series when downsampling;
+                              the union over all series never exceeds it either.
+                              Defaults to DEFAULT_DOWNSAMPLE_POINTS.
 
         Returns:
             pptx.shapes.graphfrm.GraphicFrame: The graphic frame containing the chart.
 
         Raises:
-            ValueError: If chart_data_dict structure is invalid.
+            ValueError: If chart_data_dict structure is invalid, or workbook_mode or
+                        the downsampling settings are unknown.
         """
-        # Validate chart_data_dict structure
-        if not isinstance(chart_data_dict, dict):
-            raise ValueError("chart_data_dict must be a dictionary.")
-        if 'categories' not in chart_data_dict or not isinstance(chart_data_dict['categories'], list):
-            raise ValueError("chart_data_dict must contain a 'categories' list.")
-        if 'series' not in chart_data_dict or not isinstance(chart_data_dict['series'], list):
-            raise ValueError("chart_data_dict must contain a 'series' list.")
-        if not chart_data_dict['series']: # Check if series list is empty
-             raise ValueError("chart_data_dict['series'] list cannot be empty.")
-        for s in chart_data_dict['series']:
-            if not isinstance(s, dict) or 'name' not in s or 'values' not in s:
-                raise ValueError("Each item in 'series' must be a dict with 'name' and 'values'.")
-            if not isinstance(s['values'], list):
-                raise ValueError("Each series 'values' must be a list.")
-            if len(s['values']) != len(chart_data_dict['categories']):
-                raise ValueError(
-                    f"Series '{s['name']}' has {len(s['values'])} values, "
-                    f"but there are {len(chart_data_dict['categories'])} categories."
-                )
-
-        chart_data = CategoryChartData()
-        chart_data.categories = chart_data_dict['categories']
-
-        for series_item in chart_data_dict['series']:
-            chart_data.add_series(series_item['name'], series_item['values'])
+        if isinstance(chart_data_dict, pd.DataFrame):
+            chart_data = dataframe_chart_data(chart_data_dict)
+            n_series = len(chart_data_dict.columns)
+        else:
+            chart_data, n_series = self._chart_data_from_dict(chart_data_dict)
+        if downsample is not None:
+            chart_data, self.last_downsample = downsample_chart_data(chart_data, max_points, downsample)
 
-        graphic_frame = self.pptx_slide.shapes.add_chart(
-            chart_type,
-            Inches(left), Inches(top),
-            Inches(width), Inches(height),
-            chart_data
-        )
+        shapes = self.pptx_slide.shapes
+        rId = add_chart_part(self.pptx_slide.part, chart_type, chart_data, workbook_mode)
+        frame_elm = shapes._add_chart_graphicFrame(rId, Inches(left), Inches(top), Inches(width), Inches(height))
+        shapes._recalculate_extents()
+        graphic_frame = shapes._shape_factory(frame_elm)
 
         chart = graphic_frame.chart
 
@@ -435,9 +699,10 @@ class PySlide:
         else:
             chart.has_title = False
 
-        if len(chart_data_dict['series']) > 1:
+        if n_series > 1:
             chart.has_legend = True
         else:
             chart.has_legend = False
 
+        self._index_shape(graphic_frame)
         return graphic_frame
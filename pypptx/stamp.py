@@ -0,0 +1,206 @@
+# stamp.py in pypptx directory
+#
+# Precompiled shapes for placing many identically styled shapes quickly. A
+# ShapeStamp builds its styled shape once through python-pptx (so the markup is
+# exactly what add_shape/add_text_box plus the styling calls produce), then
+# serializes it with slot markers for the shape id, name, position, size, fill
+# color and paragraphs, and keeps the XML as literal chunks between the slots,
+# as MergeTemplate does for deck parts. Stamping a shape joins the chunks with
+# the slot values and parses the result once; no property is set through the
+# object API per shape.
+
+import re
+from xml.sax.saxutils import escape
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.shapes.autoshape import AutoShapeType, Shape
+from pptx.util import Inches, Pt
+
+from .fragments import paragraphs_xml, pPr_xml
+
+# Private-use characters bracketing a slot name while the prototype is serialized
+# (see mailmerge.py); they cannot occur in the markup python-pptx writes.
+_SLOT_OPEN, _SLOT_CLOSE = "\ue000", "\ue001"
+_SLOT_RE = re.compile("%s(\\w+)%s" % (_SLOT_OPEN, _SLOT_CLOSE))
+
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+def _slot(name):
+    return _SLOT_OPEN + name + _SLOT_CLOSE
+
+
+def _attr_value(value):
+    """Escapes `value` for use inside a double-quoted XML attribute."""
+    return escape(value, {'"': "&quot;"})
+
+
+def _color_value(rgb):
+    return str(RGBColor(*rgb))
+
+
+class ShapeStamp:
+    """A styled shape compiled once into XML, then stamped onto slides with new text and geometry.
+
+    Stamping skips python-pptx's per-property object API: each stamp fills the
+    slots of the precompiled XML (text, position, size and fill color) and parses
+    it. The shapes are identical to the ones add_shape or add_text_box followed by
+    the equivalent styling calls would produce.
+
+    Example:
+        callout = ShapeStamp(MSO_SHAPE.ROUNDED_RECTANGLE, width=2, height=0.5,
+                             fill=(255, 242, 204), line=(191, 144, 0), line_weight=1,
+                             font_name="Arial", font_size=10, bold=True)
+        for i, (x, y) in enumerate(positions):
+            callout.stamp(slide, f"Store {i}", x, y)
+
+    All positions and sizes are in Inches.
+
+    Args:
+        shape_type (MSO_SHAPE, optional): The autoshape type. None (the default) makes text boxes.
+        width (float, optional): Default width of stamped shapes.
+        height (float, optional): Default height of stamped shapes.
+        fill (tuple, optional): RGB fill color. Only stamps compiled with a fill accept a
+                                per-shape `fill` when stamped.
+        line (tuple, optional): RGB line color.
+        line_weight (float, optional): Line weight in points.
+        font_name (str, optional): Font of the text.
+        font_size (int, optional): Font size of the text in points.
+        bold (bool): Whether the text is bold. Defaults to False.
+        font_color (tuple, optional): RGB color of the text.
+    """
+
+    def __init__(self, shape_type=None, width=None, height=None, fill=None, line=None, line_weight=None,
+                 font_name=None, font_size=None, bold=False, font_color=None):
+        self.shape_type = shape_type
+        self.width = width
+        self.height = height
+        self.has_fill = fill is not None
+        self._fill_value = _color_value(fill) if self.has_fill else None
+        self._pPr_xml = pPr_xml(font_name, font_size, bold, font_color)
+        if shape_type is None:
+            self._basename = "TextBox"
+            sp = CT_Shape.new_textbox_sp(0, "", 0, 0, 0, 0)
+        else:
+            autoshape_type = AutoShapeType(shape_type)
+            self._basename = autoshape_type.basename
+            sp = CT_Shape.new_autoshape_sp(0, "", autoshape_type.prst, 0, 0, 0, 0)
+        self._chunks, self._slots = self._compile(sp, fill, line, line_weight)
+
+    @staticmethod
+    def _compile(sp, fill, line, line_weight):
+        """Styles the prototype `sp` and splits its XML into literal chunks and slot names."""
+        shape = Shape(sp, None)
+        if fill is not None:
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = RGBColor(*fill)
+            sp.spPr.find("{%s}solidFill/{%s}srgbClr" % (_A_NS, _A_NS)).set("val", _slot("fill"))
+        if line is not None:
+            shape.line.color.rgb = RGBColor(*line)
+        if line_weight is not None:
+            shape.line.width = Pt(line_weight)
+
+        sp.nvSpPr.cNvPr.set("id", _slot("id"))
+        sp.nvSpPr.cNvPr.set("name", _slot("name"))
+        xfrm = sp.spPr.xfrm
+        for element, attrs in ((xfrm.off, ("x", "y")), (xfrm.ext, ("cx", "cy"))):
+            for attr in attrs:
+                element.set(attr, _slot(attr))
+        # The paragraphs go where the prototype's empty paragraph was, after <a:lstStyle>.
+        txBody = sp.txBody
+        p_lst = txBody.p_lst
+        p_lst[0].getprevious().tail = _slot("paragraphs")
+        for p in p_lst:
+            txBody.remove(p)
+
+        pieces = _SLOT_RE.split(etree.tostring(sp, encoding="unicode"))
+        return pieces[0::2], pieces[1::2]
+
+    def _xml(self, values):
+        chunks = self._chunks
+        parts = [chunks[0]]
+        for chunk, slot in zip(chunks[1:], self._slots):
+            parts.append(values[slot])
+            parts.append(chunk)
+        return "".join(parts)
+
+    def _values(self, shape_id, text, left, top, width, height, fill, name):
+        if width is None:
+            width = self.width
+        if height is None:
+            height = self.height
+        if width is None or height is None:
+            raise ValueError("width and height are required when the stamp has no default size.")
+        if fill is not None and not self.has_fill:
+            raise ValueError("fill can only be given for stamps compiled with a fill color.")
+        paragraphs = text if isinstance(text, (list, tuple)) else [text]
+        return {
+            "id": str(shape_id),
+            # python-pptx's basenames come XML-escaped already.
+            "name": _attr_value(name) if name is not None else "%s %d" % (self._basename, shape_id - 1),
+            "x": str(Inches(left)), "y": str(Inches(top)),
+            "cx": str(Inches(width)), "cy": str(Inches(height)),
+            "fill": self._fill_value if fill is None else _color_value(fill),
+            "paragraphs": paragraphs_xml("\n".join(paragraphs), self._pPr_xml),
+        }
+
+    def _add(self, py_slide, shape_id, text, left, top, width=None, height=None, fill=None, name=None):
+        sp = parse_xml(self._xml(self._values(shape_id, text, left, top, width, height, fill, name)))
+        shapes = py_slide.pptx_slide.shapes
+        shapes._spTree.insert_element_before(sp, "p:extLst")
+        shape = shapes._shape_factory(sp)
+        py_slide._index_shape(shape)
+        return shape
+
+    def stamp(self, py_slide, text, left, top, width=None, height=None, fill=None, name=None):
+        """Adds a shape with this stamp's style to `py_slide`.
+
+        Args:
+            py_slide (PySlide): The slide to add the shape to.
+            text (str or list[str]): The text; a line-feed or each list item starts a paragraph.
+            left (float): The left position of the shape (Inches).
+            top (float): The top position of the shape (Inches).
+            width (float, optional): The width (Inches). Defaults to the stamp's width.
+            height (float, optional): The height (Inches). Defaults to the stamp's height.
+            fill (tuple, optional): RGB fill color replacing the stamp's fill color.
+            name (str, optional): The shape name. Defaults to python-pptx's naming, e.g. "TextBox 3".
+
+        Returns:
+            pptx.shapes.autoshape.Shape: The new shape.
+
+        Raises:
+            ValueError: If no size is given and the stamp has none, or `fill` is given for a
+                        stamp compiled without fill.
+        """
+        shape_id = py_slide.pptx_slide.shapes._next_shape_id
+        return self._add(py_slide, shape_id, text, left, top, width, height, fill, name)
+
+    def stamp_many(self, py_slide, items):
+        """Adds a shape for each item of `items` to `py_slide`, numbering shape ids from one lookup.
+
+        Args:
+            py_slide (PySlide): The slide to add the shapes to.
+            items (iterable[dict]): Keyword arguments of `stamp` for each shape, e.g.
+                                    {"text": "North", "left": 1, "top": 2, "fill": (255, 0, 0)}.
+
+        Returns:
+            list[pptx.shapes.autoshape.Shape]: The new shapes, in the order of `items`.
+
+        Raises:
+            ValueError: As `stamp`. Shapes added for earlier items are kept.
+        """
+        shapes = py_slide.pptx_slide.shapes
+        shape_id = shapes._next_shape_id
+        added = []
+        try:
+            for item in items:
+                added.append(self._add(py_slide, shape_id, **item))
+                shape_id += 1
+        finally:
+            if added and shapes._cached_max_shape_id is not None:
+                # python-pptx's turbo mode caches the highest id; keep it in step.
+                shapes._cached_max_shape_id = shape_id - 1
+        return added
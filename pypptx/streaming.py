@@ -0,0 +1,193 @@
+# streaming.py in pypptx directory
+#
+# Streaming presentation writer. PyPPT keeps every slide's XML tree in memory
+# until save(); for decks with thousands of slides that dominates memory use.
+# StreamingPPT writes each slide to the output zip as soon as the next one is
+# started, together with the parts only reachable through it (charts and
+# their workbooks, notes, images), and replaces it in the package with a
+# content-free stand-in. The presentation part, layouts, masters and the
+# content types are written when the writer is closed.
+
+import os
+import zipfile
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import Part, _Relationship
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from .chart_workbook import replace_shared_workbooks
+from .constants import DEFAULT_LAYOUT_REF, DEFAULT_SAVE_COMPRESSION, DEFAULT_SAVE_COMPRESSLEVEL
+from .media import replace_media_parts
+from .package import zip_compression
+from .presentation import PyPPT
+
+# Relationships from a slide (or its notes) to parts that belong to the whole
+# deck; these are written at close, not with the slide.
+_DECK_RELTYPES = frozenset((RT.SLIDE_LAYOUT, RT.NOTES_MASTER, RT.SLIDE))
+
+
+class _WrittenPart(Part):
+    """Stand-in for a part already written to the zip.
+
+    Keeps the partname, content type and relationship graph of the part it
+    replaces, so content types and new partnames are still computed correctly,
+    but none of its content. Pictures added later can still show an image that
+    was already written, so an image's description is kept too.
+    """
+
+    def __init__(self, part):
+        super().__init__(part.partname, part.content_type, part.package)
+        self.desc = getattr(part, "desc", None)
+
+
+class StreamingPPT:
+    """Builds a presentation slide by slide, writing finished slides out immediately.
+
+    A slide is finished when the next slide is added, when finish_slide() is
+    called, or when the writer is closed. Finished slides are written to the
+    output and dropped from memory, so memory use stays roughly constant however
+    many slides are added. A finished slide can no longer be changed or read
+    through the writer.
+
+    Parts a finished slide shares with later slides (e.g. a logo image or a
+    shared chart workbook) are written with the first slide that uses them and
+    must not be changed afterwards.
+
+    Example:
+        with StreamingPPT("appendix.pptx", pptx_path="template.pptx") as deck:
+            for frame in frames:
+                slide = deck.add_slide("Title Only")
+                slide.set_title(frame.name)
+                slide.add_table_from_dataframe(frame, 0.5, 1.5, 9, 5)
+
+    Args:
+        file (str or file-like): Output path, or a binary stream open for writing.
+        pptx_path (str, optional): Template presentation (see PyPPT). Slides already in
+                                   the template are kept in memory and written at close.
+        layout_aliases (dict, optional): Layout aliases (see PyPPT).
+        compression (str): "deflate" or "stored". Defaults to DEFAULT_SAVE_COMPRESSION.
+        compresslevel (int, optional): Deflate level 0-9. Defaults to DEFAULT_SAVE_COMPRESSLEVEL.
+
+    Raises:
+        ValueError: If the compression setting is not valid.
+    """
+
+    def __init__(self, file, pptx_path=None, layout_aliases=None,
+                 compression=DEFAULT_SAVE_COMPRESSION, compresslevel=DEFAULT_SAVE_COMPRESSLEVEL):
+        zip_mode, zip_level = zip_compression(compression, compresslevel)
+        # The PyPPT being built; use it for deck-level settings such as layout aliases.
+        self.ppt = PyPPT(pptx_path, layout_aliases=layout_aliases)
+        self._file = file
+        self._zip = zipfile.ZipFile(file, "w", compression=zip_mode, compresslevel=zip_level,
+                                    strict_timestamps=False)
+        self._written = {}  # partname -> _WrittenPart of every part written so far
+        self._current = None  # (PySlide, rId) of the slide being built
+        self.slides_written = 0
+
+    def add_slide(self, layout_ref=DEFAULT_LAYOUT_REF, master_index=None):
+        """Finishes the current slide and adds a new one (see PyPPT.add_slide).
+
+        Returns:
+            PySlide: The new slide, which can be filled until the next slide is added.
+
+        Raises:
+            ValueError: If the writer is closed.
+        """
+        self.finish_slide()
+        py_slide = self.ppt.add_slide(layout_ref, master_index=master_index)
+        self._current = (py_slide, self.ppt.presentation.slides._sldIdLst[-1].rId)
+        return py_slide
+
+    def finish_slide(self):
+        """Writes the current slide to the output and drops it from memory.
+
+        Raises:
+            ValueError: If the writer is closed.
+        """
+        if self._zip is None:
+            raise ValueError("The streaming writer is closed.")
+        if self._current is None:
+            return
+        py_slide, rId = self._current
+        self._current = None
+        slide_part = py_slide.pptx_slide.part
+        replaced = {}
+        stand_in = self._write_part_tree(slide_part, replaced)
+        # Images and shared workbooks written with this slide are reused by later slides through their stand-ins.
+        package = slide_part.package
+        replace_media_parts(package, replaced)
+        replace_shared_workbooks(package, replaced)
+        # The presentation now relates to the stand-in; nothing refers to the slide part any more.
+        # The relationship is replaced, not edited, since it caches its target part.
+        rels = self.ppt.presentation.part.rels
+        rels._rels[rId] = _Relationship(rels._base_uri, rId, RT.SLIDE, RTM.INTERNAL, stand_in)
+        self.ppt._slide_wrappers.pop(slide_part, None)
+        self.slides_written += 1
+
+    def _write_part_tree(self, part, replaced):
+        """Writes `part` and the parts only reachable through it; returns its stand-in.
+
+        Every part written is added to `replaced`, mapped to its stand-in.
+        """
+        stand_in = self._written.get(part.partname)
+        if stand_in is not None:
+            return stand_in
+        stand_in = self._written[part.partname] = replaced[part] = _WrittenPart(part)
+        self._write_part(part)
+        for rel in part.rels.values():
+            if rel.is_external or rel.reltype in _DECK_RELTYPES:
+                continue
+            stand_in.relate_to(self._write_part_tree(rel.target_part, replaced), rel.reltype)
+        return stand_in
+
+    def _write_part(self, part):
+        self._zip.writestr(part.partname.membername, part.blob)
+        if part._rels:
+            self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+    def close(self):
+        """Finishes the current slide and writes the rest of the presentation.
+
+        Closing an already closed writer does nothing.
+        """
+        if self._zip is None:
+            return
+        self.finish_slide()
+        package = self.ppt.presentation.part.package
+        parts = {}
+        for part in package.iter_parts():
+            if part.partname in self._written:
+                continue
+            parts[part.partname] = part
+            self._write_part(part)
+        parts.update(self._written)
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        self._zip.writestr(CONTENT_TYPES_URI.membername,
+                           serialize_part_xml(_ContentTypesItem.xml_for(tuple(parts.values()))))
+        self._zip.close()
+        self._zip = None
+
+    def abort(self):
+        """Stops writing without completing the presentation.
+
+        If the output is a path, the partial file is removed.
+        """
+        if self._zip is None:
+            return
+        self._zip.close()
+        self._zip = None
+        self._current = None
+        if isinstance(self._file, (str, os.PathLike)) and os.path.exists(self._file):
+            os.remove(self._file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,133 @@
+# table.py in pypptx directory
+#
+# Bulk population engine for DataFrame-backed tables. Instead of going through
+# python-pptx's per-cell proxies (table.cell(r, c).text, paragraph.font, ...),
+# the <a:tr>/<a:tc> elements are written as one XML string and parsed once.
+# The markup produced here mirrors what the per-cell API writes, so both paths
+# serialize to identical XML.
+
+from itertools import repeat
+
+import numpy as np
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+from .fragments import paragraphs_xml, pPr_xml
+
+
+def _tc_xml(text, cell_pPr_xml, tcPr_xml):
+    """Returns the markup for one <a:tc> holding `text`, as assigning to `_Cell.text` would."""
+    return "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>%s</a:txBody>%s</a:tc>" % (
+        paragraphs_xml(text, cell_pPr_xml), tcPr_xml
+    )
+
+
+def _format_values(values, fmt_spec):
+    """Applies `fmt_spec` to every value of a numeric column in one call.
+
+    Falls back to formatting value by value (keeping str(value) where the spec
+    does not apply) only if the spec is rejected for the column.
+    """
+    try:
+        return list(map(format, values, repeat(fmt_spec)))
+    except ValueError:
+        return [_format_value(value, fmt_spec) for value in values]
+
+
+def _format_value(value, fmt_spec):
+    """Formats a single value, keeping str(value) if it is not a number or the spec fails."""
+    if isinstance(value, (int, float)):
+        try:
+            return format(value, fmt_spec)
+        except ValueError:
+            pass
+    return str(value)
+
+
+def format_table_columns(dataframe, include_index=False, number_formats=None):
+    """Converts the values of `dataframe` into the strings displayed in the table body.
+
+    Works one column at a time: a NaN mask is built per column with NumPy, the
+    column's `number_formats` spec is applied to all of its non-null values in a
+    single pass, and missing values become empty strings.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame to format.
+        include_index (bool): True to prepend the index as the first column.
+        number_formats (dict, optional): Maps DataFrame column names to format specs.
+
+    Returns:
+        list[list[str]]: One list of cell strings per table column.
+    """
+    columns = []
+    if include_index:
+        # Index is added as string without specific formatting via number_formats
+        columns.append(list(map(str, dataframe.index.tolist())))
+
+    for col_idx, df_col_name in enumerate(dataframe.columns):
+        series = dataframe.iloc[:, col_idx]
+        values = np.fromiter(series.tolist(), dtype=object, count=len(series))
+        mask = series.isna().to_numpy(dtype=bool)
+        present = ~mask
+
+        fmt_spec = number_formats[df_col_name] if number_formats and df_col_name in number_formats else None
+        texts = np.full(len(series), "", dtype=object)
+        if fmt_spec is None:
+            texts[present] = list(map(str, values[present]))
+        elif (is_integer_dtype(series.dtype) or is_float_dtype(series.dtype)
+              or is_bool_dtype(series.dtype)):
+            texts[present] = _format_values(values[present], fmt_spec)
+        else:
+            texts[present] = [_format_value(value, fmt_spec) for value in values[present]]
+        columns.append(texts.tolist())
+    return columns
+
+
+def populate_table(tbl, header_texts, columns, height,
+                   font_name=None, font_size=None,
+                   header_bold=True, header_font_color_rgb=None, header_fill_color_rgb=None):
+    """Replaces the rows of `tbl` with a header row and data rows built in one pass.
+
+    Row heights are distributed the same way python-pptx's `add_table` does:
+    `height` is split evenly and the last row absorbs any rounding remainder.
+
+    Args:
+        tbl (pptx.oxml.table.CT_Table): The <a:tbl> element to populate.
+        header_texts (list[str]): Header cell strings.
+        columns (list[list[str]]): Cell strings for each column, as returned by
+                                   format_table_columns.
+        height (int): Total table height in EMU.
+        font_name (str, optional): Font name applied to every cell.
+        font_size (int, optional): Font size in points applied to every cell.
+        header_bold (bool): True to make header text bold.
+        header_font_color_rgb (tuple, optional): RGB tuple for header font color.
+        header_fill_color_rgb (tuple, optional): RGB tuple for header cell fill color.
+    """
+    n_rows = (len(columns[0]) if columns else 0) + 1
+    row_height = height // n_rows
+    last_row_height = height - (n_rows - 1) * row_height
+
+    header_pPr = pPr_xml(font_name, font_size, header_bold, header_font_color_rgb)
+    header_tcPr = "<a:tcPr/>"
+    if header_fill_color_rgb:
+        header_tcPr = '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr>' % (
+            str(RGBColor(*header_fill_color_rgb))
+        )
+    body_pPr = pPr_xml(font_name, font_size)
+
+    xml_parts = ['<a:tbl %s>' % nsdecls("a")]
+    xml_parts.append('<a:tr h="%d">' % (row_height if n_rows > 1 else last_row_height))
+    xml_parts.extend(_tc_xml(text, header_pPr, header_tcPr) for text in header_texts)
+    xml_parts.append("</a:tr>")
+    for i, texts in enumerate(zip(*columns), start=1):
+        xml_parts.append('<a:tr h="%d">' % (row_height if i < n_rows - 1 else last_row_height))
+        xml_parts.extend(_tc_xml(text, body_pPr, "<a:tcPr/>") for text in texts)
+        xml_parts.append("</a:tr>")
+    xml_parts.append("</a:tbl>")
+
+    new_tbl = parse_xml("".join(xml_parts))
+    for tr in tbl.tr_lst:
+        tbl.remove(tr)
+    tbl.extend(list(new_tbl))
@@ -0,0 +1,112 @@
+# template_cache.py in pypptx directory
+#
+# Process-wide cache of parsed template presentations. A template is read and
+# parsed once; every PyPPT opened from it gets an independent deep copy of the
+# parsed package. Copying skips zip reading and XML parsing entirely, and the
+# binary parts (images, media, embedded workbooks) are immutable bytes that
+# the copies share instead of duplicating.
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+
+from pptx import Presentation
+
+from .constants import DEFAULT_TEMPLATE_CACHE_SIZE
+
+
+def _file_key(path):
+    """Returns (absolute path, mtime_ns, size) of `path`; it changes whenever the file is rewritten."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+class TemplateCache:
+    """LRU cache of parsed .pptx templates handing out independent copies.
+
+    Entries are keyed by the template's absolute path, modification time and
+    size, so a template that changes on disk is re-read on its next use and the
+    stale entry is dropped. The cache is safe to use from several threads.
+
+    Example:
+        from pypptx.template_cache import template_cache
+        template_cache.clear()          # e.g. after deploying a new template
+        print(template_cache.info())    # {'hits': 41, 'misses': 1, 'size': 1, 'maxsize': 8}
+    """
+
+    def __init__(self, maxsize=DEFAULT_TEMPLATE_CACHE_SIZE):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of templates kept in memory. The least
+                           recently used template is evicted first.
+                           Defaults to DEFAULT_TEMPLATE_CACHE_SIZE.
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, not {maxsize!r}.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # (abspath, mtime_ns, size) -> pristine pptx Presentation
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, pptx_path):
+        """Returns a new, independent presentation opened from `pptx_path`.
+
+        The first call for a template (or after it changed on disk) parses the file
+        and keeps the parsed presentation; later calls return deep copies of it.
+        The cached presentation itself is never handed out, so changes to a copy
+        never reach other copies or the cache.
+
+        Args:
+            pptx_path (str): Path to the .pptx template.
+
+        Returns:
+            pptx.presentation.Presentation: A presentation the caller owns.
+        """
+        key = _file_key(pptx_path)
+        with self._lock:
+            pristine = self._entries.get(key)
+            if pristine is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if pristine is None:
+            pristine = Presentation(pptx_path)
+            with self._lock:
+                self._misses += 1
+                # Drop entries for older versions of the same file.
+                for stale_key in [k for k in self._entries if k[0] == key[0]]:
+                    del self._entries[stale_key]
+                self._entries[key] = pristine
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        # Copies share no mutable state with the pristine presentation, so this runs unlocked.
+        return copy.deepcopy(pristine)
+
+    def clear(self):
+        """Removes every cached template and resets the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Returns cache statistics.
+
+        Returns:
+            dict: 'hits', 'misses', 'size' (templates currently cached) and 'maxsize'.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses,
+                    "size": len(self._entries), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Cache used by PyPPT(pptx_path).
+template_cache = TemplateCache()
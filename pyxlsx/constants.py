@@ -1,7 +1,13 @@
 # Constants for the pyxlsx package.
+import zipfile
 
 # Chart Types
 CHART_TYPE_BAR = "BAR"
 CHART_TYPE_COLUMN = "COLUMN" # Vertical Bar Chart
 CHART_TYPE_LINE = "LINE"
 CHART_TYPE_PIE = "PIE"
+
+# Saving
+ZIP_COMPRESSION = {"stored": zipfile.ZIP_STORED, "deflate": zipfile.ZIP_DEFLATED} # Accepted `compression` values
+DEFAULT_SAVE_COMPRESSION = "deflate" # Zip compression for saved workbooks: "deflate" or "stored"
+DEFAULT_SAVE_COMPRESSLEVEL = None # Deflate level 0 (fastest) to 9 (smallest); None uses zlib's default
@@ -1,7 +1,26 @@
+import datetime
+import io
+import zipfile
+
 from openpyxl import Workbook as OpenpyxlWorkbook
+from openpyxl.writer.excel import ExcelWriter
 from openpyxl.utils.exceptions import InvalidFileException
 # Placeholder for PyWorksheet, will be created in a later step
 from .worksheet import PyWorksheet
+from .constants import DEFAULT_SAVE_COMPRESSION, DEFAULT_SAVE_COMPRESSLEVEL, ZIP_COMPRESSION
+
+
+def _zip_compression(compression, compresslevel):
+    """Validates a compression setting and returns (zipfile compression constant, compresslevel)."""
+    if compression not in ZIP_COMPRESSION:
+        raise ValueError(f"compression must be one of {sorted(ZIP_COMPRESSION)}, not {compression!r}.")
+    if compresslevel is not None:
+        if compression == "stored":
+            raise ValueError("compresslevel cannot be used with compression='stored'.")
+        if not isinstance(compresslevel, int) or not 0 <= compresslevel <= 9:
+            raise ValueError(f"compresslevel must be an integer from 0 to 9, not {compresslevel!r}.")
+    return ZIP_COMPRESSION[compression], compresslevel
+
 
 class PyWorkbook:
     def __init__(self, filepath=None):
@@ -92,22 +111,61 @@ class PyWorkbook:
         return PyWorksheet(self.workbook.active) # For later
         # return self.workbook.active # For now
 
-    def save(self, filename=None):
+    def save(self, filename=None, compression=DEFAULT_SAVE_COMPRESSION, compresslevel=DEFAULT_SAVE_COMPRESSLEVEL):
         """
-        Saves the workbook to the given filename.
+        Saves the workbook to a path or a binary file-like object.
 
         Args:
-            filename (str, optional): The path to save the file.
+            filename (str or file-like, optional): The path to save the file, or a binary stream
+                                      open for writing (e.g. io.BytesIO or an HTTP response body).
                                       If None, uses the filepath provided during initialization
-                                      or 'new_workbook.xlsx' if none was given.
+                                      or 'new_workbook.xlsx' if none was given. Paths are
+                                      used as given.
+            compression (str): "deflate" for smaller files or "stored" (no compression) for
+                               the fastest write. Defaults to DEFAULT_SAVE_COMPRESSION.
+            compresslevel (int, optional): Deflate level from 0 (fastest) to 9 (smallest).
+                                           None uses zlib's default. Defaults to DEFAULT_SAVE_COMPRESSLEVEL.
+
+        Raises:
+            ValueError: If the compression setting is not valid.
+            IOError: If the workbook could not be written.
         """
-        save_path = filename if filename else self.filepath
-        if not save_path.endswith('.xlsx'):
-            save_path += '.xlsx'
+        save_path = filename if filename is not None else self.filepath
+        zip_mode, zip_level = _zip_compression(compression, compresslevel)
 
         try:
-            self.workbook.save(save_path)
-            print(f"Workbook saved to {save_path}")
+            self._write(save_path, zip_mode, zip_level)
         except Exception as e:
             # Consider more specific exception handling if needed
             raise IOError(f"Could not save workbook to {save_path}: {e}")
+
+    def to_bytes(self, compression=DEFAULT_SAVE_COMPRESSION, compresslevel=DEFAULT_SAVE_COMPRESSLEVEL):
+        """
+        Returns the workbook as .xlsx bytes, without writing a file.
+
+        Args:
+            compression (str): "deflate" or "stored". Defaults to DEFAULT_SAVE_COMPRESSION.
+            compresslevel (int, optional): Deflate level 0-9. Defaults to DEFAULT_SAVE_COMPRESSLEVEL.
+
+        Returns:
+            bytes: The .xlsx file content.
+        """
+        buffer = io.BytesIO()
+        self._write(buffer, *_zip_compression(compression, compresslevel))
+        return buffer.getvalue()
+
+    def _write(self, file, zip_mode, zip_level):
+        """Writes the workbook zip to `file` with the given compression."""
+        if zip_mode == zipfile.ZIP_DEFLATED and zip_level is None:
+            # openpyxl's own settings.
+            self.workbook.save(file)
+            return
+        # openpyxl's Workbook.save and writer.excel.save_workbook (openpyxl 3.1) with the zip
+        # compression made configurable, which openpyxl offers no hook for. Keep in step with them.
+        if self.workbook.read_only:
+            raise TypeError("Workbook is read-only")
+        if self.workbook.write_only and not self.workbook.worksheets:
+            self.workbook.create_sheet()
+        self.workbook.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+        with zipfile.ZipFile(file, 'w', zip_mode, allowZip64=True, compresslevel=zip_level) as archive:
+            ExcelWriter(self.workbook, archive).save()
@@ -1,7 +1,24 @@
 import unittest
+import functools
+from unittest import mock
+import io
+import re
+import tempfile
+import time
 import os
-from pptx.util import Pt
-from pptx.enum.shapes import PP_PLACEHOLDER
+import zipfile
+import numpy as np
+import openpyxl
+import pandas as pd
+from lxml import etree
+from pptx.util import Inches, Pt
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import PP_PLACEHOLDER, MSO_SHAPE, PROG_ID
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part, PartFactory
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlideLayoutPart
 
 # Assuming pypptx is installed or PYTHONPATH is set up correctly
 # For local testing, you might need to adjust sys.path
@@ -11,7 +28,21 @@ import sys
 # For a robust solution, packaging and installation is preferred.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import pypptx
 from pypptx.presentation import PyPPT
+from pypptx.table import format_table_columns
+from pypptx.mailmerge import MergeTemplate
+from pypptx.batch import render_many
+from pypptx.template_cache import TemplateCache, template_cache
+from pypptx.media import media_registry
+from pypptx.parts import clone_part
+from pypptx.streaming import StreamingPPT
+from pypptx.lazy import open_lazy
+from pypptx.package import write_package
+from pypptx.scan import scan, scan_many
+from pypptx.memo import SlideMemo, data_fingerprint
+from pypptx.stamp import ShapeStamp
+from pypptx.slide import _LAYOUT_PLACEHOLDER_MAPS, _layout_placeholder_map
 from pypptx.constants import (
     DEFAULT_SUBTITLE_FONT_NAME,
     DEFAULT_SUBTITLE_FONT_SIZE_PT,
@@ -19,6 +50,26 @@ from pypptx.constants import (
     DEFAULT_FOOTER_FONT_SIZE_PT
 )
 
+
+def _png_bytes(size=(4, 3), color=(255, 0, 0)):
+    """Returns the bytes of a small solid-color PNG image."""
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _build_batch_deck(ppt, payload):
+    """Build function for the render_many tests (module level so workers can unpickle it)."""
+    if payload == "fail":
+        raise RuntimeError("bad payload")
+    if payload == "slow":
+        time.sleep(5)
+    if payload == "crash":
+        os._exit(1)
+    ppt.add_slide(layout_ref=5).set_title(payload)
+
+
 class TestPyPPTXFormatting(unittest.TestCase):
 
     def setUp(self):
@@ -98,5 +149,1283 @@ class TestPyPPTXFormatting(unittest.TestCase):
         self.assertEqual(font.name, DEFAULT_FOOTER_FONT_NAME, "Footer font name not set to default.")
         self.assertEqual(font.size, Pt(DEFAULT_FOOTER_FONT_SIZE_PT), "Footer font size not set to default.")
 
+
+class TestPyPPTXPlaceholderMap(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        self.slides = [self.ppt.add_slide(layout_ref=1) for _ in range(3)]
+        layout = self.ppt.presentation.slide_layouts[1]
+        for py_slide in self.slides[:2]:
+            for ph in layout.placeholders:
+                if ph.placeholder_format.type in (PP_PLACEHOLDER.FOOTER, PP_PLACEHOLDER.SLIDE_NUMBER):
+                    py_slide.pptx_slide.shapes.clone_placeholder(ph)
+
+    def test_layout_placeholder_map_is_shared(self):
+        footer = self.slides[0]._find_placeholder(PP_PLACEHOLDER.FOOTER)
+        self.assertEqual(footer.placeholder_format.type, PP_PLACEHOLDER.FOOTER)
+        self.assertIsNone(self.slides[2]._find_placeholder(PP_PLACEHOLDER.FOOTER))
+        layout = self.ppt.presentation.slide_layouts[1]
+        self.assertIn(PP_PLACEHOLDER.FOOTER, _LAYOUT_PLACEHOLDER_MAPS[layout.part])
+        self.assertIs(_layout_placeholder_map(layout), _LAYOUT_PLACEHOLDER_MAPS[layout.part])
+
+    def test_placeholder_without_type_inherits_from_layout(self):
+        ph = self.slides[1]._find_placeholder(PP_PLACEHOLDER.FOOTER)._element.ph
+        del ph.attrib["type"]
+        self.assertIsNotNone(self.slides[1]._find_placeholder(PP_PLACEHOLDER.FOOTER))
+
+    def test_set_footer_text_all_matches_per_slide_setter(self):
+        self.slides[0].set_footer_text("Confidential")
+        expected = etree.tostring(self.slides[0]._find_placeholder(PP_PLACEHOLDER.FOOTER)._element)
+
+        self.assertEqual(self.ppt.set_footer_text_all("Confidential"), 2)
+        for py_slide in self.slides[:2]:
+            footer = py_slide._find_placeholder(PP_PLACEHOLDER.FOOTER)
+            self.assertEqual(etree.tostring(footer._element), expected)
+        with self.assertRaises(AttributeError):
+            self.slides[2].set_footer_text("Confidential")
+
+    def test_set_footer_text_all_finds_footers_off_the_layout_idx(self):
+        footer = self.slides[1]._find_placeholder(PP_PLACEHOLDER.FOOTER)
+        footer._element.ph.set("idx", "99")
+        self.slides[0].set_footer_text("Confidential")
+
+        self.assertEqual(self.ppt.set_footer_text_all("Confidential"), 2)
+        self.assertEqual(etree.tostring(self.slides[1]._find_placeholder(PP_PLACEHOLDER.FOOTER)._element.txBody),
+                         etree.tostring(self.slides[0]._find_placeholder(PP_PLACEHOLDER.FOOTER)._element.txBody))
+
+    def test_set_slide_numbers_visibility_hides(self):
+        number = self.slides[0]._find_placeholder(PP_PLACEHOLDER.SLIDE_NUMBER)
+        number.text_frame.text = "1"
+        self.ppt.set_slide_numbers_visibility(False)
+        self.assertEqual(number.text_frame.text, "")
+
+
+class TestPyPPTXDuplicateSlide(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        self.source = self.ppt.add_slide(layout_ref=5)
+        self.source.set_title("Source")
+        self.source.add_shape(MSO_SHAPE.OVAL, 1, 1, 1, 1, shape_name="Dot")
+        self.source.add_table_from_dataframe(pd.DataFrame({'a': [1, 2]}), 1, 2, 3, 1)
+        self.source.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED,
+                              {'categories': ['x', 'y'], 'series': [{'name': 's', 'values': [1, 2]}]},
+                              4, 2, 4, 3, chart_title="Chart")
+        self.source.pptx_slide.shapes.add_picture(io.BytesIO(_png_bytes()), 0, 0)
+        self.source.pptx_slide.shapes[1].click_action.hyperlink.address = "https://example.com"
+
+    def test_clone_copies_all_shapes_and_relinks_parts(self):
+        duplicate = self.ppt.duplicate_slide(0)
+        source_slide, new_slide = self.source.pptx_slide, duplicate.pptx_slide
+        self.assertEqual([s.shape_type for s in new_slide.shapes], [s.shape_type for s in source_slide.shapes])
+
+        source_chart, new_chart = source_slide.shapes[3], new_slide.shapes[3]
+        self.assertIsNot(new_chart.chart.part, source_chart.chart.part)
+        self.assertIsNot(new_chart.chart.part.chart_workbook.xlsx_part,
+                         source_chart.chart.part.chart_workbook.xlsx_part)
+        self.assertEqual(new_chart.chart.chart_title.text_frame.text, "Chart")
+        self.assertIs(new_slide.shapes[4].image._blob, source_slide.shapes[4].image._blob)
+        self.assertEqual(new_slide.shapes[1].click_action.hyperlink.address, "https://example.com")
+
+        saved = io.BytesIO()
+        self.ppt.save(saved)
+        reopened = PyPPT(io.BytesIO(saved.getvalue()))
+        self.assertEqual(len(reopened.slides), 2)
+        self.assertEqual(reopened.slides[1].pptx_slide.shapes[3].chart.plots[0].categories[1], 'y')
+        names = zipfile.ZipFile(saved).namelist()
+        self.assertEqual(len([n for n in names if n.startswith("ppt/media/")]), 1)
+        self.assertEqual(len([n for n in names if n.startswith("ppt/charts/chart")]), 2)
+
+    def test_clone_copies_comments_and_embedded_objects(self):
+        source_part = self.source.pptx_slide.part
+        comments = Part(PackURI("/ppt/comments/comment1.xml"),
+                        "application/vnd.openxmlformats-officedocument.presentationml.comments+xml",
+                        self.ppt.presentation.part.package, b"<p:cmLst/>")
+        source_part.relate_to(comments, RT.COMMENTS)
+        source_part.add_embedded_ole_object_part(PROG_ID.XLSX, io.BytesIO(b"xlsx bytes"))
+        source_part.add_embedded_ole_object_part("Package", io.BytesIO(b"ole bytes"))
+
+        new_part = self.ppt.duplicate_slide(0).pptx_slide.part
+        for reltype in (RT.COMMENTS, RT.PACKAGE, RT.OLE_OBJECT):
+            original = source_part.part_related_by(reltype)
+            copy = new_part.part_related_by(reltype)
+            self.assertIsNot(copy, original)
+            self.assertNotEqual(copy.partname, original.partname)
+            self.assertEqual(copy.blob, original.blob)
+        names = zipfile.ZipFile(io.BytesIO(self.ppt.to_bytes())).namelist()
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn("ppt/comments/comment2.xml", names)
+
+    def test_basic_mode_and_invalid_mode(self):
+        duplicate = self.ppt.duplicate_slide(0, mode="basic")
+        self.assertEqual(duplicate.pptx_slide.shapes.title.text, "Source")
+        with self.assertRaises(ValueError):
+            self.ppt.duplicate_slide(0, mode="deep")
+
+
+class TestPyPPTXMerge(unittest.TestCase):
+
+    def make_source(self, name):
+        source = PyPPT()
+        for i in range(2):
+            slide = source.add_slide("Title Only")
+            slide.set_title(f"{name} {i}")
+            slide.add_picture(_png_bytes(), 1, 1)
+            slide.add_picture(_png_bytes(color=(0, 0, len(name))), 3, 1)
+            slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'y': [i, len(name)]}), 5, 2, 4, 3)
+            slide.pptx_slide.notes_slide.notes_text_frame.text = f"Notes {name} {i}"
+        slide.pptx_slide.shapes[1].click_action.target_slide = source.presentation.slides[0]
+        return source
+
+    def test_merge_copies_slides_and_dedupes_media(self):
+        target = PyPPT()
+        target.add_slide(0).set_title("Cover")
+        merged = target.merge([io.BytesIO(self.make_source("a").to_bytes()), self.make_source("bb")])
+        self.assertEqual(len(merged), 4)
+        self.assertEqual([s.pptx_slide.shapes.title.text for s in target.slides],
+                         ["Cover", "a 0", "a 1", "bb 0", "bb 1"])
+
+        reopened = PyPPT(io.BytesIO(target.to_bytes()))
+        slides = [s.pptx_slide for s in reopened.slides]
+        self.assertEqual(slides[4].slide_layout.name, "Title Only")
+        self.assertEqual(slides[4].notes_slide.notes_text_frame.text, "Notes bb 1")
+        self.assertEqual(slides[4].shapes[3].chart.plots[0].series[0].values, (1.0, 2.0))
+        self.assertEqual(slides[4].shapes[1].click_action.target_slide.shapes.title.text, "bb 0")
+        names = zipfile.ZipFile(io.BytesIO(target.to_bytes())).namelist()
+        self.assertEqual(len([n for n in names if n.startswith("ppt/media/")]), 3)
+        self.assertEqual(len([n for n in names if n.startswith("ppt/charts/chart")]), 4)
+
+    def test_clone_part_adds_images_through_the_media_registry(self):
+        source = PyPPT()
+        picture = source.add_slide(layout_ref=6).add_picture(_png_bytes(), 1, 1)
+        target = PyPPT()
+        package = target.presentation.part.package
+        image_part = picture.part.related_part(picture._pic.blipFill.blip.rEmbed)
+
+        copied = clone_part(image_part, package)
+        self.assertIs(clone_part(image_part, package), copied)
+        self.assertIs(media_registry(package).get_or_add_copy(package, image_part), copied)
+
+    def test_layout_mapping(self):
+        source = PyPPT()
+        source.add_slide("Title Only")
+        source.add_slide("Two Content")
+        layouts = source.presentation.slide_layouts
+        layouts.get_by_name("Title Only").name = "Headline"
+        layouts.get_by_name("Two Content").name = "Split"
+        target = PyPPT()
+        target.merge([source])
+        self.assertEqual([s.pptx_slide.slide_layout.name for s in target.slides], ["Title Only", "Two Content"])
+        target.merge([source], layout_map={"Headline": "Blank"})
+        self.assertEqual(target.slides[2].pptx_slide.slide_layout.name, "Blank")
+        with self.assertRaises(ValueError):
+            target.merge([source], layout_map={"Split": "Missing"})
+        self.assertEqual(len(target.slides), 4)
+
+
+class TestPyPPTXLayouts(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT(layout_aliases={"Cover": "Title Slide"})
+
+    def test_layout_lookup_by_name_case_and_alias(self):
+        title_layout = self.ppt.presentation.slide_layouts[0]
+        self.assertIs(self.ppt.get_layout("Title Slide"), title_layout)
+        self.assertIs(self.ppt.get_layout("title slide"), title_layout)
+        self.assertIs(self.ppt.get_layout("COVER"), title_layout)
+        self.assertIs(self.ppt.get_layout(["No Such Layout", "Blank"]),
+                      self.ppt.presentation.slide_layouts[6])
+        self.assertIs(self.ppt.get_layout("Blank", master_index=0),
+                      self.ppt.presentation.slide_layouts[6])
+        slide = self.ppt.add_slide(layout_ref=("Missing", "title only"))
+        self.assertEqual(slide.pptx_slide.slide_layout.name, "Title Only")
+
+        with self.assertRaises(ValueError):
+            self.ppt.add_slide(layout_ref="No Such Layout")
+        with self.assertRaises(IndexError):
+            self.ppt.add_slide(layout_ref=99)
+        with self.assertRaises(IndexError):
+            self.ppt.get_layout("Blank", master_index=3)
+        with self.assertRaises(TypeError):
+            self.ppt.add_slide(layout_ref=1.5)
+
+    def test_layout_index_is_cached_and_invalidated(self):
+        by_name, _ = self.ppt._get_layout_index()
+        self.ppt.add_slide(layout_ref="Blank")
+        self.assertIs(self.ppt._get_layout_index()[0], by_name)
+
+        layouts = self.ppt.presentation.slide_layouts
+        layouts.remove(layouts.get_by_name("Comparison"))
+        with self.assertRaises(ValueError):
+            self.ppt.get_layout("Comparison")
+        self.assertIsNot(self.ppt._get_layout_index()[0], by_name)
+
+    def test_layout_index_sees_renamed_layouts(self):
+        self.assertEqual(self.ppt.get_layout("Blank").name, "Blank")
+        layouts = self.ppt.presentation.slide_layouts
+        layouts.get_by_name("Blank").name = "Empty"
+        layouts.get_by_name("Title Only").name = "Blank"
+        self.assertEqual(self.ppt.get_layout("Empty").name, "Empty")
+        self.assertIs(self.ppt.get_layout("Blank").part, layouts.get_by_name("Blank").part)
+        self.assertIs(self.ppt.get_layout(["Title Only", "Blank"]).part, layouts[5].part)
+
+    def test_layout_index_sees_a_layout_replaced_by_another(self):
+        self.assertEqual(self.ppt.get_layout("Blank").name, "Blank")
+        master = self.ppt.presentation.slide_masters[0]
+        blank = master.slide_layouts.get_by_name("Blank")
+        agenda = SlideLayoutPart.load(PackURI("/ppt/slideLayouts/slideLayout99.xml"), blank.part.content_type,
+                                      blank.part.package, blank.part.blob.replace(b'name="Blank"', b'name="Agenda"'))
+        agenda.relate_to(master.part, RT.SLIDE_MASTER)
+
+        master.slide_layouts.remove(master.slide_layouts.get_by_name("Comparison"))
+        rId = master.part.relate_to(agenda, RT.SLIDE_LAYOUT)
+        master._element.get_or_add_sldLayoutIdLst()._add_sldLayoutId(rId=rId)
+
+        self.assertIs(self.ppt.get_layout("Agenda").part, agenda)
+        with self.assertRaises(ValueError):
+            self.ppt.get_layout("Comparison")
+
+
+class TestPyPPTXSlideSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        for i in range(4):
+            self.ppt.add_slide(layout_ref=5).set_title(f"Slide {i}")
+
+    def titles(self, slides):
+        return [s.pptx_slide.shapes.title.text for s in slides]
+
+    def test_slides_view_is_lazy_and_identity_stable(self):
+        slides = self.ppt.slides
+        self.assertEqual(len(slides), 4)
+        self.assertIs(slides[1], self.ppt.get_slide(1))
+        self.assertIs(slides[-1], slides[3])
+        self.assertEqual(self.titles(slides[1:3]), ["Slide 1", "Slide 2"])
+        self.assertEqual(self.titles(slides), ["Slide 0", "Slide 1", "Slide 2", "Slide 3"])
+        with self.assertRaises(IndexError):
+            slides[4]
+
+    def test_slides_view_tracks_changes(self):
+        slides = self.ppt.slides
+        third = slides[2]
+        self.ppt.move_slide(2, 0)
+        self.assertIs(slides[0], third)
+        self.ppt.delete_slide(0)
+        self.assertEqual(self.titles(slides), ["Slide 0", "Slide 1", "Slide 3"])
+        new_slide = self.ppt.add_slide(layout_ref=5)
+        self.assertIs(slides[-1], new_slide)
+        duplicate = self.ppt.duplicate_slide(0)
+        self.assertIs(slides[-1], duplicate)
+        self.assertEqual(len(slides), 5)
+
+    def test_reorder_slides(self):
+        first = self.ppt.slides[0]
+        self.ppt.reorder_slides([3, 1, 0, 2])
+        self.assertEqual(self.titles(self.ppt.slides), ["Slide 3", "Slide 1", "Slide 0", "Slide 2"])
+        self.assertIs(self.ppt.slides[2], first)
+        self.assertEqual(first.pptx_slide.part.partname, "/ppt/slides/slide3.xml")
+        for bad in ([0, 1, 2], [0, 1, 1, 2], [0, 1, 2, 4]):
+            with self.assertRaises(ValueError):
+                self.ppt.reorder_slides(bad)
+
+    def test_slide_parts_follow_slide_order(self):
+        def partnames():
+            return [slide.pptx_slide.part.partname for slide in self.ppt.slides]
+
+        expected = ["/ppt/slides/slide%d.xml" % n for n in range(1, 5)]
+        self.ppt.move_slide(3, 0)
+        self.assertEqual(partnames(), expected)
+        self.ppt.reorder_slides([1, 0, 3, 2])
+        self.assertEqual(partnames(), expected)
+        self.ppt.delete_slide(1)
+        self.assertEqual(partnames(), expected[:3])
+        self.assertEqual(self.titles(self.ppt.slides), ["Slide 0", "Slide 2", "Slide 1"])
+
+    def test_delete_slides_drops_orphaned_parts(self):
+        self.ppt.slides[1].add_chart(XL_CHART_TYPE.PIE, {'categories': ['a'], 'series': [{'name': 's', 'values': [1]}]},
+                                     1, 1, 3, 3)
+        with self.assertRaises(IndexError):
+            self.ppt.delete_slides([0, 4])
+        self.assertEqual(len(self.ppt.slides), 4)
+
+        self.assertEqual(self.ppt.delete_slides([2, 1, 2]), 2)
+        self.assertEqual(self.titles(self.ppt.slides), ["Slide 0", "Slide 3"])
+
+        saved = io.BytesIO()
+        self.ppt.save(saved)
+        names = zipfile.ZipFile(saved).namelist()
+        self.assertEqual(sorted(n for n in names if n.startswith("ppt/slides/slide")),
+                         ["ppt/slides/slide1.xml", "ppt/slides/slide2.xml"])
+        self.assertFalse([n for n in names if n.startswith("ppt/charts/")])
+        self.assertEqual(len(PyPPT(io.BytesIO(saved.getvalue())).slides), 2)
+
+
+class TestPyPPTXShapeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        self.slide = self.ppt.add_slide(layout_ref=6)
+        for i in range(3):
+            self.slide.add_shape(MSO_SHAPE.RECTANGLE, i, 1, 1, 1, shape_name=f"Box {i}")
+
+    def test_get_shape_by_name_uses_index(self):
+        box = self.slide._get_shape("Box 1")
+        self.assertEqual(box.name, "Box 1")
+        self.assertIn("Box 1", self.slide._shapes_by_name)
+        label = self.slide.add_text_box("Label", 0, 0, 1, 1)
+        self.assertIs(self.slide._shapes_by_name[label.name], label)
+        with self.assertRaises(ValueError):
+            self.slide._get_shape("No Such Shape")
+
+    def test_shape_index_follows_external_changes(self):
+        self.slide._get_shape("Box 1")
+        shapes = self.slide.pptx_slide.shapes
+        shapes[0].name = "Renamed"
+        shapes._spTree.remove(shapes[1]._element)
+        self.assertEqual(self.slide._get_shape("Renamed").name, "Renamed")
+        with self.assertRaises(ValueError):
+            self.slide._get_shape("Box 0")
+        with self.assertRaises(ValueError):
+            self.slide._get_shape("Box 1")
+        external = shapes.add_shape(MSO_SHAPE.OVAL, 0, 0, 10, 10)
+        external.name = "External"
+        self.assertEqual(self.slide._get_shape("External").shape_id, external.shape_id)
+
+    def test_style_shapes(self):
+        self.slide.style_shapes({
+            "Box 0": {"fill": (255, 0, 0), "line": (0, 0, 255), "weight": 2},
+            "Box 2": {"weight": 4.5},
+        })
+        box0 = self.slide._get_shape("Box 0")
+        self.assertEqual(box0.fill.fore_color.rgb, RGBColor(255, 0, 0))
+        self.assertEqual(box0.line.color.rgb, RGBColor(0, 0, 255))
+        self.assertEqual(box0.line.width, Pt(2))
+        self.assertEqual(self.slide._get_shape("Box 2").line.width, Pt(4.5))
+
+        with self.assertRaises(ValueError):
+            self.slide.style_shapes({"Box 1": {"fill": (0, 0, 0)}, "Missing": {"fill": (0, 0, 0)}})
+        self.assertIsNone(self.slide._get_shape("Box 1").fill.type)
+        with self.assertRaises(ValueError):
+            self.slide.style_shapes({"Box 1": {"colour": (0, 0, 0)}})
+
+
+class TestPyPPTXTables(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        self.slide = self.ppt.add_slide(layout_ref=6) # Blank layout
+
+    def _table_xml(self, bulk, dataframe, **kwargs):
+        table_shape = self.slide.add_table_from_dataframe(dataframe, 1, 1, 6, 3, bulk=bulk, **kwargs)
+        return etree.tostring(table_shape.table._tbl)
+
+    def test_bulk_table_matches_per_cell_table(self):
+        """The bulk XML builder must produce exactly what the per-cell API produces."""
+        df = pd.DataFrame({
+            'Amount': [1234.5, np.nan, -3.25],
+            'Count': [1, 2, 3],
+            'Label': ['a & b', 'two\nlines', 'soft\vbreak\x07'],
+        }, index=pd.Index(['x', 'y', 'z'], name='Key'))
+        options = dict(number_formats={'Amount': ',.2f', 'Label': '.1f'},
+                       include_index=True, font_name='Arial', font_size=10.5,
+                       column_labels={'Amount': 'Amount <USD>'},
+                       header_font_color_rgb=(255, 255, 255),
+                       header_fill_color_rgb=(0, 32, 96),
+                       column_widths=[1, 2], row_heights={1: 0.5})
+        self.assertEqual(self._table_xml(True, df, **options), self._table_xml(False, df, **options))
+        self.assertEqual(self._table_xml(True, df), self._table_xml(False, df))
+
+    def test_bulk_table_contents(self):
+        df = pd.DataFrame({'Value': [0.5, np.nan]})
+        table = self.slide.add_table_from_dataframe(df, 1, 1, 4, 2, number_formats={'Value': '.0%'}).table
+        self.assertEqual(len(table.rows), 3)
+        self.assertEqual(table.cell(0, 0).text, 'Value')
+        self.assertEqual(table.cell(1, 0).text, '50%')
+        self.assertEqual(table.cell(2, 0).text, '')
+        self.assertTrue(table.cell(0, 0).text_frame.paragraphs[0].font.bold)
+        self.assertEqual(sum(row.height for row in table.rows), Pt(0) + 2 * 914400)
+
+    def test_format_table_columns(self):
+        """Column-wise formatting keeps the per-value rules: NaN -> '', specs only for numbers."""
+        df = pd.DataFrame({
+            'f': [1.0, np.nan, 2.5],
+            'i': pd.array([1, None, 3], dtype='Int64'),
+            'mixed': [1.5, 'text', None],
+            'bad': [1.5, 2.0, 3.0],
+            'b': [True, False, True],
+            'plain': [('t', 1), 2, 'x'],
+        }, index=[10, 20, 30])
+        columns = format_table_columns(df, include_index=True,
+                                       number_formats={'f': '.1f', 'i': '03d', 'mixed': '.2f',
+                                                       'bad': 'd', 'b': 'd'})
+        self.assertEqual(columns, [
+            ['10', '20', '30'],
+            ['1.0', '', '2.5'],
+            ['001', '', '003'],
+            ['1.50', 'text', ''],
+            ['1.5', '2.0', '3.0'],
+            ['1', '0', '1'],
+            ["('t', 1)", '2', 'x'],
+        ])
+
+    def test_add_paginated_table(self):
+        df = pd.DataFrame({'n': range(25)})
+        slides = self.ppt.add_paginated_table(df, 1, 1, 4, 4, rows_per_slide=10,
+                                              layout_ref=5, title="Appendix")
+        self.assertEqual(len(slides), 3)
+        self.assertEqual(len(self.ppt.presentation.slides), 4)
+        self.assertEqual(slides[1].pptx_slide.shapes.title.text, "Appendix (cont.)")
+
+        tables = [[s for s in slide.pptx_slide.shapes if s.has_table][0].table for slide in slides]
+        self.assertEqual([len(t.rows) for t in tables], [11, 11, 6])
+        self.assertEqual([t.cell(0, 0).text for t in tables], ['n', 'n', 'n'])
+        self.assertEqual(tables[2].cell(5, 0).text, '24')
+
+        with self.assertRaises(ValueError):
+            self.ppt.add_paginated_table(df, 1, 1, 4, 4, rows_per_slide=0)
+
+
+class TestPyPPTXChartData(unittest.TestCase):
+
+    def setUp(self):
+        self.slide = PyPPT().add_slide(layout_ref=6)
+
+    def chart_contents(self, graphic_frame):
+        plot = graphic_frame.chart.plots[0]
+        return list(plot.categories), [(s.name, s.values) for s in plot.series]
+
+    def test_dataframe_matches_list_input(self):
+        frame = pd.DataFrame({'North': [1.5, np.nan, 3.25], 'South': [4, 5, 6]},
+                             index=pd.Index(['Q1', 'Q2 & Q3', 'Q4']))
+        from_frame = self.slide.add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3)
+        from_lists = self.slide.add_chart(XL_CHART_TYPE.LINE, {
+            'categories': ['Q1', 'Q2 & Q3', 'Q4'],
+            'series': [{'name': 'North', 'values': [1.5, None, 3.25]},
+                       {'name': 'South', 'values': [4, 5, 6]}]}, 5, 1, 4, 3)
+        self.assertEqual(self.chart_contents(from_frame), self.chart_contents(from_lists))
+        self.assertTrue(from_frame.chart.has_legend)
+
+        workbook = openpyxl.load_workbook(io.BytesIO(from_frame.chart.part.chart_workbook.xlsx_part.blob))
+        self.assertEqual(list(workbook.active.values),
+                         [(None, 'North', 'South'), ('Q1', 1.5, 4), ('Q2 & Q3', None, 5), ('Q4', 3.25, 6)])
+
+    def test_list_values_with_pd_na(self):
+        from_lists = self.slide.add_chart(XL_CHART_TYPE.LINE, {
+            'categories': ['a', 'b', 'c'], 'series': [{'name': 's', 'values': [1.0, pd.NA, 3.0]}]}, 1, 1, 4, 3)
+        from_frame = self.slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'s': [1.0, pd.NA, 3.0]},
+                                                                           index=['a', 'b', 'c']), 5, 1, 4, 3)
+        self.assertEqual(self.chart_contents(from_lists), self.chart_contents(from_frame))
+
+    def test_numpy_arrays_and_dates(self):
+        dates = pd.date_range("2024-01-30", periods=3).to_numpy()
+        graphic_frame = self.slide.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, {
+            'categories': dates, 'series': [{'name': 'Sales', 'values': np.array([1, 2, 3])}]}, 1, 1, 4, 3)
+        reference = self.slide.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, {
+            'categories': [d.date() for d in pd.to_datetime(dates)],
+            'series': [{'name': 'Sales', 'values': [1, 2, 3]}]}, 5, 1, 4, 3)
+        self.assertEqual(self.chart_contents(graphic_frame), self.chart_contents(reference))
+        self.assertFalse(graphic_frame.chart.has_legend)
+
+    def test_shape_validation(self):
+        with self.assertRaises(ValueError):
+            self.slide.add_chart(XL_CHART_TYPE.LINE, {
+                'categories': np.arange(3), 'series': [{'name': 's', 'values': np.arange(4)}]}, 1, 1, 4, 3)
+        with self.assertRaises(ValueError):
+            self.slide.add_chart(XL_CHART_TYPE.LINE, {
+                'categories': np.arange(3), 'series': [{'name': 's', 'values': np.ones((3, 2))}]}, 1, 1, 4, 3)
+        with self.assertRaises(ValueError):
+            self.slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'s': ['a', 'b']}), 1, 1, 4, 3)
+        with self.assertRaises(ValueError):
+            self.slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame(index=[1, 2]), 1, 1, 4, 3)
+
+    def test_workbook_modes(self):
+        ppt = PyPPT()
+        slide = ppt.add_slide(layout_ref=6)
+        frame = pd.DataFrame({'North': [1.0, 2.0, 3.0]}, index=['a', 'b', 'c'])
+        first = slide.add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3, workbook_mode="shared")
+        same = slide.add_chart(XL_CHART_TYPE.LINE, frame.copy(), 5, 1, 4, 3, workbook_mode="shared")
+        other = slide.add_chart(XL_CHART_TYPE.LINE, frame * 2, 1, 4, 4, 3, workbook_mode="shared")
+        cached = [slide.add_chart(XL_CHART_TYPE.LINE, frame * i, 5, 4, 4, 3, workbook_mode="cached")
+                  for i in range(3, 5)]
+
+        def workbook(graphic_frame):
+            return graphic_frame.chart.part.chart_workbook.xlsx_part
+        self.assertIs(workbook(first), workbook(same))
+        self.assertIsNot(workbook(first), workbook(other))
+        self.assertIsNot(workbook(cached[0]), workbook(cached[1]))
+
+        with zipfile.ZipFile(io.BytesIO(ppt.to_bytes())) as package_zip:
+            embeddings = [n for n in package_zip.namelist() if n.startswith('ppt/embeddings/')]
+        self.assertEqual(len(embeddings), 4)
+        reopened = PyPPT(io.BytesIO(ppt.to_bytes())).slides[0].pptx_slide.shapes
+        values = [shape.chart.plots[0].series[0].values for shape in reopened if shape.has_chart]
+        self.assertEqual(values, [(1.0, 2.0, 3.0)] * 2 + [(2.0, 4.0, 6.0), (3.0, 6.0, 9.0), (4.0, 8.0, 12.0)])
+
+        with self.assertRaises(ValueError):
+            slide.add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3, workbook_mode="none")
+
+    def test_cached_workbook_holds_values(self):
+        data = {'categories': ['a', 'b', 'c'], 'series': [{'name': 'North', 'values': [1.5, None, 3]}]}
+        chart = self.slide.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, data, 1, 1, 4, 3, workbook_mode="cached")
+        blob = chart.chart.part.chart_workbook.xlsx_part.blob
+        sheet = openpyxl.load_workbook(io.BytesIO(blob)).active
+        self.assertEqual([list(row) for row in sheet.iter_rows(values_only=True)],
+                         [[None, 'North'], ['a', 1.5], ['b', None], ['c', 3]])
+        self.assertEqual(chart.chart.plots[0].series[0].values, (1.5, None, 3.0))
+
+    def test_shared_workbook_of_deleted_slide_is_not_reused(self):
+        ppt = PyPPT()
+        frame = pd.DataFrame({'North': [1.0, 2.0]}, index=['a', 'b'])
+        first = ppt.add_slide(layout_ref=6).add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3, workbook_mode="shared")
+        old_workbook = first.chart.part.chart_workbook.xlsx_part
+        ppt.delete_slide(0)
+        second = ppt.add_slide(layout_ref=6).add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3, workbook_mode="shared")
+        third = ppt.add_slide(layout_ref=6).add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3, workbook_mode="shared")
+        new_workbook = second.chart.part.chart_workbook.xlsx_part
+        self.assertIsNot(new_workbook, old_workbook)
+        self.assertIs(third.chart.part.chart_workbook.xlsx_part, new_workbook)
+        with zipfile.ZipFile(io.BytesIO(ppt.to_bytes())) as package_zip:
+            names = package_zip.namelist()
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_downsample(self):
+        y = np.sin(np.linspace(0, 20, 20000))
+        y[777] = 50.0
+        y[3000:3100] = np.nan
+        frame = pd.DataFrame({'y': y}, index=pd.date_range("2024-01-01", periods=len(y), freq="min"))
+        for method in ("lttb", "minmax", "stride"):
+            graphic_frame = self.slide.add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3,
+                                                 downsample=method, max_points=500)
+            report = self.slide.last_downsample
+            self.assertEqual((report.method, report.original_points), (method, 20000))
+            self.assertLessEqual(report.kept_points, 500)
+            self.assertGreater(report.reduction, 0.97)
+            self.assertEqual(len(graphic_frame.chart.plots[0].categories), report.kept_points)
+            if method != "stride":
+                self.assertIn(50.0, graphic_frame.chart.plots[0].series[0].values)
+
+        rng = np.random.default_rng(0)
+        many = pd.DataFrame(rng.normal(size=(100000, 6)).cumsum(axis=0), columns=list("abcdef"))
+        for method, max_points in (("lttb", 500), ("minmax", 500), ("lttb", 12)):
+            graphic_frame = self.slide.add_chart(XL_CHART_TYPE.LINE, many, 1, 1, 4, 3,
+                                                 downsample=method, max_points=max_points)
+            self.assertLessEqual(self.slide.last_downsample.kept_points, max_points)
+            self.assertEqual(len(graphic_frame.chart.plots[0].categories), self.slide.last_downsample.kept_points)
+
+        short = {'categories': ['a', 'b', 'c'], 'series': [{'name': 's', 'values': [1, None, 3]}]}
+        self.slide.add_chart(XL_CHART_TYPE.LINE, short, 1, 1, 4, 3, downsample="lttb")
+        self.assertEqual(self.slide.last_downsample.reduction, 0)
+        with self.assertRaises(ValueError):
+            self.slide.add_chart(XL_CHART_TYPE.LINE, frame, 1, 1, 4, 3, downsample="median")
+
+
+class TestPyPPTXPictures(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        self.package = self.ppt.presentation.part.package
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.logo_path = os.path.join(self.tmpdir.name, "logo.png")
+        with open(self.logo_path, "wb") as f:
+            f.write(_png_bytes(size=(40, 20)))
+
+    def media_entries(self):
+        with zipfile.ZipFile(io.BytesIO(self.ppt.to_bytes())) as package_zip:
+            return [name for name in package_zip.namelist() if name.startswith("ppt/media/")]
+
+    def test_identical_images_stored_once(self):
+        template_images = media_registry(self.package).info()["size"]  # e.g. the thumbnail
+        pictures = []
+        for _ in range(5):
+            slide = self.ppt.add_slide(layout_ref=6)
+            pictures.append(slide.add_picture(self.logo_path, 1, 1, width=2))
+        pictures.append(slide.add_picture(_png_bytes(size=(40, 20)), 1, 1))
+        pictures.append(slide.add_picture(io.BytesIO(_png_bytes(size=(40, 20))), 1, 1, height=0.5, shape_name="Logo"))
+
+        self.assertEqual(len(self.media_entries()), 1)
+        self.assertEqual(media_registry(self.package).info(), {"hits": 6, "misses": 1, "size": template_images + 1})
+        self.assertEqual((pictures[0].width, pictures[0].height), (Inches(2), Inches(1)))
+        self.assertEqual((pictures[5].width, pictures[5].height), (Inches(40 / 72), Inches(20 / 72)))
+        self.assertEqual(pictures[6].width, Inches(1))
+        self.assertIs(slide._get_shape_by_name("Logo")._element, pictures[6]._element)
+
+    def test_changed_file_and_deleted_slides(self):
+        self.ppt.add_slide(layout_ref=6).add_picture(self.logo_path, 1, 1)
+        with open(self.logo_path, "wb") as f:
+            f.write(_png_bytes(size=(40, 21)))
+        os.utime(self.logo_path, ns=(0, 0))
+        self.ppt.add_slide(layout_ref=6).add_picture(self.logo_path, 1, 1)
+        self.assertEqual(len(self.media_entries()), 2)
+
+        # The first image is orphaned, a third one takes its partname, then the first comes back.
+        self.ppt.delete_slides([0])
+        self.ppt.add_slide(layout_ref=6).add_picture(_png_bytes(color=(0, 0, 255)), 1, 1)
+        self.ppt.add_slide(layout_ref=6).add_picture(_png_bytes(size=(40, 20)), 1, 1)
+        entries = self.media_entries()
+        self.assertEqual(len(entries), len(set(entries)))
+        self.assertEqual(len(entries), 3)
+
+    def test_orphaned_image_is_not_given_a_taken_partname(self):
+        held_slide = self.ppt.add_slide(layout_ref=6)
+        held_slide.add_picture(self.logo_path, 1, 1)
+        self.ppt.delete_slide(0)
+        # python-pptx names this image itself, through the package
+        other = self.ppt.add_slide(layout_ref=6)
+        other.pptx_slide.shapes.add_picture(io.BytesIO(_png_bytes(color=(0, 0, 255))), 0, 0)
+        other.add_picture(self.logo_path, 1, 1)
+
+        entries = self.media_entries()
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(len(entries), len(set(entries)))
+        self.assertEqual(len(PyPPT(io.BytesIO(self.ppt.to_bytes())).slides[0].pptx_slide.shapes), 2)
+
+    def test_downscale_and_reencode(self):
+        photo = np.random.default_rng(0).integers(0, 255, (600, 1200, 3), dtype=np.uint8)
+        from PIL import Image
+        buffer = io.BytesIO()
+        Image.fromarray(photo).save(buffer, format="PNG")
+        slide = self.ppt.add_slide(layout_ref=6)
+
+        picture = slide.add_picture(buffer.getvalue(), 1, 1, width=2, max_dpi=100)
+        self.assertEqual(picture.image.size, (200, 100))
+        self.assertEqual((picture.width, picture.height), (Inches(2), Inches(1)))
+        self.assertEqual(picture.image.content_type, "image/png")
+
+        transparent = _png_bytes(size=(300, 300))
+        transparent_image = Image.open(io.BytesIO(transparent)).convert("RGBA")
+        rgba = io.BytesIO()
+        transparent_image.save(rgba, format="PNG")
+        pictures = self.ppt.add_pictures(
+            [{'slide': 0, 'image': buffer.getvalue(), 'left': 1, 'top': 1, 'width': 3},
+             {'slide': slide, 'image': buffer.getvalue(), 'left': 4, 'top': 1, 'width': 3},
+             {'slide': 0, 'image': rgba.getvalue(), 'left': 1, 'top': 4, 'height': 1}],
+            max_dpi=50, reencode="jpeg", workers=2)
+        self.assertEqual(pictures[0].image.content_type, "image/jpeg")
+        self.assertEqual(pictures[0].image.size, (150, 75))
+        self.assertEqual(pictures[0].image.sha1, pictures[1].image.sha1)
+        self.assertEqual(pictures[2].image.content_type, "image/png")
+        self.assertEqual(pictures[2].image.size, (50, 50))
+
+        report = self.ppt.media_report(budget_bytes=1000)
+        self.assertTrue(report.over_budget)
+        self.assertGreater(report.saved_bytes, len(buffer.getvalue()))
+        self.assertEqual(report.images[0][1], max(stored for _, stored, _ in report.images))
+        with self.assertRaises(ValueError):
+            slide.add_picture(buffer.getvalue(), 1, 1, width=2, reencode="webp")
+
+
+class TestPyPPTXSave(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        slide = self.ppt.add_slide(layout_ref=5)
+        slide.set_title("Saved")
+        slide.add_table_from_dataframe(pd.DataFrame({'a': range(50)}), 1, 2, 4, 4)
+
+    def test_save_to_stream_with_compression(self):
+        reference = io.BytesIO()
+        self.ppt.presentation.save(reference)
+        default = self.ppt.to_bytes()
+        with zipfile.ZipFile(reference) as ref_zip, zipfile.ZipFile(io.BytesIO(default)) as new_zip:
+            self.assertEqual(ref_zip.namelist(), new_zip.namelist())
+            for name in ref_zip.namelist():
+                self.assertEqual(ref_zip.read(name), new_zip.read(name))
+
+        stored = io.BytesIO()
+        self.ppt.save(stored, compression="stored")
+        with zipfile.ZipFile(stored) as stored_zip:
+            self.assertEqual({info.compress_type for info in stored_zip.infolist()}, {zipfile.ZIP_STORED})
+        smallest = self.ppt.to_bytes(compresslevel=9)
+        self.assertLess(len(smallest), len(stored.getvalue()))
+        self.assertEqual(PyPPT(io.BytesIO(smallest)).slides[0].pptx_slide.shapes.title.text, "Saved")
+
+    def test_incremental_save(self):
+        for _ in range(3):
+            slide = self.ppt.add_slide(layout_ref=6)
+            slide.add_picture(_png_bytes(size=(64, 64), color=(len(self.ppt.slides), 0, 0)), 1, 1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original = os.path.join(tmpdir, "original.pptx")
+            self.ppt.save(original)
+            opened = PyPPT(original, use_template_cache=False)
+            opened.slides[0].set_title("Changed")
+            package = opened.presentation.part.package
+            with zipfile.ZipFile(original) as original_zip:
+                n_entries = len(original_zip.namelist())
+            # Only the changed slide is written anew.
+            self.assertEqual(write_package(package, io.BytesIO(), source=original), n_entries - 1)
+            self.assertEqual(write_package(package, io.BytesIO(), compresslevel=6, source=original), 0)
+
+            copy_path = os.path.join(tmpdir, "copy.pptx")
+            opened.save(copy_path)
+            opened.save(original)  # over the file it was opened from
+            for path in (copy_path, original):
+                with zipfile.ZipFile(path) as saved_zip:
+                    self.assertIsNone(saved_zip.testzip())
+                reopened = PyPPT(path, use_template_cache=False)
+                self.assertEqual(reopened.slides[0].pptx_slide.shapes.title.text, "Changed")
+                self.assertEqual(len(reopened.slides), 4)
+            self.assertEqual(os.listdir(tmpdir).count("original.pptx"), 1)
+            self.assertEqual(len(os.listdir(tmpdir)), 2)
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            self.ppt.to_bytes(compression="lzma")
+        with self.assertRaises(ValueError):
+            self.ppt.to_bytes(compresslevel=10)
+        with self.assertRaises(ValueError):
+            self.ppt.save(io.BytesIO(), compression="stored", compresslevel=1)
+
+
+class TestPyPPTXLazyOpen(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "deck.pptx")
+        ppt = PyPPT()
+        for i in range(4):
+            slide = ppt.add_slide(layout_ref=5)
+            slide.set_title(f"Slide {i}")
+            slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'y': [i, i + 1.0]}), 5, 2, 4, 3)
+            slide.pptx_slide.notes_slide.notes_text_frame.text = f"Notes {i}"
+        ppt.save(self.path)
+
+    def lazy_parts(self, ppt):
+        return [part for part in ppt.presentation.part.package.iter_parts() if hasattr(part, "is_parsed")]
+
+    def test_only_used_slides_are_parsed(self):
+        ppt = PyPPT(self.path, lazy=True)
+        self.assertEqual(len(self.lazy_parts(ppt)), 12)
+        self.assertEqual(len(ppt.slides), 4)
+        self.assertFalse(any(part.is_parsed for part in self.lazy_parts(ppt)))
+
+        ppt.slides[1].set_title("Edited")
+        self.assertEqual([part.partname for part in self.lazy_parts(ppt) if part.is_parsed], ["/ppt/slides/slide2.xml"])
+        self.assertEqual(ppt.get_slide(2).pptx_slide.shapes[1].chart.plots[0].series[0].values, (2.0, 3.0))
+
+        saved = io.BytesIO()
+        ppt.save(saved, incremental=False)
+        with zipfile.ZipFile(self.path) as source_zip, zipfile.ZipFile(saved) as saved_zip:
+            self.assertEqual(saved_zip.read("ppt/slides/slide4.xml"), source_zip.read("ppt/slides/slide4.xml"))
+            self.assertEqual(saved_zip.read("ppt/notesSlides/notesSlide2.xml"),
+                             source_zip.read("ppt/notesSlides/notesSlide2.xml"))
+        reopened = PyPPT(io.BytesIO(saved.getvalue()))
+        self.assertEqual([s.pptx_slide.shapes.title.text for s in reopened.slides],
+                         ["Slide 0", "Edited", "Slide 2", "Slide 3"])
+        self.assertEqual(reopened.slides[3].pptx_slide.notes_slide.notes_text_frame.text, "Notes 3")
+
+    def test_lazy_open_leaves_part_factory_alone(self):
+        registry = PartFactory.part_type_for
+        with mock.patch.object(PartFactory, "part_type_for", registry):
+            lazy = PyPPT(self.path, lazy=True)
+            self.assertIs(PartFactory.part_type_for, registry)
+        self.assertEqual(len(self.lazy_parts(lazy)), 12)
+        self.assertEqual(self.lazy_parts(PyPPT(self.path, use_template_cache=False)), [])
+        workbook = io.BytesIO()
+        openpyxl.Workbook().save(workbook)
+        with self.assertRaises(ValueError):
+            open_lazy(workbook)
+
+    def test_lazy_deck_supports_slide_management(self):
+        ppt = PyPPT(self.path, lazy=True)
+        ppt.delete_slide(0)
+        ppt.move_slide(2, 0)
+        ppt.duplicate_slide(0)
+        names = zipfile.ZipFile(io.BytesIO(ppt.to_bytes())).namelist()
+        self.assertEqual(len(names), len(set(names)))
+        reopened = PyPPT(io.BytesIO(ppt.to_bytes()))
+        self.assertEqual([s.pptx_slide.shapes.title.text for s in reopened.slides],
+                         ["Slide 3", "Slide 1", "Slide 2", "Slide 3"])
+
+
+class TestPyPPTXStreaming(unittest.TestCase):
+
+    def fill(self, slide, i):
+        slide.set_title(f"Slide {i}")
+        slide.add_table_from_dataframe(pd.DataFrame({'a': range(i + 1)}), 1, 2, 4, 3)
+        slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'y': [i, i + 1.0]}), 5, 2, 4, 3)
+        slide.add_picture(_png_bytes(), 1, 6)
+
+    def test_streamed_deck_matches_saved_deck(self):
+        import gc
+        import weakref
+        output = io.BytesIO()
+        slide_parts = []
+        with StreamingPPT(output) as deck:
+            for i in range(4):
+                slide = deck.add_slide(layout_ref=5)
+                self.fill(slide, i)
+                slide_parts.append(weakref.ref(slide.pptx_slide.part))
+            deck.finish_slide()
+            self.assertEqual(deck.slides_written, 4)
+        del slide
+        gc.collect()
+        self.assertEqual([ref() for ref in slide_parts], [None] * 4)
+
+        reference = PyPPT()
+        for i in range(4):
+            self.fill(reference.add_slide(layout_ref=5), i)
+        with zipfile.ZipFile(output) as streamed_zip, \
+                zipfile.ZipFile(io.BytesIO(reference.to_bytes())) as reference_zip:
+            self.assertEqual(sorted(streamed_zip.namelist()), sorted(reference_zip.namelist()))
+            for name in reference_zip.namelist():
+                if name != "[Content_Types].xml" and not name.startswith("ppt/embeddings/"):
+                    self.assertEqual(streamed_zip.read(name), reference_zip.read(name), name)
+
+        reopened = PyPPT(io.BytesIO(output.getvalue()))
+        self.assertEqual([s.pptx_slide.shapes.title.text for s in reopened.slides],
+                         [f"Slide {i}" for i in range(4)])
+        chart = reopened.slides[3].pptx_slide.shapes[2].chart
+        self.assertEqual(chart.plots[0].series[0].values, (3.0, 4.0))
+
+    def test_shared_parts_written_once(self):
+        import gc
+        output = io.BytesIO()
+        with StreamingPPT(output) as deck:
+            for i in range(3):
+                slide = deck.add_slide(layout_ref=5)
+                slide.add_picture(_png_bytes(), 1, 1)
+                slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'y': [1.0, 2.0]}), 5, 2, 4, 3,
+                                workbook_mode="shared")
+                del slide
+                gc.collect()
+        with zipfile.ZipFile(output) as streamed_zip:
+            names = streamed_zip.namelist()
+        self.assertEqual(sum(name.startswith("ppt/media/") for name in names), 1)
+        self.assertEqual(sum(name.startswith("ppt/embeddings/") for name in names), 1)
+        reopened = PyPPT(io.BytesIO(output.getvalue()))
+        self.assertEqual(len({s.pptx_slide.shapes[1].image.sha1 for s in reopened.slides}), 1)
+
+    def test_abort_and_closed_writer(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "partial.pptx")
+            with self.assertRaises(RuntimeError):
+                with StreamingPPT(path) as deck:
+                    deck.add_slide(layout_ref=5)
+                    deck.add_slide(layout_ref=5)
+                    raise RuntimeError("build failed")
+            self.assertFalse(os.path.exists(path))
+        with self.assertRaises(ValueError):
+            deck.add_slide(layout_ref=5)
+
+
+class TestPyPPTXTemplateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(template_cache.clear)
+        self.paths = []
+        for i in range(3):
+            template = PyPPT()
+            template.add_slide(layout_ref=5).set_title(f"Template {i}")
+            path = os.path.join(self.tmp.name, f"template_{i}.pptx")
+            template.save(path)
+            self.paths.append(path)
+
+    def test_pyppt_uses_cache_and_copies_are_independent(self):
+        template_cache.clear()
+        first = PyPPT(self.paths[0])
+        first.slides[0].set_title("Changed")
+        first.add_slide(layout_ref=5)
+        second = PyPPT(self.paths[0])
+        self.assertEqual(template_cache.info()["hits"], 1)
+        self.assertEqual(len(second.slides), 1)
+        self.assertEqual(second.slides[0].pptx_slide.shapes.title.text, "Template 0")
+        self.assertEqual(PyPPT(io.BytesIO(second.to_bytes())).slides[0].pptx_slide.shapes.title.text,
+                         "Template 0")
+        PyPPT(self.paths[0], use_template_cache=False)
+        self.assertEqual(template_cache.info()["hits"], 1)
+
+    def test_lru_bound_and_invalidation(self):
+        cache = TemplateCache(maxsize=2)
+        for path in self.paths:
+            cache.get(path)
+        self.assertEqual(len(cache), 2)
+        cache.get(self.paths[0])  # evicted, parsed again
+        self.assertEqual(cache.info()["misses"], 4)
+
+        updated = PyPPT()
+        updated.add_slide(layout_ref=5).set_title("Updated")
+        updated.add_slide(layout_ref=5)
+        updated.save(self.paths[0])
+        os.utime(self.paths[0], ns=(0, 10**18))
+        self.assertEqual(len(cache.get(self.paths[0]).slides), 2)
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(cache.info(), {"hits": 0, "misses": 0, "size": 0, "maxsize": 2})
+        with self.assertRaises(ValueError):
+            TemplateCache(maxsize=0)
+
+
+class TestPyPPTXMailMerge(unittest.TestCase):
+
+    def setUp(self):
+        ppt = PyPPT()
+        slide = ppt.add_slide(layout_ref=5)
+        slide.set_title("Report for {{name}}")
+        slide.add_table_from_dataframe(pd.DataFrame({'Client': ['{{name}}'], 'Total': ['{{ total }}']}),
+                                       1, 2, 4, 1)
+        slide.add_chart(XL_CHART_TYPE.PIE, {'categories': ['a'], 'series': [{'name': 's', 'values': [1]}]},
+                        5, 2, 3, 3, chart_title="{{name}} revenue")
+        # A token split over two runs, as PowerPoint often saves it
+        slide.add_text_box("", 1, 5, 4, 1)
+        paragraph = slide.pptx_slide.shapes[3].text_frame.paragraphs[0]
+        for text in ("Dear {{na", "me}}, thanks"):
+            paragraph.add_run().text = text
+        self.template_bytes = io.BytesIO()
+        ppt.save(self.template_bytes)
+
+    def method_api_render(self, values):
+        ppt = PyPPT(io.BytesIO(self.template_bytes.getvalue()))
+        for py_slide in ppt.slides:
+            for shape in py_slide.pptx_slide.shapes:
+                frames = []
+                if shape.has_text_frame:
+                    frames.append(shape.text_frame)
+                if shape.has_table:
+                    frames.extend(cell.text_frame for row in shape.table.rows for cell in row.cells)
+                if shape.has_chart:
+                    frames.append(shape.chart.chart_title.text_frame)
+                for frame in frames:
+                    for paragraph in frame.paragraphs:
+                        for run in paragraph.runs:
+                            for name, value in values.items():
+                                run.text = re.sub(r"\{\{\s*%s\s*\}\}" % re.escape(name), value, run.text)
+        return ppt
+
+    def part_xml(self, ppt):
+        slide = ppt.slides[0].pptx_slide
+        return [etree.tostring(slide._element), etree.tostring(slide.shapes[2].chart._chartSpace)]
+
+    def test_render_matches_method_api(self):
+        template = MergeTemplate(io.BytesIO(self.template_bytes.getvalue()))
+        self.assertEqual(template.tokens, {"name", "total"})
+
+        values = {"name": "Acme & Sons <EU>", "total": "1,234"}
+        merged = PyPPT(io.BytesIO(template.render(values)))
+        slide = merged.slides[0].pptx_slide
+        self.assertEqual(slide.shapes.title.text, "Report for Acme & Sons <EU>")
+        self.assertEqual(slide.shapes[3].text_frame.text, "Dear Acme & Sons <EU>, thanks")
+
+        reference = self.method_api_render(values)
+        # The split token is joined into its first run by the merge engine only.
+        reference.slides[0].pptx_slide.shapes[3].text_frame.paragraphs[0].runs[0].text = "Dear Acme & Sons <EU>"
+        reference.slides[0].pptx_slide.shapes[3].text_frame.paragraphs[0].runs[1].text = ", thanks"
+        self.assertEqual(self.part_xml(merged), self.part_xml(reference))
+
+    def test_render_missing_value(self):
+        template = MergeTemplate(io.BytesIO(self.template_bytes.getvalue()))
+        output = io.BytesIO()
+        with self.assertRaises(KeyError):
+            template.render({"name": "Acme"}, output)
+        self.assertEqual(output.getvalue(), b"")
+        lenient = PyPPT(io.BytesIO(template.render({"name": "Acme"}, strict=False)))
+        self.assertEqual(lenient.slides[0].pptx_slide.shapes[1].table.cell(1, 1).text, "{{ total }}")
+
+    def test_render_keeps_private_use_text(self):
+        ppt = PyPPT()
+        slide = ppt.add_slide(layout_ref=5)
+        slide.set_title("{{name}}")
+        # Icon-font glyphs outside any token, shaped like a slot marker around a slot number
+        slide.add_text_box("\ue0000\ue001 \ue001\ue000", 1, 5, 4, 1)
+        template_bytes = io.BytesIO()
+        ppt.save(template_bytes)
+
+        merged = PyPPT(io.BytesIO(MergeTemplate(template_bytes).render({"name": "Acme"})))
+        self.assertEqual(merged.slides[0].pptx_slide.shapes.title.text, "Acme")
+        self.assertEqual(merged.slides[0].pptx_slide.shapes[1].text_frame.text, "\ue0000\ue001 \ue001\ue000")
+
+    def test_render_leaves_template_entries_unchanged(self):
+        template = MergeTemplate(io.BytesIO(self.template_bytes.getvalue()))
+        def entry_state():
+            return [(info.header_offset, info.compress_size, info.CRC) for info, _ in template._entries]
+
+        before = entry_state()
+        first = template.render({"name": "Acme", "total": "1"})
+        self.assertEqual(entry_state(), before)
+        self.assertEqual(template.render({"name": "Acme", "total": "1"}), first)
+
+
+class TestPyPPTXBatch(unittest.TestCase):
+
+    def test_render_many_writes_decks_and_reports_failures(self):
+        template = PyPPT()
+        template.add_slide(layout_ref=5).set_title("Cover")
+        with tempfile.TemporaryDirectory() as tmp:
+            template_path = os.path.join(tmp, "template.pptx")
+            template.save(template_path)
+            output_dir = os.path.join(tmp, "decks")
+            payloads = (p for p in ["A", "fail", "B", "slow", "C"])
+
+            report = render_many(_build_batch_deck, payloads, output_dir, workers=2,
+                                 template_path=template_path, chunksize=2, timeout=1)
+
+            self.assertEqual(sorted(report.written), [0, 2, 4])
+            self.assertEqual([(f.index, f.timed_out) for f in report.failures], [(1, False), (3, True)])
+            self.assertIn("bad payload", report.failures[0].error)
+            self.assertFalse(report.ok)
+            self.assertEqual(sorted(os.listdir(output_dir)),
+                             ["deck_00000.pptx", "deck_00002.pptx", "deck_00004.pptx"])
+            deck = PyPPT(report.written[2])
+            self.assertEqual([s.pptx_slide.shapes.title.text for s in deck.slides], ["Cover", "B"])
+
+    def test_render_many_survives_worker_crash(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            payloads = ["A", "crash", "B", "C", "D", "E"]
+            report = render_many(_build_batch_deck, payloads, tmp, workers=1, chunksize=1)
+        failed = {f.index for f in report.failures}
+        self.assertIn(1, failed)
+        self.assertIn("BrokenProcessPool", report.failures[0].error)
+        self.assertEqual(failed | set(report.written), set(range(len(payloads))))
+        self.assertIn(5, report.written)
+
+    def test_render_many_rejects_zero_workers(self):
+        with tempfile.TemporaryDirectory() as tmp, self.assertRaises(ValueError):
+            render_many(_build_batch_deck, ["A"], tmp, workers=0)
+
+    def test_render_many_rejects_timeout_without_sigalrm(self):
+        no_alarm = mock.Mock(spec=[])  # a signal module without SIGALRM, as on Windows
+        with tempfile.TemporaryDirectory() as tmp, mock.patch("pypptx.batch.signal", no_alarm):
+            with self.assertRaises(ValueError):
+                render_many(_build_batch_deck, ["A"], tmp, timeout=1)
+            self.assertEqual(os.listdir(tmp), [])
+
+
+def _scan_or_crash(path, **options):
+    """Stand-in for scan() in scan_many workers that kills the worker on "crash" files."""
+    if "crash" in os.path.basename(path):
+        os._exit(1)
+    return _REAL_SCAN(path, **options)
+
+
+_REAL_SCAN = scan
+
+
+class TestPyPPTXScan(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        slide = self.ppt.add_slide(layout_ref=5)
+        slide.set_title("Results")
+        slide.add_text_box("First line\nSecond line", 1, 1, 4, 1)
+        slide.add_table_from_dataframe(pd.DataFrame({'x': [1, 2], 'y': ['u', 'v']}), 1, 2, 3, 1)
+        slide.add_chart(XL_CHART_TYPE.LINE, pd.DataFrame({'Sales': [1.5, 2.5]}, index=['Q1', 'Q2']),
+                        5, 2, 4, 3, chart_title="Trend")
+        self.ppt.add_slide(layout_ref=0).set_title("Cover")
+        self.ppt.move_slide(1, 0)
+
+    def test_scan_matches_object_model(self):
+        self.assertIs(pypptx.scan_deck, scan)
+        self.assertIs(pypptx.scan_many, scan_many)
+        cover, results = scan(io.BytesIO(self.ppt.to_bytes()))
+        self.assertEqual((cover.index, cover.title), (0, "Cover"))
+        self.assertEqual((results.index, results.title), (1, "Results"))
+        self.assertEqual(results.texts, ["Results", "First line", "Second line"])
+        pd.testing.assert_frame_equal(results.tables[0], pd.DataFrame({'x': ['1', '2'], 'y': ['u', 'v']}))
+        chart = results.charts[0]
+        self.assertEqual(chart.title, "Trend")
+        series = chart.series[0]
+        self.assertEqual((series.name, series.chart_type), ("Sales", "lineChart"))
+        self.assertEqual((series.categories, series.values), (['Q1', 'Q2'], [1.5, 2.5]))
+
+        _, results = scan(io.BytesIO(self.ppt.to_bytes()), tables=False, charts=False)
+        self.assertEqual((results.tables, results.charts), ([], []))
+
+    def test_scan_many_reports_unreadable_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "sub"))
+            self.ppt.save(os.path.join(tmp, "a.pptx"))
+            self.ppt.save(os.path.join(tmp, "sub", "b.pptx"))
+            with open(os.path.join(tmp, "broken.pptx"), "wb") as f:
+                f.write(b"not a zip")
+            with open(os.path.join(tmp, "~$a.pptx"), "wb") as f:
+                f.write(b"lock file")
+            results = {os.path.basename(r.path): r for r in scan_many(tmp, workers=2, chunksize=1)}
+        self.assertEqual(sorted(results), ["a.pptx", "b.pptx", "broken.pptx"])
+        self.assertEqual([s.title for s in results["b.pptx"].slides], ["Cover", "Results"])
+        self.assertFalse(results["broken.pptx"].ok)
+        self.assertIn("BadZipFile", results["broken.pptx"].error)
+
+    def test_scan_many_survives_worker_crash(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            names = ["a.pptx", "b_crash.pptx", "c.pptx", "d.pptx", "e.pptx", "f.pptx"]
+            for name in names:
+                self.ppt.save(os.path.join(tmp, name))
+            # Workers are forked from this process, so they see the patched function.
+            with mock.patch.object(sys.modules["pypptx.scan"], "scan", _scan_or_crash):
+                results = {os.path.basename(r.path): r for r in scan_many(tmp, workers=1, chunksize=1)}
+        self.assertEqual(sorted(results), names)
+        self.assertIn("BrokenProcessPool", results["b_crash.pptx"].error)
+        self.assertTrue(results["f.pptx"].ok)
+        with self.assertRaises(ValueError):
+            list(scan_many(tmp, workers=0))
+
+
+def _memo_slide(slide, data):
+    """Builder for the SlideMemo tests: title, table, chart, picture and notes."""
+    slide.set_title(data["title"])
+    slide.add_table_from_dataframe(data["frame"], 0.5, 1.5, 4, 3)
+    slide.add_chart(XL_CHART_TYPE.LINE, data["frame"][["a"]], 5, 1.5, 4, 3, chart_title="Trend")
+    slide.add_picture(_png_bytes(), 0.2, 0.2)
+    slide.pptx_slide.notes_slide.notes_text_frame.text = "Notes " + data["title"]
+
+
+class TestPyPPTXSlideMemo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.data = {"title": "Week 1", "frame": pd.DataFrame({'a': [1.5, 2.5], 'b': [3, 4]})}
+
+    def _deck(self, memo, datas):
+        ppt = PyPPT()
+        for data in datas:
+            memo.add_slide(ppt, _memo_slide, data, layout_ref=5)
+        return PyPPT(io.BytesIO(ppt.to_bytes()))
+
+    def test_hit_reproduces_built_slide(self):
+        other = {"title": "Week 2", "frame": self.data["frame"]}
+        built = self._deck(SlideMemo(self.tmp.name), [self.data, other])
+        memo = SlideMemo(self.tmp.name)
+        replayed = self._deck(memo, [self.data, other, self.data])
+        self.assertEqual(memo.info()["hits"], 3)
+        self.assertEqual(memo.hit_rate, 1.0)
+        for expected, actual in zip(built.slides, replayed.slides):
+            expected, actual = expected.pptx_slide, actual.pptx_slide
+            self.assertEqual([s.shape_type for s in expected.shapes], [s.shape_type for s in actual.shapes])
+            self.assertEqual(expected.shapes.title.text, actual.shapes.title.text)
+            self.assertEqual(actual.notes_slide.notes_text_frame.text, "Notes " + actual.shapes.title.text)
+            self.assertEqual(list(actual.shapes[2].chart.plots[0].series[0].values), [1.5, 2.5])
+        names = zipfile.ZipFile(io.BytesIO(replayed.to_bytes())).namelist()
+        self.assertEqual(len([n for n in names if n.startswith("ppt/media/")]), 1)
+        self.assertEqual(len([n for n in names if n.startswith("ppt/charts/chart")]), 3)
+
+    def test_changed_data_or_version_misses(self):
+        memo = SlideMemo(self.tmp.name)
+        changed = {"title": "Week 1", "frame": self.data["frame"].assign(b=[3, 5])}
+        self._deck(memo, [self.data, changed, self.data])
+        memo.add_slide(PyPPT(), _memo_slide, self.data, layout_ref=5, version=2)
+        self.assertEqual((memo.hits, memo.misses), (1, 3))
+        self.assertNotEqual(data_fingerprint(self.data), data_fingerprint(changed))
+        with self.assertRaises(TypeError):
+            data_fingerprint({"frame": object()})
+
+    def test_builder_closure_defaults_and_partial_are_keyed(self):
+        def titled(title):
+            def build(slide, data):
+                slide.set_title(title)
+            return build
+
+        def with_default(slide, data, title="First"):
+            slide.set_title(title)
+
+        memo = SlideMemo(self.tmp.name)
+        ppt = PyPPT()
+        memo.add_slide(ppt, titled("North"), self.data, layout_ref=5)
+        memo.add_slide(ppt, titled("South"), self.data, layout_ref=5)
+        memo.add_slide(ppt, functools.partial(with_default, title="A"), self.data, layout_ref=5)
+        memo.add_slide(ppt, functools.partial(with_default, title="B"), self.data, layout_ref=5)
+        self.assertEqual((memo.hits, memo.misses), (0, 4))
+        self.assertEqual([s.pptx_slide.shapes.title.text for s in ppt.slides], ["North", "South", "A", "B"])
+
+        with_default.__defaults__ = ("Second",)
+        memo.add_slide(ppt, with_default, self.data, layout_ref=5)
+        memo.add_slide(ppt, titled("North"), self.data, layout_ref=5)
+        self.assertEqual((memo.hits, memo.misses), (1, 5))
+        self.assertEqual(ppt.slides[4].pptx_slide.shapes.title.text, "Second")
+        with self.assertRaises(TypeError):
+            memo.add_slide(ppt, titled(object()), self.data, layout_ref=5)
+
+    def test_same_named_layout_of_other_template_misses(self):
+        memo = SlideMemo(self.tmp.name)
+        self._deck(memo, [self.data])
+        other = PyPPT()
+        layout = other.get_layout(5)
+        layout.placeholders[0].top = Inches(3)
+        memo.add_slide(other, _memo_slide, self.data, layout_ref=layout.name)
+        self.assertEqual((memo.hits, memo.misses), (0, 2))
+        self.assertEqual(other.slides[0].pptx_slide.shapes.title.text, "Week 1")
+
+    def test_eviction_keeps_cache_under_max_bytes(self):
+        memo = SlideMemo(self.tmp.name)
+        self._deck(memo, [self.data])
+        entry_size = memo.info()["bytes"]
+        memo = SlideMemo(self.tmp.name, max_bytes=int(entry_size * 2.5))
+        self._deck(memo, [{"title": f"Week {i}", "frame": self.data["frame"]} for i in range(2, 6)])
+        info = memo.info()
+        self.assertEqual(info["entries"], 2)
+        self.assertLessEqual(info["bytes"], info["max_bytes"])
+
+    def test_corrupt_entry_is_rebuilt(self):
+        memo = SlideMemo(self.tmp.name)
+        self._deck(memo, [self.data])
+        (path,) = [os.path.join(self.tmp.name, n) for n in os.listdir(self.tmp.name)]
+        with open(path, "wb") as f:
+            f.write(b"garbage")
+        deck = self._deck(memo, [self.data])
+        self.assertEqual((memo.hits, memo.misses), (0, 2))
+        self.assertEqual(deck.slides[0].pptx_slide.shapes.title.text, "Week 1")
+
+
+class TestPyPPTXShapeStamp(unittest.TestCase):
+
+    def setUp(self):
+        self.ppt = PyPPT()
+        self.slide = self.ppt.add_slide(layout_ref=6)
+        self.stamp = ShapeStamp(MSO_SHAPE.ROUNDED_RECTANGLE, width=2, height=0.5, fill=(255, 242, 204),
+                                line=(191, 144, 0), line_weight=1, font_name="Arial", font_size=10,
+                                bold=True, font_color=(0, 0, 0))
+
+    def test_stamp_matches_object_api(self):
+        other = PyPPT().add_slide(layout_ref=6)
+        shape = other.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, 1, 1.5, 2, 0.5)
+        other.set_shape_fill_color(shape, 255, 242, 204)
+        other.set_shape_line_color(shape, 191, 144, 0)
+        other.set_shape_line_weight(shape, 1)
+        shape.text_frame.text = "A & <B>\nSecond"
+        for paragraph in shape.text_frame.paragraphs:
+            paragraph.font.name = "Arial"
+            paragraph.font.size = Pt(10)
+            paragraph.font.bold = True
+            paragraph.font.color.rgb = RGBColor(0, 0, 0)
+        stamped = self.stamp.stamp(self.slide, "A & <B>\nSecond", 1, 1.5)
+        self.assertEqual(etree.tostring(stamped._element), etree.tostring(shape._element))
+
+        box = other.add_text_box("x\ny", 1, 1, 3, 1)
+        stamped_box = ShapeStamp().stamp(self.slide, ["x", "y"], 1, 1, 3, 1)
+        self.assertEqual(etree.tostring(stamped_box._element), etree.tostring(box._element))
+
+    def test_stamp_many_numbers_shapes_and_fills_slots(self):
+        self.slide.pptx_slide.shapes.turbo_add_enabled = True
+        shapes = self.stamp.stamp_many(self.slide, [
+            {"text": "North", "left": 1, "top": 1},
+            {"text": "South", "left": 1, "top": 2, "width": 3, "fill": (255, 0, 0), "name": 'Box "S"'},
+        ])
+        self.slide.add_text_box("after", 0, 0, 1, 1)
+        ids = [shape.shape_id for shape in self.slide.pptx_slide.shapes]
+        self.assertEqual(len(ids), len(set(ids)))
+        north, south = shapes
+        self.assertEqual((north.name, north.text_frame.text), ("Rounded Rectangle 1", "North"))
+        self.assertEqual((south.width, south.top), (Inches(3), Inches(2)))
+        self.assertEqual(south.fill.fore_color.rgb, RGBColor(255, 0, 0))
+        self.assertEqual(north.fill.fore_color.rgb, RGBColor(255, 242, 204))
+        self.assertIs(self.slide._get_shape('Box "S"')._element, south._element)
+
+        reopened = PyPPT(io.BytesIO(self.ppt.to_bytes())).slides[0].pptx_slide
+        self.assertEqual([s.text_frame.text for s in reopened.shapes], ["North", "South", "after"])
+
+    def test_invalid_stamps(self):
+        with self.assertRaises(ValueError):
+            ShapeStamp().stamp(self.slide, "no size", 1, 1)
+        with self.assertRaises(ValueError):
+            ShapeStamp(width=1, height=1).stamp(self.slide, "no fill slot", 1, 1, fill=(0, 0, 0))
+        self.assertEqual(len(self.slide.pptx_slide.shapes), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,10 @@
 import unittest
+import contextlib
+import io
+import subprocess
+import sys
+import tempfile
+import zipfile
 import pandas as pd
 from pyxlsx import PyWorkbook, CHART_TYPE_BAR, CHART_TYPE_COLUMN, CHART_TYPE_LINE, CHART_TYPE_PIE
 import os
@@ -290,5 +296,43 @@ class TestPyXLSX(unittest.TestCase):
         if os.path.exists(wb_path):
             os.remove(wb_path)
 
+    def test_save_to_stream_and_bytes(self):
+        wb = PyWorkbook()
+        ws = wb.add_worksheet(title="Data")
+        ws.write_dataframe(pd.DataFrame({'col1': range(200)}), start_row=1, start_col=1, header=True)
+
+        stream = io.BytesIO()
+        wb.save(stream, compression="stored")
+        with zipfile.ZipFile(stream) as saved_zip:
+            self.assertEqual({info.compress_type for info in saved_zip.infolist()}, {zipfile.ZIP_STORED})
+        smallest = wb.to_bytes(compression="deflate", compresslevel=9)
+        self.assertLess(len(smallest), len(stream.getvalue()))
+        self.assertEqual(load_workbook(io.BytesIO(smallest))["Data"]["A201"].value, 199)
+
+        with self.assertRaises(ValueError):
+            wb.to_bytes(compression="bzip2")
+        with self.assertRaises(ValueError):
+            wb.save(io.BytesIO(), compression="stored", compresslevel=1)
+
+    def test_save_keeps_path_and_is_quiet(self):
+        wb = PyWorkbook()
+        wb.add_worksheet(title="Data")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.tmp")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                wb.save(path)
+            self.assertEqual(os.listdir(tmp), ["report.tmp"])
+            with open(path, "rb") as saved:
+                self.assertEqual(load_workbook(saved).sheetnames[-1], "Data")
+        self.assertEqual(output.getvalue(), "")
+
+    def test_import_does_not_load_pypptx(self):
+        code = "import sys, pyxlsx; print(sorted(m for m in sys.modules if m.split('.')[0] in ('pypptx', 'pptx')))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
 if __name__ == '__main__':
     unittest.main()